@@ -1,4 +1,34 @@
+from collections import OrderedDict
+from optional_numpy import getting_numpy, is_a_numpy_array
+
+#A SearchIndex builds its hash index once the list has been searched this many times (1 builds it on the first search). Before that,
+#every search is a Linear Search, whose answer is remembered in the memo
+index_query_threshold = 1
+
+#How many answers the memo of a SearchIndex keeps (the least recently used answer is forgotten first)
+memo_size = 1024
+
+#How many elements, evenly spread over the list, go into the fingerprint that every search checks to see if the list has changed
+fingerprint_samples = 16
+
+
+def numpy_linear_search(numbers_array, number_to_find):
+    np = getting_numpy()
+
+    #One vectorized comparison over the whole array, then 'argmax' finds the first True
+    if len(numbers_array) == 0:
+        return -1
+
+    matches = numbers_array == number_to_find
+    index = int(np.argmax(matches))
+
+    return index if matches[index] else -1
+
+
 def linear_search(numbers_list, number_to_find):
+    if is_a_numpy_array(numbers_list):
+        return numpy_linear_search(numbers_list, number_to_find)
+
     for index, element in enumerate(numbers_list):
         if element == number_to_find:
             return index
@@ -6,8 +36,98 @@ def linear_search(numbers_list, number_to_find):
     return -1
 
 
+class SearchIndex:
+
+    #An opt-in index for searching the same unsorted list many times. Every Linear Search goes through the whole list again, so n
+    #searches cost O(n^2). A SearchIndex instead builds a hash map from every value to the index of its first occurrence in one pass,
+    #after 'build_after_queries' searches, and then answers every search in O(1) time. Until then, and whenever 'build_after_queries' is
+    #None (never build the index), answers found by a Linear Search are kept in a memo of the 'memo_size' most recently used values
+    #(for workloads that keep searching for the same few hot values)
+
+    #Before every search, the list's fingerprint (its length and 'fingerprint_samples' elements spread evenly over it) is compared with
+    #the fingerprint the index and the memo were made from, and both are thrown away if it changed. This is O(1) and catches appends,
+    #deletes and most replacements, but not a change to an element that is not sampled, so 'invalidate' should be called after those
+    def __init__(self, numbers_list, build_after_queries=index_query_threshold, memo_size=memo_size):
+        self.numbers_list = numbers_list
+        self.build_after_queries = build_after_queries
+        self.memo_size = memo_size
+
+        self.index = None
+        self.memo = OrderedDict()
+        self.fingerprint = self.fingerprinting_the_list()
+        self.queries_since_the_last_change = 0
+
+        #Counters for instrumentation: searches answered from the index or the memo, searches that needed a Linear Search, how many
+        #times the index was built, and how many times the index and the memo were thrown away because the list changed
+        self.hits = 0
+        self.misses = 0
+        self.rebuilds = 0
+        self.invalidations = 0
+
+    def fingerprinting_the_list(self):
+        size = len(self.numbers_list)
+        step = max(1, size // fingerprint_samples)
+        return (size, tuple(self.numbers_list[i] for i in range(0, size, step)), self.numbers_list[-1] if size else None)
+
+    def invalidate(self):
+
+        #Throws away the index and the memo, e.g. after changing an element of the list in place
+        self.index = None
+        self.memo.clear()
+        self.fingerprint = self.fingerprinting_the_list()
+        self.queries_since_the_last_change = 0
+        self.invalidations += 1
+
+    def building_the_index(self):
+
+        #One pass over the list. Going through it backwards means that for a repeated value, the index of its first occurrence is the
+        #last one written, and the whole pass runs in C
+        self.index = dict(zip(reversed(self.numbers_list), range(len(self.numbers_list) - 1, -1, -1)))
+        self.memo.clear()
+        self.rebuilds += 1
+
+    def find(self, number_to_find):
+
+        #Index of the first element equal to 'number_to_find', or -1 if there is none (the same answer as the Linear Search Algorithm)
+        if self.fingerprinting_the_list() != self.fingerprint:
+            self.invalidate()
+
+        self.queries_since_the_last_change += 1
+
+        if self.index is not None:
+            self.hits += 1
+            return self.index.get(number_to_find, -1)
+
+        if number_to_find in self.memo:
+            self.hits += 1
+            self.memo.move_to_end(number_to_find)
+            return self.memo[number_to_find]
+
+        self.misses += 1
+
+        if self.build_after_queries is not None and self.queries_since_the_last_change >= self.build_after_queries:
+            self.building_the_index()
+            return self.index.get(number_to_find, -1)
+
+        index = linear_search(self.numbers_list, number_to_find)
+        self.memo[number_to_find] = index
+        if len(self.memo) > self.memo_size:
+            self.memo.popitem(last=False)
+        return index
+
+    def statistics(self):
+        return {'hits': self.hits, 'misses': self.misses, 'rebuilds': self.rebuilds, 'invalidations': self.invalidations}
+
+
 if __name__ == '__main__':
     nums_list = [4, 9, 11, 17, 21, 25, 29, 32, 38]
     num_to_find = 32
     index = linear_search(nums_list, num_to_find)
     print(f"Number found at index {index} using Linear Search")
+
+    search_index = SearchIndex(nums_list, build_after_queries=3)
+    for num_to_find in [32, 32, 4, 38]:
+        index = search_index.find(num_to_find)
+    nums_list.append(41)
+    index = search_index.find(41)
+    print(f"Number found at index {index} using the Search Index, {search_index.statistics()}")
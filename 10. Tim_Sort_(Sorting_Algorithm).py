@@ -0,0 +1,200 @@
+import bisect
+from import_algorithm_file import import_algorithm_file
+
+merge_two_smaller_sorted_lists_to_a_merged_sorted_list = import_algorithm_file('8. Merge_Sort_(Sorting_Algorithm).py').merge_two_smaller_sorted_lists_to_a_merged_sorted_list
+binary_insertion_sort = import_algorithm_file('6. Insertion_Sort_(Sorting_Algorithm).py').binary_insertion_sort
+
+#How many elements in a row one run has to win during a merge before the merge switches to galloping mode
+minimum_gallop = 7
+
+
+def computing_the_minimum_run_length(size):
+
+    #Picks a minimum run length between 32 and 64 such that size / minimum run length is a power of 2 (or slightly less than one),
+    #so the final merges are balanced
+    remainder = 0
+    while size >= 64:
+        remainder |= size & 1
+        size >>= 1
+
+    return size + remainder
+
+
+def counting_a_run_and_making_it_ascending(number_list, start_index_of_run, end_index_of_list):
+
+    end_index_of_run = start_index_of_run + 1
+    if end_index_of_run == end_index_of_list:
+        return 1
+
+    if number_list[end_index_of_run] < number_list[start_index_of_run]:
+        #Only strictly descending runs are reversed, so equal elements never swap places and the sort stays stable
+        while end_index_of_run + 1 < end_index_of_list and number_list[end_index_of_run + 1] < number_list[end_index_of_run]:
+            end_index_of_run += 1
+
+        number_list[start_index_of_run:end_index_of_run + 1] = number_list[start_index_of_run:end_index_of_run + 1][::-1]
+
+    else:
+        while end_index_of_run + 1 < end_index_of_list and number_list[end_index_of_run + 1] >= number_list[end_index_of_run]:
+            end_index_of_run += 1
+
+    return end_index_of_run + 1 - start_index_of_run
+
+
+def galloping_search(number_list, key, start_index, end_index, rightmost):
+
+    #Finds the first position in number_list[start_index:end_index] whose element goes after 'key' (after all elements equal to 'key'
+    #if 'rightmost' is True, before them otherwise). It checks positions start_index + 1, + 3, + 7, ... first and only then does a
+    #binary search within the last gap, so it only needs O(log k) comparisons when the answer is k positions away
+    if rightmost:
+        goes_before_key = lambda element: element <= key
+    else:
+        goes_before_key = lambda element: element < key
+
+    if start_index >= end_index or not goes_before_key(number_list[start_index]):
+        return start_index
+
+    last_offset = 0
+    offset = 1
+    while start_index + offset < end_index and goes_before_key(number_list[start_index + offset]):
+        last_offset = offset
+        offset = offset * 2 + 1
+
+    if rightmost:
+        return bisect.bisect_right(number_list, key, start_index + last_offset + 1, min(start_index + offset, end_index))
+    return bisect.bisect_left(number_list, key, start_index + last_offset + 1, min(start_index + offset, end_index))
+
+
+def merging_two_runs_with_galloping(number_list, start_index_of_run_a, start_index_of_run_b, end_index_of_run_b, current_minimum_gallop):
+
+    #Elements at the start of run a that are not larger than the first element of run b, and elements at the end of run b that are
+    #not smaller than the last element of run a, are already where they belong
+    start_index_of_run_a = galloping_search(number_list, number_list[start_index_of_run_b], start_index_of_run_a, start_index_of_run_b, True)
+    if start_index_of_run_a == start_index_of_run_b:
+        return current_minimum_gallop
+
+    end_index_of_run_b = bisect.bisect_left(number_list, number_list[start_index_of_run_b - 1], start_index_of_run_b, end_index_of_run_b)
+
+    run_a = number_list[start_index_of_run_a:start_index_of_run_b]
+
+    #Galloping can't pay off when one of the runs is this short, so the plain merge from the Merge Sort Algorithm is used
+    if len(run_a) < minimum_gallop or end_index_of_run_b - start_index_of_run_b < minimum_gallop:
+        run_b = number_list[start_index_of_run_b:end_index_of_run_b]
+        merge_two_smaller_sorted_lists_to_a_merged_sorted_list(run_a, run_b, number_list, start_index_of_run_a)
+        return current_minimum_gallop
+
+    #Run a is copied out, while run b is read in place (the merged elements never overtake the unread elements of run b)
+    i = 0
+    j = start_index_of_run_b
+    k = start_index_of_run_a
+
+    while i < len(run_a) and j < end_index_of_run_b:
+
+        #~~~(One element at a time, until one run wins 'current_minimum_gallop' times in a row)~~~
+        wins_of_run_a = wins_of_run_b = 0
+        while i < len(run_a) and j < end_index_of_run_b:
+            if number_list[j] < run_a[i]:
+                number_list[k] = number_list[j]
+                j += 1
+                wins_of_run_b += 1
+                wins_of_run_a = 0
+            else:
+                number_list[k] = run_a[i]
+                i += 1
+                wins_of_run_a += 1
+                wins_of_run_b = 0
+            k += 1
+
+            if wins_of_run_a >= current_minimum_gallop or wins_of_run_b >= current_minimum_gallop:
+                break
+
+        #~~~(Galloping mode, copying whole blocks at once for as long as the blocks stay long)~~~
+        while i < len(run_a) and j < end_index_of_run_b:
+            end_of_block_of_run_a = galloping_search(run_a, number_list[j], i, len(run_a), True)
+            wins_of_run_a = end_of_block_of_run_a - i
+            number_list[k:k + wins_of_run_a] = run_a[i:end_of_block_of_run_a]
+            k += wins_of_run_a
+            i = end_of_block_of_run_a
+            if i == len(run_a):
+                break
+
+            end_of_block_of_run_b = galloping_search(number_list, run_a[i], j, end_index_of_run_b, False)
+            wins_of_run_b = end_of_block_of_run_b - j
+            number_list[k:k + wins_of_run_b] = number_list[j:end_of_block_of_run_b]
+            k += wins_of_run_b
+            j = end_of_block_of_run_b
+            if j == end_index_of_run_b:
+                break
+
+            #Galloping is made easier to enter again while it keeps paying off, and harder once it stops paying off
+            if wins_of_run_a < minimum_gallop and wins_of_run_b < minimum_gallop:
+                current_minimum_gallop += 1
+                break
+            current_minimum_gallop = max(1, current_minimum_gallop - 1)
+
+    #Whatever is left of run b is already in place, whatever is left of run a goes right before it
+    number_list[k:k + len(run_a) - i] = run_a[i:]
+
+    return current_minimum_gallop
+
+
+def merging_the_runs_on_the_run_stack(number_list, run_stack, current_minimum_gallop, merge_all_runs=False):
+
+    #Each run on the stack is (start index, length). Runs are merged until the stack lengths shrink faster than the Fibonacci numbers
+    #from the top down, which keeps the merges balanced and the stack O(log n) long
+    while len(run_stack) > 1:
+        n = len(run_stack) - 2
+
+        if merge_all_runs:
+            if n > 0 and run_stack[n - 1][1] < run_stack[n + 1][1]:
+                n -= 1
+        elif (n > 0 and run_stack[n - 1][1] <= run_stack[n][1] + run_stack[n + 1][1]) or \
+             (n > 1 and run_stack[n - 2][1] <= run_stack[n - 1][1] + run_stack[n][1]):
+            if run_stack[n - 1][1] < run_stack[n + 1][1]:
+                n -= 1
+        elif run_stack[n][1] > run_stack[n + 1][1]:
+            break
+
+        start_index_of_run_a, length_of_run_a = run_stack[n]
+        start_index_of_run_b, length_of_run_b = run_stack[n + 1]
+        current_minimum_gallop = merging_two_runs_with_galloping(number_list, start_index_of_run_a, start_index_of_run_b,
+                                                                 start_index_of_run_b + length_of_run_b, current_minimum_gallop)
+        run_stack[n] = (start_index_of_run_a, length_of_run_a + length_of_run_b)
+        del run_stack[n + 1]
+
+    return current_minimum_gallop
+
+
+def tim_sort(number_list):
+
+    size = len(number_list)
+
+    if size <= 1:
+        return number_list
+
+    minimum_run_length = computing_the_minimum_run_length(size)
+    run_stack = []
+    current_minimum_gallop = minimum_gallop
+    start_index_of_run = 0
+
+    while start_index_of_run < size:
+        run_length = counting_a_run_and_making_it_ascending(number_list, start_index_of_run, size)
+
+        #Short runs are extended to the minimum run length with Binary Insertion Sort
+        if run_length < minimum_run_length:
+            extended_run_length = min(minimum_run_length, size - start_index_of_run)
+            binary_insertion_sort(number_list, start_index_of_run, start_index_of_run + extended_run_length - 1, run_length)
+            run_length = extended_run_length
+
+        run_stack.append((start_index_of_run, run_length))
+        current_minimum_gallop = merging_the_runs_on_the_run_stack(number_list, run_stack, current_minimum_gallop)
+        start_index_of_run += run_length
+
+    merging_the_runs_on_the_run_stack(number_list, run_stack, current_minimum_gallop, merge_all_runs=True)
+
+    return number_list
+
+
+if __name__ == '__main__':
+    nums_list = [21, 38, 29, 17, 4, 25, 32, 9]
+    tim_sort(nums_list)
+    print(nums_list)
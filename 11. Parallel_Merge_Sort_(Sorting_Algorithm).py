@@ -0,0 +1,103 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from import_algorithm_file import import_algorithm_file
+
+merge_sort_module = import_algorithm_file('8. Merge_Sort_(Sorting_Algorithm).py')
+merge_two_smaller_sorted_lists_to_a_merged_sorted_list = merge_sort_module.merge_two_smaller_sorted_lists_to_a_merged_sorted_list
+bottom_up_merge_sort = merge_sort_module.bottom_up_merge_sort
+
+#Lists shorter than this are not worth starting worker processes for, and are sorted in this process instead
+minimum_size_for_parallel_sorting = 10000
+
+
+def sorting_a_chunk(chunk):
+    bottom_up_merge_sort(chunk)
+    return chunk
+
+
+def sorting_a_chunk_in_shared_memory(shared_memory_name, typecode, start_index_of_chunk, end_index_of_chunk):
+
+    #The chunk is read from and written back to the shared memory block, so only its name and bounds are pickled
+    shared_memory_block = shared_memory.SharedMemory(name=shared_memory_name)
+    try:
+        #The cast view is released by the 'with' block before the block is closed, even if the sort raises (closing a block with a view
+        #still open raises BufferError, which would hide the real exception)
+        with shared_memory_block.buf.cast(typecode) as shared_array:
+            chunk = shared_array[start_index_of_chunk:end_index_of_chunk].tolist()
+            bottom_up_merge_sort(chunk)
+            shared_array[start_index_of_chunk:end_index_of_chunk] = array(typecode, chunk)
+    finally:
+        shared_memory_block.close()
+
+
+def merging_sorted_chunks(sorted_chunks):
+
+    #k-way merge as a tournament of 2-way merges: every round halves the number of chunks, so every element is merged O(log k) times
+    while len(sorted_chunks) > 1:
+        merged_chunks = []
+
+        for i in range(0, len(sorted_chunks) - 1, 2):
+            merged_chunk = [None] * (len(sorted_chunks[i]) + len(sorted_chunks[i + 1]))
+            merge_two_smaller_sorted_lists_to_a_merged_sorted_list(sorted_chunks[i], sorted_chunks[i + 1], merged_chunk)
+            merged_chunks.append(merged_chunk)
+
+        if len(sorted_chunks) % 2 == 1:
+            merged_chunks.append(sorted_chunks[-1])
+
+        sorted_chunks = merged_chunks
+
+    return sorted_chunks[0] if sorted_chunks else []
+
+
+def parallel_merge_sort(array_to_sort, number_of_workers=None, chunk_size=None, use_shared_memory=False, typecode='q'):
+
+    #'use_shared_memory' copies the list once into a shared memory block of 'typecode' elements (e.g. 'q' for 64-bit integers, 'd' for
+    #floats) that every worker sorts its chunk of in place, instead of pickling every chunk to the workers and back
+    size = len(array_to_sort)
+
+    if number_of_workers is None:
+        number_of_workers = os.cpu_count() or 1
+
+    if chunk_size is None:
+        chunk_size = -(-size // number_of_workers)
+
+    if size < minimum_size_for_parallel_sorting or number_of_workers == 1 or chunk_size >= size:
+        return bottom_up_merge_sort(array_to_sort)
+
+    chunk_bounds = [(start_index_of_chunk, min(start_index_of_chunk + chunk_size, size)) for start_index_of_chunk in range(0, size, chunk_size)]
+
+    #Worker processes load this file through 'import_algorithm_file' first, so they can find the functions they are sent to run
+    with ProcessPoolExecutor(max_workers=number_of_workers, initializer=import_algorithm_file,
+                             initargs=('11. Parallel_Merge_Sort_(Sorting_Algorithm).py',)) as executor:
+
+        if not use_shared_memory:
+            sorted_chunks = list(executor.map(sorting_a_chunk, [array_to_sort[start_index_of_chunk:end_index_of_chunk]
+                                                                for start_index_of_chunk, end_index_of_chunk in chunk_bounds]))
+
+        else:
+            shared_memory_block = shared_memory.SharedMemory(create=True, size=size * array(typecode).itemsize)
+            try:
+                with shared_memory_block.buf.cast(typecode) as shared_array:
+                    shared_array[:] = array(typecode, array_to_sort)
+
+                    futures = [executor.submit(sorting_a_chunk_in_shared_memory, shared_memory_block.name, typecode, start_index_of_chunk, end_index_of_chunk)
+                               for start_index_of_chunk, end_index_of_chunk in chunk_bounds]
+                    for future in futures:
+                        future.result()
+
+                    sorted_chunks = [shared_array[start_index_of_chunk:end_index_of_chunk].tolist() for start_index_of_chunk, end_index_of_chunk in chunk_bounds]
+            finally:
+                shared_memory_block.close()
+                shared_memory_block.unlink()
+
+    array_to_sort[:] = merging_sorted_chunks(sorted_chunks)
+
+    return array_to_sort
+
+
+if __name__ == '__main__':
+    nums_list = [21, 38, 29, 17, 4, 25, 32, 9]
+    parallel_merge_sort(nums_list)
+    print(nums_list)
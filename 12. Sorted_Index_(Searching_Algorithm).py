@@ -0,0 +1,85 @@
+from array import array
+
+
+class SortedIndex:
+
+    #A read-only index over a sorted list of numbers, built once and then searched many times. The keys are stored in a compact typed
+    #array in Eytzinger (breadth-first) order: the root of the implicit binary search tree at position 1, and the children of position k
+    #at positions 2k and 2k + 1. The first few levels of the tree, which every search goes through, then sit next to each other in memory
+    #instead of being spread all over the list like the middle elements of a plain Binary Search
+
+    def __init__(self, sorted_list, typecode='q'):
+        self.size = len(sorted_list)
+
+        #Position 0 is unused, so the tree can start at position 1
+        self.eytzinger_keys = array(typecode, bytes(array(typecode).itemsize * (self.size + 1)))
+        self.sorted_positions = array('q', bytes(8 * (self.size + 1)))
+
+        #An in-order walk over the tree visits its positions in sorted order, so it is filled with the sorted keys one by one
+        i = 0
+        k = 1
+        stack = []
+        while stack or k <= self.size:
+            while k <= self.size:
+                stack.append(k)
+                k = 2 * k
+
+            k = stack.pop()
+            self.eytzinger_keys[k] = sorted_list[i]
+            self.sorted_positions[k] = i
+            i += 1
+            k = 2 * k + 1
+
+    def __len__(self):
+        return self.size
+
+    def eytzinger_position_of_the_first_key_going_after(self, key, including_equal_keys):
+
+        eytzinger_keys = self.eytzinger_keys
+        size = self.size
+
+        #Walks down the tree, going right whenever the key at k goes before 'key'. The answer is the last node where the walk went left,
+        #found by stripping the trailing 1 bits (the right turns after it) and then one more bit off k. 0 means every key goes before 'key'
+        k = 1
+        if including_equal_keys:
+            while k <= size:
+                k = 2 * k + (eytzinger_keys[k] < key)
+        else:
+            while k <= size:
+                k = 2 * k + (eytzinger_keys[k] <= key)
+
+        return k >> ((~k) & (k + 1)).bit_length()
+
+    def lower_bound(self, key):
+
+        #Position (in the original sorted list) of the first key >= 'key', or the length of the list if there is none
+        k = self.eytzinger_position_of_the_first_key_going_after(key, True)
+        return self.sorted_positions[k] if k else self.size
+
+    def upper_bound(self, key):
+
+        #Position (in the original sorted list) of the first key > 'key', or the length of the list if there is none
+        k = self.eytzinger_position_of_the_first_key_going_after(key, False)
+        return self.sorted_positions[k] if k else self.size
+
+    def find(self, key):
+
+        #Position (in the original sorted list) of the leftmost key equal to 'key', or -1 if there is none
+        k = self.eytzinger_position_of_the_first_key_going_after(key, True)
+        if k and self.eytzinger_keys[k] == key:
+            return self.sorted_positions[k]
+        return -1
+
+    def range(self, lowest_key, highest_key):
+
+        #Positions (in the original sorted list) of all keys from 'lowest_key' to 'highest_key', both included
+        return range(self.lower_bound(lowest_key), self.upper_bound(highest_key))
+
+
+if __name__ == '__main__':
+    nums_list = [4, 9, 11, 17, 21, 25, 29, 32, 38]
+    sorted_index = SortedIndex(nums_list)
+    num_to_find = 32
+    index = sorted_index.find(num_to_find)
+    print(f"Number found at index {index} using the Sorted Index")
+    print(f"Numbers from 10 to 30 found at indices {list(sorted_index.range(10, 30))} using the Sorted Index")
@@ -0,0 +1,129 @@
+from array import array
+from import_algorithm_file import import_algorithm_file
+
+tim_sort = import_algorithm_file('10. Tim_Sort_(Sorting_Algorithm).py').tim_sort
+
+#The 'integer_sort' function uses Counting Sort when the range of the keys is at most this many times the number of keys
+counting_sort_range_factor = 4
+
+
+def filling_a_list_with_copies_of_a_number(number_list, start_index, number, count):
+    if isinstance(number_list, array):
+        number_list[start_index:start_index + count] = array(number_list.typecode, [number]) * count
+    else:
+        number_list[start_index:start_index + count] = [number] * count
+
+
+def counting_sort(number_list):
+
+    #Counts how many times every key from the smallest to the largest appears, then writes the keys back in order. O(n + k) time and
+    #O(k) extra space for a range of k keys, so it is only worth it when k is not much larger than n
+    if len(number_list) <= 1:
+        return number_list
+
+    minimum_number = min(number_list)
+    counts = [0] * (max(number_list) - minimum_number + 1)
+
+    for number in number_list:
+        counts[number - minimum_number] += 1
+
+    i = 0
+    for offset, count in enumerate(counts):
+        if count:
+            filling_a_list_with_copies_of_a_number(number_list, i, minimum_number + offset, count)
+            i += count
+
+    return number_list
+
+
+def lsd_radix_sort(number_list, output_buffer=None):
+
+    #Least significant digit Radix Sort with 1 byte digits, for non-negative integers up to 64 bits (e.g. in an array('I') or
+    #array('Q')). Every pass is a stable Counting Sort on one byte, moving the keys back and forth between the list and one output
+    #buffer (allocated once, or passed in by the caller so repeated sorts allocate nothing)
+    size = len(number_list)
+
+    if size <= 1:
+        return number_list
+
+    if min(number_list) < 0:
+        raise ValueError("The LSD Radix Sort Algorithm only sorts non-negative integers")
+
+    if output_buffer is None:
+        output_buffer = array(number_list.typecode, bytes(size * number_list.itemsize)) if isinstance(number_list, array) else [0] * size
+    elif len(output_buffer) < size:
+        raise ValueError(f"The output buffer has {len(output_buffer)} elements, it needs at least {size}")
+
+    shifts = range(0, max(8, max(number_list).bit_length()), 8)
+
+    #Every pass only reorders the same keys, so the counts of every byte for every pass can all be taken in one go up front
+    counts_of_every_pass = [[0] * 256 for shift in shifts]
+    for number in number_list:
+        for pass_index, shift in enumerate(shifts):
+            counts_of_every_pass[pass_index][(number >> shift) & 255] += 1
+
+    source_list = number_list
+    destination_list = output_buffer
+
+    for shift, counts in zip(shifts, counts_of_every_pass):
+
+        #Every key has the same byte here, so this pass would not move anything
+        if size in counts:
+            continue
+
+        positions = [0] * 256
+        total = 0
+        for byte in range(256):
+            positions[byte] = total
+            total += counts[byte]
+
+        for i in range(size):
+            number = source_list[i]
+            byte = (number >> shift) & 255
+            destination_list[positions[byte]] = number
+            positions[byte] += 1
+
+        source_list, destination_list = destination_list, source_list
+
+    #After an odd number of passes, the sorted keys are in the output buffer
+    if source_list is not number_list:
+        number_list[:] = source_list[:size]
+
+    return number_list
+
+
+def integer_sort(number_list, output_buffer=None):
+
+    #Picks a sorting algorithm from the range of the keys: Counting Sort for a small range, LSD Radix Sort for non-negative keys of up
+    #to 64 bits (as long as the number of 1 byte passes is small next to log2(n)), and the Tim Sort Algorithm for anything else
+    size = len(number_list)
+
+    if size <= 1:
+        return number_list
+
+    if isinstance(number_list, array):
+        if number_list.typecode in 'fd':
+            return tim_sort(number_list)
+    elif not all(type(number) is int for number in number_list):
+        return tim_sort(number_list)
+
+    minimum_number = min(number_list)
+    maximum_number = max(number_list)
+
+    if maximum_number - minimum_number + 1 <= counting_sort_range_factor * size:
+        return counting_sort(number_list)
+
+    if minimum_number >= 0 and maximum_number.bit_length() <= 64 and -(-maximum_number.bit_length() // 8) <= max(1, size.bit_length() // 2):
+        return lsd_radix_sort(number_list, output_buffer)
+
+    return tim_sort(number_list)
+
+
+if __name__ == '__main__':
+    nums_list = [21, 38, 29, 17, 4, 25, 32, 9]
+    counting_sort(nums_list)
+    print(nums_list)
+
+    nums_array = array('I', [70, 3, 1, 56, 34, 12, 9, 13, 80000])
+    lsd_radix_sort(nums_array)
+    print(nums_array)
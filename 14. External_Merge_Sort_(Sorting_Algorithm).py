@@ -0,0 +1,177 @@
+import heapq
+import itertools
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from import_algorithm_file import import_algorithm_file
+
+tim_sort = import_algorithm_file('10. Tim_Sort_(Sorting_Algorithm).py').tim_sort
+
+#A record packed into 'n' bytes takes roughly this many times 'n' bytes once it is unpacked into a Python list (the int or tuple objects,
+#the list pointers and the scratch space of the sort), which is used to turn the memory budget into a number of records per run
+in_memory_size_factor = 8
+
+#The merge gives every run it reads at least this many bytes of buffer, so the fan-in of a merge is at most memory budget / this
+minimum_merge_buffer_size = 64 * 1024
+
+
+def array_typecode_of_a_record_format(record_struct):
+
+    #Records of a single number in native byte order (e.g. 'q' or 'd') are packed and unpacked in one go through an array, which is
+    #much faster than unpacking them one struct at a time. Gives back None for any other record format
+    record_format = record_struct.format.lstrip('@')
+    if len(record_format) == 1 and record_format in 'bBhHiIlLqQfd' and array(record_format).itemsize == record_struct.size:
+        return record_format
+    return None
+
+
+def unpacking_records(data, record_struct, typecode):
+    if typecode is not None:
+        records = array(typecode)
+        records.frombytes(data)
+        return records.tolist()
+    return list(record_struct.iter_unpack(data))
+
+
+def packing_records(records, record_struct, typecode):
+    if typecode is not None:
+        return array(typecode, records).tobytes()
+    return b''.join(record_struct.pack(*record) for record in records)
+
+
+def reading_a_run(run_file_path, record_struct, typecode, buffer_size, use_mmap):
+
+    #Yields the records of a run file one at a time, reading 'buffer_size' bytes (a whole number of records) at a time, either with
+    #plain buffered reads or through a memory map of the whole file
+    buffer_size -= buffer_size % record_struct.size
+
+    with open(run_file_path, 'rb') as run_file:
+        if not use_mmap:
+            while True:
+                data = run_file.read(buffer_size)
+                if not data:
+                    return
+                yield from unpacking_records(data, record_struct, typecode)
+
+        if os.fstat(run_file.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(run_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mapped_file.madvise(mmap.MADV_SEQUENTIAL)
+            for offset in range(0, len(mapped_file), buffer_size):
+                yield from unpacking_records(mapped_file[offset:offset + buffer_size], record_struct, typecode)
+
+
+def writing_the_records(records, output_file, record_struct, typecode, buffer_size):
+
+    #Packs the records into one large sequential write per 'buffer_size' bytes
+    records_per_write = max(1, buffer_size // record_struct.size)
+    records = iter(records)
+
+    while True:
+        buffered_records = list(itertools.islice(records, records_per_write))
+        if not buffered_records:
+            return
+        output_file.write(packing_records(buffered_records, record_struct, typecode))
+
+
+def merging_runs(run_file_paths, output_file_path, record_struct, typecode, memory_budget, use_mmap):
+
+    #k-way merge with a heap (heapq.merge keeps the next record of every run in a heap), with the memory budget split evenly between
+    #the read buffers of the k runs and the write buffer
+    buffer_size = max(record_struct.size, memory_budget // (len(run_file_paths) + 1))
+
+    runs = [reading_a_run(run_file_path, record_struct, typecode, buffer_size, use_mmap) for run_file_path in run_file_paths]
+    with open(output_file_path, 'wb') as output_file:
+        writing_the_records(heapq.merge(*runs), output_file, record_struct, typecode, buffer_size)
+
+
+def external_merge_sort(input_file_path, output_file_path, record_format='q', memory_budget=64 * 1024 * 1024, use_mmap=False,
+                        temporary_directory=None, sorting_algorithm=tim_sort):
+
+    #Sorts a binary file of fixed-width records that may be much larger than the memory, e.g. 'q' for 64-bit integers or '<qd' for
+    #(integer key, float) records (any 'struct' format, records with several fields are sorted field by field). Only about
+    #'memory_budget' bytes are used at a time:
+    #1. The file is read in chunks that fit in the memory budget, every chunk is sorted in memory with 'sorting_algorithm' (the Tim
+    #   Sort Algorithm by default), and written to a temporary file as a sorted run
+    #2. The runs are merged with a k-way merge, as many runs at a time as the memory budget can give a read buffer of at least
+    #   'minimum_merge_buffer_size' bytes, in as many passes as needed, into the output file
+    record_struct = struct.Struct(record_format)
+    typecode = array_typecode_of_a_record_format(record_struct)
+
+    input_file_size = os.path.getsize(input_file_path)
+    if input_file_size % record_struct.size:
+        raise ValueError(f"The file has {input_file_size} bytes, which is not a whole number of {record_struct.size} byte records")
+
+    records_per_run = max(1, memory_budget // (in_memory_size_factor * record_struct.size))
+    maximum_fan_in = max(2, memory_budget // minimum_merge_buffer_size - 1)
+
+    with tempfile.TemporaryDirectory(dir=temporary_directory) as temporary_directory_path:
+
+        #~~~(Sorting the runs)~~~
+        run_file_paths = []
+        with open(input_file_path, 'rb') as input_file:
+            while True:
+                data = input_file.read(records_per_run * record_struct.size)
+                if not data:
+                    break
+
+                records = unpacking_records(data, record_struct, typecode)
+                del data
+                sorting_algorithm(records)
+
+                #A file that fits in one run is written straight to the output file
+                if not run_file_paths and len(records) * record_struct.size == input_file_size:
+                    with open(output_file_path, 'wb') as output_file:
+                        output_file.write(packing_records(records, record_struct, typecode))
+                    return output_file_path
+
+                run_file_path = os.path.join(temporary_directory_path, f"run_{len(run_file_paths)}.bin")
+                with open(run_file_path, 'wb') as run_file:
+                    run_file.write(packing_records(records, record_struct, typecode))
+                run_file_paths.append(run_file_path)
+                del records
+
+        if not run_file_paths:
+            open(output_file_path, 'wb').close()
+            return output_file_path
+
+        #~~~(Merging the runs, 'maximum_fan_in' runs at a time, until the last merge can write the output file)~~~
+        merge_pass = 0
+        while len(run_file_paths) > maximum_fan_in:
+            merged_run_file_paths = []
+
+            for i in range(0, len(run_file_paths), maximum_fan_in):
+                merged_run_file_path = os.path.join(temporary_directory_path, f"merge_{merge_pass}_{len(merged_run_file_paths)}.bin")
+                merging_runs(run_file_paths[i:i + maximum_fan_in], merged_run_file_path, record_struct, typecode, memory_budget, use_mmap)
+                merged_run_file_paths.append(merged_run_file_path)
+
+            for run_file_path in run_file_paths:
+                os.remove(run_file_path)
+
+            run_file_paths = merged_run_file_paths
+            merge_pass += 1
+
+        merging_runs(run_file_paths, output_file_path, record_struct, typecode, memory_budget, use_mmap)
+
+    return output_file_path
+
+
+if __name__ == '__main__':
+    nums_list = [21, 38, 29, 17, 4, 25, 32, 9]
+
+    with tempfile.TemporaryDirectory() as directory_path:
+        input_file_path = os.path.join(directory_path, 'numbers.bin')
+        with open(input_file_path, 'wb') as input_file:
+            array('q', nums_list).tofile(input_file)
+
+        #A tiny memory budget, so the 8 numbers are sorted as several runs and merged
+        external_merge_sort(input_file_path, input_file_path + '.sorted', memory_budget=128)
+
+        sorted_nums = array('q')
+        with open(input_file_path + '.sorted', 'rb') as output_file:
+            sorted_nums.frombytes(output_file.read())
+        print(sorted_nums.tolist())
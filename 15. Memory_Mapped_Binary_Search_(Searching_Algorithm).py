@@ -0,0 +1,114 @@
+import bisect
+import mmap
+import os
+import struct
+from import_algorithm_file import import_algorithm_file
+
+iterative_binary_search = import_algorithm_file('2. Iterative_Binary_Search_(Searching_Algorithm).py').iterative_binary_search
+
+
+class RecordKeys:
+
+    #A read-only sequence of the keys of the records in a memory mapped file, for record formats that a memoryview can't be cast to
+    #(e.g. '<qd' records, or keys that are not the first field). Every key is unpacked straight out of the memory map when it is read
+    def __init__(self, mapped_file, record_struct, key_field):
+        self.mapped_file = mapped_file
+        self.record_struct = record_struct
+        self.key_field = key_field
+        self.size = len(mapped_file) // record_struct.size
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("record index out of range")
+        return self.record_struct.unpack_from(self.mapped_file, index * self.record_struct.size)[self.key_field]
+
+
+class MemoryMappedSortedFile:
+
+    #Searches a file of fixed-width records sorted by their key (e.g. the output of the External Merge Sort Algorithm) without reading
+    #it into memory. The file is memory mapped, so opening it takes O(1) time however large it is, and a search only reads the O(log n)
+    #pages of the records the Binary Search Algorithm probes. Every search gives back byte offsets of records in the file
+    def __init__(self, file_path, record_format='q', key_field=0):
+        self.record_struct = struct.Struct(record_format)
+        self.record_size = self.record_struct.size
+
+        with open(file_path, 'rb') as sorted_file:
+            self.file_size = os.fstat(sorted_file.fileno()).st_size
+            if self.file_size % self.record_size:
+                raise ValueError(f"The file has {self.file_size} bytes, which is not a whole number of {self.record_size} byte records")
+
+            #An empty file can't be memory mapped, and has no records to search anyway
+            self.mapped_file = mmap.mmap(sorted_file.fileno(), 0, access=mmap.ACCESS_READ) if self.file_size else None
+
+        #Records of a single native number (e.g. 'q' or 'd') are searched through a memoryview cast of the memory map, with no copy and
+        #no unpacking in Python. Any other record format goes through the 'RecordKeys' sequence
+        record_format = self.record_struct.format.lstrip('@')
+        if self.mapped_file is None:
+            self.keys = ()
+        elif len(record_format) == 1 and key_field == 0 and struct.calcsize(record_format) == self.record_size:
+            self.keys = memoryview(self.mapped_file).cast(record_format)
+        else:
+            self.keys = RecordKeys(self.mapped_file, self.record_struct, key_field)
+
+    def close(self):
+        #The memoryview has to be released before the memory map under it can be closed
+        if isinstance(self.keys, memoryview):
+            self.keys.release()
+        if self.mapped_file is not None:
+            self.mapped_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception_info):
+        self.close()
+
+    def __len__(self):
+        return len(self.keys)
+
+    def record_at(self, offset):
+        return self.record_struct.unpack_from(self.mapped_file, offset)
+
+    def find(self, key):
+
+        #Byte offset of a record with this key (found with the Iterative Binary Search Algorithm), or -1 if there is none
+        index = iterative_binary_search(self.keys, key)
+        return index * self.record_size if index >= 0 else -1
+
+    def lower_bound(self, key):
+
+        #Byte offset of the first record with a key >= 'key', or the size of the file if there is none
+        return bisect.bisect_left(self.keys, key) * self.record_size
+
+    def upper_bound(self, key):
+
+        #Byte offset of the first record with a key > 'key', or the size of the file if there is none
+        return bisect.bisect_right(self.keys, key) * self.record_size
+
+    def range(self, lowest_key, highest_key):
+
+        #Byte offsets of all records with keys from 'lowest_key' to 'highest_key', both included
+        return range(self.lower_bound(lowest_key), self.upper_bound(highest_key), self.record_size)
+
+
+if __name__ == '__main__':
+    import tempfile
+    from array import array
+
+    nums_list = [4, 9, 11, 17, 21, 25, 29, 32, 38]
+
+    with tempfile.TemporaryDirectory() as directory_path:
+        file_path = os.path.join(directory_path, 'sorted_numbers.bin')
+        with open(file_path, 'wb') as sorted_file:
+            array('q', nums_list).tofile(sorted_file)
+
+        with MemoryMappedSortedFile(file_path) as sorted_numbers_file:
+            num_to_find = 32
+            offset = sorted_numbers_file.find(num_to_find)
+            print(f"Number found at byte offset {offset} using the Memory Mapped Binary Search")
+            print(f"Numbers from 10 to 30 found at byte offsets {list(sorted_numbers_file.range(10, 30))} using the Memory Mapped Binary Search")
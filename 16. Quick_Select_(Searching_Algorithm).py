@@ -0,0 +1,142 @@
+import math
+from import_algorithm_file import import_algorithm_file
+
+quick_sort_module = import_algorithm_file('5. Quick_Sort_(Sorting_Algorithm).py')
+swapping_two_elements_in_a_list = quick_sort_module.swapping_two_elements_in_a_list
+partitioning_a_list = quick_sort_module.partitioning_a_list
+placing_the_pivots = quick_sort_module.placing_the_pivots
+intro_sort = quick_sort_module.intro_sort
+insertion_sort = import_algorithm_file('6. Insertion_Sort_(Sorting_Algorithm).py').insertion_sort
+
+#Sublists with at most this many elements are simply sorted with the Insertion Sort Algorithm once a rank falls inside them
+insertion_sort_cutoff = quick_sort_module.insertion_sort_cutoff
+
+
+def median_of_medians_pivot_index(number_list, start_index_of_list, end_index_of_list):
+
+    #Sorts every group of 5 elements, moves the median of every group to the front of the sublist, and selects the median of those
+    #medians. It is always larger than ~30% of the sublist and smaller than another ~30%, which is what makes the fallback linear
+    number_of_medians = 0
+
+    for start_index_of_group in range(start_index_of_list, end_index_of_list + 1, 5):
+        end_index_of_group = min(start_index_of_group + 4, end_index_of_list)
+        insertion_sort(number_list, start_index_of_group, end_index_of_group)
+        swapping_two_elements_in_a_list(start_index_of_list + number_of_medians, (start_index_of_group + end_index_of_group) // 2, number_list)
+        number_of_medians += 1
+
+    median_index = start_index_of_list + (number_of_medians - 1) // 2
+    selecting_ranks(number_list, [median_index], start_index_of_list, start_index_of_list + number_of_medians - 1)
+    return median_index
+
+
+def selecting_ranks(number_list, ranks, start_index_of_list, end_index_of_list, partition_scheme='hoare'):
+
+    #Rearranges number_list[start_index_of_list:end_index_of_list + 1] so that every index in 'ranks' holds the element that would be
+    #there if the sublist were sorted, with only smaller or equal elements before it and only larger or equal elements after it
+    #(Introselect: Quick Select with the same pivots and partition schemes as Intro Sort, which is O(n) on average, falling back to
+    #median-of-medians pivots and the 3-way partition scheme, which is O(n) in the worst case, once the partitions stop shrinking)
+    if start_index_of_list >= end_index_of_list or not ranks:
+        return
+
+    depth_budget = 2 * int(math.log2(end_index_of_list - start_index_of_list + 1))
+    stack = [(start_index_of_list, end_index_of_list, sorted(set(ranks)), depth_budget)]
+
+    while stack:
+        start_index, end_index, ranks_in_sublist, remaining_depth = stack.pop()
+
+        if end_index - start_index + 1 <= insertion_sort_cutoff:
+            insertion_sort(number_list, start_index, end_index)
+            continue
+
+        if remaining_depth > 0:
+            placing_the_pivots(number_list, start_index, end_index, partition_scheme)
+            sublists = partitioning_a_list(number_list, start_index, end_index, partition_scheme)
+        else:
+            pivot_index = median_of_medians_pivot_index(number_list, start_index, end_index)
+            swapping_two_elements_in_a_list(start_index, pivot_index, number_list)
+            sublists = partitioning_a_list(number_list, start_index, end_index, 'three_way')
+
+        #Only the sublists with a rank still in them are partitioned again. A rank outside every sublist landed on a pivot (or among
+        #the keys equal to it), so it is already in its final place
+        for start_index_of_sublist, end_index_of_sublist in sublists:
+            ranks_in_this_sublist = [rank for rank in ranks_in_sublist if start_index_of_sublist <= rank <= end_index_of_sublist]
+            if ranks_in_this_sublist and start_index_of_sublist < end_index_of_sublist:
+                stack.append((start_index_of_sublist, end_index_of_sublist, ranks_in_this_sublist, remaining_depth - 1))
+
+
+def nth_element(number_list, k, partition_scheme='hoare'):
+
+    #Rearranges the list in place so that number_list[k] is the k-th smallest element (counting from 0), everything before it is
+    #smaller or equal and everything after it is larger or equal, and gives back number_list[k]
+    if not -len(number_list) <= k < len(number_list):
+        raise IndexError(f"Rank {k} is out of range for a list of {len(number_list)} elements")
+    if k < 0:
+        k += len(number_list)
+
+    selecting_ranks(number_list, [k], 0, len(number_list) - 1, partition_scheme)
+    return number_list[k]
+
+
+def select(number_list, k, partition_scheme='hoare'):
+
+    #The k-th smallest element (counting from 0), without changing the list
+    return nth_element(list(number_list), k, partition_scheme)
+
+
+def median(number_list):
+
+    #The middle element, or the average of the 2 middle elements for an even number of elements, without changing the list
+    number_list = list(number_list)
+    size = len(number_list)
+
+    if size == 0:
+        raise ValueError("The median of an empty list is not defined")
+
+    upper_median = nth_element(number_list, size // 2)
+    if size % 2 == 1:
+        return upper_median
+
+    #Everything before the upper median is smaller or equal, so the lower median is the largest of them
+    return (max(number_list[:size // 2]) + upper_median) / 2
+
+
+def quantiles(number_list, fractions):
+
+    #The element at each fraction (from 0 to 1) of the way through the sorted list, by nearest rank (the smallest element with at least
+    #that fraction of the list at or below it), without changing the list. All the ranks are selected together in one pass of
+    #partitioning, which only goes down into the sublists that still have a rank in them
+    number_list = list(number_list)
+    size = len(number_list)
+
+    if size == 0:
+        raise ValueError("The quantiles of an empty list are not defined")
+    for fraction in fractions:
+        if not 0 <= fraction <= 1:
+            raise ValueError(f"Quantile fractions must be from 0 to 1, got {fraction!r}")
+
+    ranks = [min(size - 1, max(0, math.ceil(fraction * size) - 1)) for fraction in fractions]
+    selecting_ranks(number_list, ranks, 0, size - 1)
+    return [number_list[rank] for rank in ranks]
+
+
+def partial_sort(number_list, k, partition_scheme='hoare'):
+
+    #Puts the k smallest elements in order at the front of the list (the rest are left in no particular order after them), in
+    #O(n + k log k) time instead of the O(n log n) of sorting the whole list
+    k = min(k, len(number_list))
+    if k <= 0:
+        return number_list
+
+    selecting_ranks(number_list, [k - 1], 0, len(number_list) - 1, partition_scheme)
+    intro_sort(number_list, 0, k - 1, partition_scheme)
+    return number_list
+
+
+if __name__ == '__main__':
+    nums_list = [21, 38, 29, 17, 4, 25, 32, 9]
+    print(f"3rd smallest number is {select(nums_list, 2)} using Quick Select")
+    print(f"Median is {median(nums_list)} using Quick Select")
+    print(f"Quartiles are {quantiles(nums_list, [0.25, 0.5, 0.75])} using Quick Select")
+
+    partial_sort(nums_list, 3)
+    print(nums_list)
@@ -0,0 +1,111 @@
+import heapq
+import math
+from import_algorithm_file import import_algorithm_file
+
+quick_sort_module = import_algorithm_file('5. Quick_Sort_(Sorting_Algorithm).py')
+partitioning_a_list = quick_sort_module.partitioning_a_list
+placing_the_pivots = quick_sort_module.placing_the_pivots
+heap_sort = quick_sort_module.heap_sort
+insertion_sort = import_algorithm_file('6. Insertion_Sort_(Sorting_Algorithm).py').insertion_sort
+
+#Segments with at most this many elements are sorted with the Insertion Sort Algorithm in one go once they are the leftmost segment
+insertion_sort_cutoff = quick_sort_module.insertion_sort_cutoff
+
+
+def sorted_stream(iterable, partition_scheme='hoare'):
+
+    #Yields the elements of 'iterable' in sorted order, one at a time, doing only as much sorting as the elements taken so far need
+    #(Incremental Quick Sort). The segments that are still unsorted are kept on a stack with the leftmost one on top, and only the
+    #leftmost segment is ever partitioned, so the first element comes out after O(n) work on average and the first k after
+    #O(n + k log k), instead of the O(n log n) of sorting everything before the first element is available
+    number_list = list(iterable)
+    if not number_list:
+        return
+
+    #Every segment is (start index, end index, remaining depth budget, already sorted). Like in Intro Sort, a segment that has been
+    #partitioned too many times without getting small is sorted with the Heap Sort Algorithm instead
+    stack = [(0, len(number_list) - 1, 2 * int(math.log2(len(number_list))), False)]
+
+    while stack:
+        start_index, end_index, remaining_depth, already_sorted = stack.pop()
+
+        if not already_sorted and end_index - start_index + 1 > insertion_sort_cutoff and remaining_depth > 0:
+            placing_the_pivots(number_list, start_index, end_index, partition_scheme)
+            sublists = sorted(partitioning_a_list(number_list, start_index, end_index, partition_scheme))
+
+            #The gaps between the sublists are the pivots (and any keys equal to them), which are already in their final places
+            segments = []
+            next_index = start_index
+            for start_index_of_sublist, end_index_of_sublist in sublists:
+                if next_index < start_index_of_sublist:
+                    segments.append((next_index, start_index_of_sublist - 1, 0, True))
+                if start_index_of_sublist <= end_index_of_sublist:
+                    segments.append((start_index_of_sublist, end_index_of_sublist, remaining_depth - 1, False))
+                next_index = max(next_index, end_index_of_sublist + 1)
+            if next_index <= end_index:
+                segments.append((next_index, end_index, 0, True))
+
+            stack.extend(reversed(segments))
+            continue
+
+        if not already_sorted:
+            if end_index - start_index + 1 > insertion_sort_cutoff:
+                heap_sort(number_list, start_index, end_index)
+            else:
+                insertion_sort(number_list, start_index, end_index)
+
+        for i in range(start_index, end_index + 1):
+            yield number_list[i]
+
+
+class ReversedOrder:
+
+    #Wraps an element so that 'heapq' (which only keeps the smallest element on top) keeps the largest element on top instead
+    __slots__ = ('element',)
+
+    def __init__(self, element):
+        self.element = element
+
+    def __lt__(self, other):
+        return other.element < self.element
+
+
+def top_k(iterable, k):
+
+    #The k largest elements of 'iterable' (which can be a generator of any length), largest first. Only a min-heap of the k largest
+    #elements seen so far is kept, and every new element only has to beat the smallest of them, so it takes O(n log k) time and O(k)
+    #memory however long the iterable is
+    if k <= 0:
+        return []
+
+    heap = []
+    for element in iterable:
+        if len(heap) < k:
+            heapq.heappush(heap, element)
+        elif heap[0] < element:
+            heapq.heapreplace(heap, element)
+
+    return [heapq.heappop(heap) for i in range(len(heap))][::-1]
+
+
+def bottom_k(iterable, k):
+
+    #The k smallest elements of 'iterable', smallest first, the same way as 'top_k' but with a max-heap of the k smallest elements
+    if k <= 0:
+        return []
+
+    heap = []
+    for element in iterable:
+        if len(heap) < k:
+            heapq.heappush(heap, ReversedOrder(element))
+        elif element < heap[0].element:
+            heapq.heapreplace(heap, ReversedOrder(element))
+
+    return [heapq.heappop(heap).element for i in range(len(heap))][::-1]
+
+
+if __name__ == '__main__':
+    nums_list = [21, 38, 29, 17, 4, 25, 32, 9]
+    stream = sorted_stream(nums_list)
+    print(f"First 3 numbers in order are {[next(stream) for i in range(3)]} using Incremental Quick Sort")
+    print(f"3 largest numbers are {top_k(nums_list, 3)} and 3 smallest numbers are {bottom_k(iter(nums_list), 3)}")
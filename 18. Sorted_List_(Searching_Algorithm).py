@@ -0,0 +1,296 @@
+import bisect
+from import_algorithm_file import import_algorithm_file
+
+tim_sort = import_algorithm_file('10. Tim_Sort_(Sorting_Algorithm).py').tim_sort
+merge_two_smaller_sorted_lists_to_a_merged_sorted_list = import_algorithm_file('8. Merge_Sort_(Sorting_Algorithm).py').merge_two_smaller_sorted_lists_to_a_merged_sorted_list
+
+#A part of a batch is merged into its sublist when it has at least 1 / this of the elements of the sublist, and inserted one element at a
+#time otherwise (a merge goes through every element of the sublist in Python, while an insert is a Binary Search and one shift in C)
+merge_fraction = 4
+
+#Every sublist is built with this many elements, and split in half once it grows to twice as many. An insert or delete only shifts the
+#elements of one sublist, so the bigger this is the fewer sublists there are to search through, but the more elements every insert shifts
+sublist_load = 1000
+
+
+class SortedList:
+
+    #A list that stays sorted as elements are added and removed, so it never has to be sorted again from scratch. The elements are kept
+    #in a list of sorted sublists of about 'sublist_load' elements each, plus the largest element of every sublist:
+    #- An insert or delete finds its sublist with a Binary Search over the largest elements, then its position in the sublist with another
+    #  Binary Search, and only shifts the elements of that one sublist (O(log n) comparisons, and O(sublist_load) moves done in C)
+    #- The positional index is a Fenwick tree (binary indexed tree) over the lengths of the sublists, which turns a position in the whole
+    #  list into (sublist, position in the sublist) and back in O(log m) time for m sublists, for indexing, rank and select
+    def __init__(self, iterable=()):
+        self.sublists = []
+        self.maximums = []
+        self.size = 0
+        self.positional_index = [0]
+        self.extend(iterable)
+
+    #~~~(Keeping the sublists, the largest elements and the positional index in step)~~~
+
+    def building_the_positional_index(self):
+
+        #Builds the Fenwick tree over the sublist lengths in O(m) time: every node adds its total into its parent. Only needed when a
+        #sublist is split or removed, which happens once every 'sublist_load' inserts or deletes at most
+        positional_index = [0] + [len(sublist) for sublist in self.sublists]
+        for i in range(1, len(positional_index)):
+            parent = i + (i & -i)
+            if parent < len(positional_index):
+                positional_index[parent] += positional_index[i]
+        self.positional_index = positional_index
+
+    def updating_the_positional_index(self, sublist_index, change_in_length):
+        i = sublist_index + 1
+        while i < len(self.positional_index):
+            self.positional_index[i] += change_in_length
+            i += i & -i
+
+    def position_of(self, sublist_index, index_in_sublist):
+
+        #Position in the whole list of sublists[sublist_index][index_in_sublist]: the lengths of all the sublists before it (a prefix sum
+        #of the Fenwick tree), plus its position in its own sublist
+        position = index_in_sublist
+        i = sublist_index
+        while i > 0:
+            position += self.positional_index[i]
+            i -= i & -i
+        return position
+
+    def locating_a_position(self, index):
+
+        #(sublist index, position in the sublist) of the element at position 'index' in the whole list. Walks down the Fenwick tree,
+        #skipping over whole blocks of sublists while they end before 'index'
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f"Index {index} is out of range for a sorted list of {self.size} elements")
+
+        sublist_index = 0
+        step = 1 << (len(self.positional_index) - 1).bit_length()
+        while step:
+            if sublist_index + step < len(self.positional_index) and self.positional_index[sublist_index + step] <= index:
+                sublist_index += step
+                index -= self.positional_index[sublist_index]
+            step >>= 1
+
+        return sublist_index, index
+
+    def splitting_a_full_sublist(self, sublist_index):
+        sublist = self.sublists[sublist_index]
+        if len(sublist) < 2 * sublist_load:
+            return
+
+        self.sublists[sublist_index:sublist_index + 1] = [sublist[:sublist_load], sublist[sublist_load:]]
+        self.maximums[sublist_index:sublist_index + 1] = [sublist[sublist_load - 1], sublist[-1]]
+        self.building_the_positional_index()
+
+    def deleting_from_a_sublist(self, sublist_index, index_in_sublist):
+        sublist = self.sublists[sublist_index]
+        del sublist[index_in_sublist]
+        self.size -= 1
+
+        if not sublist:
+            del self.sublists[sublist_index]
+            del self.maximums[sublist_index]
+            self.building_the_positional_index()
+            return
+
+        self.maximums[sublist_index] = sublist[-1]
+        self.updating_the_positional_index(sublist_index, -1)
+
+    #~~~(Adding and removing elements)~~~
+
+    def add(self, value):
+
+        #Inserts 'value' after any elements equal to it
+        if not self.sublists:
+            self.sublists.append([value])
+            self.maximums.append(value)
+            self.size = 1
+            self.building_the_positional_index()
+            return
+
+        #The first sublist whose largest element is larger than 'value', or the last sublist if 'value' goes after everything
+        sublist_index = min(bisect.bisect_right(self.maximums, value), len(self.sublists) - 1)
+        sublist = self.sublists[sublist_index]
+        bisect.insort_right(sublist, value)
+        self.maximums[sublist_index] = sublist[-1]
+        self.size += 1
+        self.updating_the_positional_index(sublist_index, 1)
+        self.splitting_a_full_sublist(sublist_index)
+
+    def extend(self, values):
+
+        #Adds a batch of values by sorting the batch (with the Tim Sort Algorithm) and splitting it at the largest elements of the
+        #sublists, so every sublist gets the part of the batch that goes into it with one Binary Search. A large part is merged into its
+        #sublist in one pass, and a small part is inserted one element at a time. Only the sublists that receive values are touched
+
+        #Like 'add', a value goes into the first sublist whose largest element is larger than it (so after every element equal to it),
+        #which means a value equal to the largest element of a sublist goes into a later sublist
+        values = list(values)
+        if not values:
+            return
+        tim_sort(values)
+
+        new_sublists = []
+        start_of_batch = 0
+        for sublist_index, sublist in enumerate(self.sublists):
+            if sublist_index == len(self.sublists) - 1:
+                end_of_batch = len(values)
+            else:
+                end_of_batch = bisect.bisect_left(values, self.maximums[sublist_index], start_of_batch)
+
+            if start_of_batch == end_of_batch:
+                new_sublists.append(sublist)
+                continue
+
+            if (end_of_batch - start_of_batch) * merge_fraction < len(sublist):
+                for i in range(start_of_batch, end_of_batch):
+                    bisect.insort_right(sublist, values[i])
+                start_of_batch = end_of_batch
+                merged_sublist = sublist
+
+            else:
+                merged_sublist = [None] * (len(sublist) + end_of_batch - start_of_batch)
+                merge_two_smaller_sorted_lists_to_a_merged_sorted_list(sublist, values[start_of_batch:end_of_batch], merged_sublist)
+                start_of_batch = end_of_batch
+
+            if len(merged_sublist) < 2 * sublist_load:
+                new_sublists.append(merged_sublist)
+            else:
+                new_sublists.extend(merged_sublist[i:i + sublist_load] for i in range(0, len(merged_sublist), sublist_load))
+
+        if not self.sublists:
+            new_sublists = [values[i:i + sublist_load] for i in range(0, len(values), sublist_load)]
+
+        self.sublists = new_sublists
+        self.maximums = [sublist[-1] for sublist in new_sublists]
+        self.size += len(values)
+        self.building_the_positional_index()
+
+    def remove(self, value):
+
+        #Removes the leftmost element equal to 'value', raising ValueError if there is none
+        if not self.discard(value):
+            raise ValueError(f"{value!r} is not in the sorted list")
+
+    def discard(self, value):
+
+        #Removes the leftmost element equal to 'value' if there is one, and gives back whether there was
+        sublist_index = bisect.bisect_left(self.maximums, value)
+        if sublist_index == len(self.sublists):
+            return False
+
+        index_in_sublist = bisect.bisect_left(self.sublists[sublist_index], value)
+        if self.sublists[sublist_index][index_in_sublist] != value:
+            return False
+
+        self.deleting_from_a_sublist(sublist_index, index_in_sublist)
+        return True
+
+    def pop(self, index=-1):
+
+        #Removes and gives back the element at position 'index' (the largest element by default)
+        sublist_index, index_in_sublist = self.locating_a_position(index)
+        value = self.sublists[sublist_index][index_in_sublist]
+        self.deleting_from_a_sublist(sublist_index, index_in_sublist)
+        return value
+
+    #~~~(Reading the elements)~~~
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        for sublist in self.sublists:
+            yield from sublist
+
+    def __getitem__(self, index):
+        sublist_index, index_in_sublist = self.locating_a_position(index)
+        return self.sublists[sublist_index][index_in_sublist]
+
+    def __contains__(self, value):
+        return self.find(value) != -1
+
+    def __repr__(self):
+        return f"SortedList({list(self)!r})"
+
+    #~~~(Binary Search, rank and select)~~~
+
+    def lower_bound(self, value):
+
+        #Position of the first element >= 'value', or the length of the list if there is none
+        sublist_index = bisect.bisect_left(self.maximums, value)
+        if sublist_index == len(self.sublists):
+            return self.size
+        return self.position_of(sublist_index, bisect.bisect_left(self.sublists[sublist_index], value))
+
+    def upper_bound(self, value):
+
+        #Position of the first element > 'value', or the length of the list if there is none
+        sublist_index = bisect.bisect_right(self.maximums, value)
+        if sublist_index == len(self.sublists):
+            return self.size
+        return self.position_of(sublist_index, bisect.bisect_right(self.sublists[sublist_index], value))
+
+    def find(self, value):
+
+        #Position of the leftmost element equal to 'value', or -1 if there is none
+        sublist_index = bisect.bisect_left(self.maximums, value)
+        if sublist_index == len(self.sublists):
+            return -1
+
+        index_in_sublist = bisect.bisect_left(self.sublists[sublist_index], value)
+        if self.sublists[sublist_index][index_in_sublist] != value:
+            return -1
+        return self.position_of(sublist_index, index_in_sublist)
+
+    def rank(self, value):
+
+        #How many elements are smaller than 'value'
+        return self.lower_bound(value)
+
+    def select(self, k):
+
+        #The k-th smallest element (counting from 0)
+        return self[k]
+
+    def range(self, lowest_value, highest_value):
+
+        #Positions of all elements from 'lowest_value' to 'highest_value', both included
+        return range(self.lower_bound(lowest_value), self.upper_bound(highest_value))
+
+    def irange(self, lowest_value=None, highest_value=None):
+
+        #Yields the elements from 'lowest_value' to 'highest_value' (both included, None for no bound) in order, starting with a Binary
+        #Search for the first one instead of going through the elements before it
+        if lowest_value is None:
+            sublist_index, index_in_sublist = 0, 0
+        else:
+            sublist_index = bisect.bisect_left(self.maximums, lowest_value)
+            if sublist_index == len(self.sublists):
+                return
+            index_in_sublist = bisect.bisect_left(self.sublists[sublist_index], lowest_value)
+
+        for sublist in self.sublists[sublist_index:]:
+            for i in range(index_in_sublist, len(sublist)):
+                if highest_value is not None and highest_value < sublist[i]:
+                    return
+                yield sublist[i]
+            index_in_sublist = 0
+
+
+if __name__ == '__main__':
+    sorted_list = SortedList([21, 38, 29, 17, 4, 25, 32, 9])
+    sorted_list.add(11)
+    sorted_list.extend([30, 1])
+    sorted_list.remove(38)
+    print(sorted_list)
+
+    num_to_find = 32
+    index = sorted_list.find(num_to_find)
+    print(f"Number found at index {index} using the Sorted List")
+    print(f"Numbers from 10 to 30 are {list(sorted_list.irange(10, 30))} at indices {list(sorted_list.range(10, 30))} using the Sorted List")
+    print(f"3rd smallest number is {sorted_list.select(2)}, and {sorted_list.rank(20)} numbers are smaller than 20")
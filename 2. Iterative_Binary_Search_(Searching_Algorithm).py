@@ -1,7 +1,36 @@
-def iterative_binary_search(numbers_list, number_to_find):
+import operator
+from import_algorithm_file import import_algorithm_file
+from optional_numpy import getting_numpy, is_a_numpy_array
+
+galloping_search = import_algorithm_file('10. Tim_Sort_(Sorting_Algorithm).py').galloping_search
+
+
+def numpy_iterative_binary_search(numbers_array, number_to_find):
+    np = getting_numpy()
+
+    #'number_to_find' can also be an array of numbers, which are all searched for at once with one batched 'searchsorted' call,
+    #giving back an array of indices
+    if len(numbers_array) == 0:
+        return np.full(np.shape(number_to_find), -1) if np.ndim(number_to_find) else -1
+
+    indices = np.searchsorted(numbers_array, number_to_find)
+    found = (indices < len(numbers_array)) & (numbers_array[np.minimum(indices, len(numbers_array) - 1)] == number_to_find)
+    indices = np.where(found, indices, -1)
+
+    return indices if np.ndim(indices) else int(indices)
+
+
+def iterative_binary_search(numbers_list, number_to_find, left_index=0, right_index=None):
+
+    #'left_index' and 'right_index' limit the search to numbers_list[left_index:right_index + 1] (the whole list by default)
+    if right_index is None:
+        right_index = len(numbers_list) - 1
+
+    if is_a_numpy_array(numbers_list):
+        np = getting_numpy()
+        index = numpy_iterative_binary_search(numbers_list[left_index:right_index + 1], number_to_find)
+        return np.where(index >= 0, index + left_index, -1) if np.ndim(index) else (index + left_index if index >= 0 else -1)
 
-    left_index = 0
-    right_index = len(numbers_list) - 1
     middle_index = 0
 
     while left_index <= right_index:
@@ -19,8 +48,181 @@ def iterative_binary_search(numbers_list, number_to_find):
     return -1
 
 
+#The Interpolation Search Algorithm gives up and falls back to Binary Search after this many probes times log2(log2(n))
+interpolation_search_probe_budget_factor = 2
+
+#The adaptive 'search' function uses the Exponential Search Algorithm when the number to find is among this many numbers at the front
+exponential_search_front_size = 64
+
+#The adaptive 'search' function samples this many evenly spaced numbers to check whether the list looks uniformly distributed,
+#and accepts it as uniform when every sample is within this fraction of the whole range of where a straight line would put it
+number_of_uniformity_samples = 8
+uniformity_tolerance = 0.05
+
+
+def as_an_exact_number(number):
+
+    #NumPy integers (e.g. the elements of a list of np.int64) wrap around when a product gets too large, so every integer is turned into
+    #a Python int, which never overflows, before it is used in the interpolation. Other numbers (e.g. floats) are left as they are
+    try:
+        return operator.index(number)
+    except TypeError:
+        return number
+
+
+def interpolation_search(numbers_list, number_to_find):
+
+    #A NumPy array is searched with one vectorized 'searchsorted' instead, which also never does arithmetic on its fixed-width integers
+    if is_a_numpy_array(numbers_list):
+        return numpy_iterative_binary_search(numbers_list, number_to_find)
+
+    number_to_find = as_an_exact_number(number_to_find)
+    left_index = 0
+    right_index = len(numbers_list) - 1
+
+    #On uniformly distributed numbers, guessing the position from the values at both ends takes about log2(log2(n)) probes. On skewed
+    #numbers the guesses can be far off (up to n probes), so after a budget of probes the rest is left to the Binary Search Algorithm
+    probe_budget = interpolation_search_probe_budget_factor * max(1, max(1, len(numbers_list)).bit_length().bit_length())
+
+    while left_index <= right_index and probe_budget > 0:
+        left_number = as_an_exact_number(numbers_list[left_index])
+        right_number = as_an_exact_number(numbers_list[right_index])
+
+        if number_to_find < left_number or number_to_find > right_number:
+            return -1
+
+        if left_number == right_number:
+            return left_index if left_number == number_to_find else -1
+
+        middle_index = left_index + int((number_to_find - left_number) * (right_index - left_index) // (right_number - left_number))
+        middle_number = numbers_list[middle_index]
+        probe_budget -= 1
+
+        if middle_number == number_to_find:
+            return middle_index
+
+        if middle_number < number_to_find:
+            left_index = middle_index + 1
+        else:
+            right_index = middle_index - 1
+
+    if left_index > right_index:
+        return -1
+
+    return iterative_binary_search(numbers_list, number_to_find, left_index, right_index)
+
+
+def exponential_search(numbers_list, number_to_find):
+
+    if len(numbers_list) == 0:
+        return -1
+
+    #Checks positions 1, 2, 4, 8, ... until it passes the number to find, then does a Binary Search within the last gap. This only
+    #takes O(log i) probes when the number is at position i, which is much less than O(log n) when it is near the front
+    bound = 1
+    while bound < len(numbers_list) and numbers_list[bound] < number_to_find:
+        bound *= 2
+
+    return iterative_binary_search(numbers_list, number_to_find, bound // 2, min(bound, len(numbers_list) - 1))
+
+
+def looks_uniformly_distributed(numbers_list):
+
+    size = len(numbers_list)
+    first_number = as_an_exact_number(numbers_list[0])
+    last_number = as_an_exact_number(numbers_list[-1])
+
+    try:
+        whole_range = last_number - first_number
+        for sample in range(1, number_of_uniformity_samples):
+            index = sample * (size - 1) // number_of_uniformity_samples
+            expected_number = first_number + whole_range * index / (size - 1)
+            if abs(as_an_exact_number(numbers_list[index]) - expected_number) > uniformity_tolerance * whole_range:
+                return False
+    except TypeError:
+        #Not numbers (e.g. strings), which can't be interpolated at all
+        return False
+
+    return True
+
+
+def search(numbers_list, number_to_find, uniformly_distributed=None):
+
+    #Picks the searching algorithm from a few cheap probes of the list: Exponential Search when the number is near the front,
+    #Interpolation Search when the numbers look uniformly distributed, and Binary Search otherwise. Whether the list looks uniformly
+    #distributed is checked again on every call ('number_of_uniformity_samples' probes, so O(1)), unless the caller already knows and
+    #passes it in as 'uniformly_distributed' (e.g. from one 'looks_uniformly_distributed' call before many searches of the same list)
+    if len(numbers_list) < 2:
+        return iterative_binary_search(numbers_list, number_to_find)
+
+    if number_to_find <= numbers_list[min(exponential_search_front_size, len(numbers_list) - 1)]:
+        return exponential_search(numbers_list, number_to_find)
+
+    if uniformly_distributed is None:
+        uniformly_distributed = looks_uniformly_distributed(numbers_list)
+
+    if uniformly_distributed:
+        return interpolation_search(numbers_list, number_to_find)
+
+    return iterative_binary_search(numbers_list, number_to_find)
+
+
+def numpy_batch_binary_search(sorted_array, keys, match_position='leftmost'):
+    np = getting_numpy()
+
+    keys = np.asarray(keys)
+
+    if match_position == 'rightmost':
+        indices = np.searchsorted(sorted_array, keys, side='right') - 1
+        found = indices >= 0
+    else:
+        indices = np.searchsorted(sorted_array, keys, side='left')
+        found = indices < len(sorted_array)
+
+    if len(sorted_array) > 0:
+        found &= sorted_array[np.clip(indices, 0, len(sorted_array) - 1)] == keys
+
+    return np.where(found, indices, -1)
+
+
+def batch_binary_search(sorted_list, keys, match_position='leftmost'):
+
+    #Searches for many keys at once, giving back the index of each key ('leftmost' or 'rightmost' of its duplicates) or -1 if it is
+    #not in the list
+    if match_position not in ('leftmost', 'rightmost'):
+        raise ValueError(f"Unknown match position {match_position!r}, expected 'leftmost' or 'rightmost'")
+
+    if is_a_numpy_array(sorted_list):
+        return numpy_batch_binary_search(sorted_list, keys, match_position)
+
+    rightmost = match_position == 'rightmost'
+    indices = [-1] * len(keys)
+
+    #The keys are visited in sorted order, so each key's position can only be at or after the previous key's position, and is found
+    #by galloping forward from there instead of by a fresh binary search over the whole list
+    position = 0
+    for key_index in sorted(range(len(keys)), key=keys.__getitem__):
+        key = keys[key_index]
+        position = galloping_search(sorted_list, key, position, len(sorted_list), rightmost)
+
+        if rightmost:
+            if position > 0 and sorted_list[position - 1] == key:
+                indices[key_index] = position - 1
+        elif position < len(sorted_list) and sorted_list[position] == key:
+            indices[key_index] = position
+
+    return indices
+
+
 if __name__ == '__main__':
     nums_list = [4, 9, 11, 17, 21, 25, 29, 32, 38]
     num_to_find = 32
-    index = iterative_search(nums_list, num_to_find)
+    index = iterative_binary_search(nums_list, num_to_find)
     print(f"Number found at index {index} using iterative Binary Search")
+
+    index = search(nums_list, num_to_find)
+    print(f"Number found at index {index} using adaptive search")
+
+    nums_to_find = [38, 4, 5, 32]
+    indices = batch_binary_search(nums_list, nums_to_find)
+    print(f"Numbers found at indices {indices} using batched Binary Search")
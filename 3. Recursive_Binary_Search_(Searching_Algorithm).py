@@ -1,4 +1,27 @@
+from optional_numpy import getting_numpy, is_a_numpy_array
+
+
+def numpy_recursive_binary_search(numbers_array, number_to_find, left_index, right_index):
+    np = getting_numpy()
+
+    #The same batched 'searchsorted' as the NumPy backend of the Iterative Binary Search Algorithm, limited to the
+    #numbers_array[left_index:right_index + 1] part of the array
+    left_index = max(left_index, 0)
+    right_index = min(right_index, len(numbers_array) - 1)
+
+    if right_index < left_index:
+        return np.full(np.shape(number_to_find), -1) if np.ndim(number_to_find) else -1
+
+    indices = left_index + np.searchsorted(numbers_array[left_index:right_index + 1], number_to_find)
+    found = (indices <= right_index) & (numbers_array[np.minimum(indices, right_index)] == number_to_find)
+    indices = np.where(found, indices, -1)
+
+    return indices if np.ndim(indices) else int(indices)
+
+
 def recursive_binary_search(numbers_list, number_to_find, left_index, right_index):
+    if is_a_numpy_array(numbers_list):
+        return numpy_recursive_binary_search(numbers_list, number_to_find, left_index, right_index)
 
     if right_index < left_index:
         return -1
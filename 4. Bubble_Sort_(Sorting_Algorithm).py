@@ -1,4 +1,45 @@
-def bubble_sort(number_list):
+from sorting_with_a_key import sorting_with_a_key
+from optional_numpy import getting_numpy, is_a_numpy_array, is_a_numeric_numpy_array, moving_nans_to_the_end, sorting_an_array_as_a_list
+
+
+def odd_even_transposition_sort(number_array):
+    np = getting_numpy()
+
+    #The vectorized counterpart of the Bubble Sort Algorithm: every phase compares-and-swaps all the (even, odd) neighbour pairs at
+    #once, then all the (odd, even) neighbour pairs, until 2 phases in a row swap nothing
+    if not is_a_numeric_numpy_array(number_array):
+        return sorting_an_array_as_a_list(number_array, bubble_sort)
+
+    number_array = number_array[:moving_nans_to_the_end(number_array) + 1]
+    size = len(number_array)
+    phases_without_swaps = 0
+    phase = 0
+
+    while phases_without_swaps < 2 and size > 1:
+        left_elements = number_array[phase % 2:size - 1:2]
+        right_elements = number_array[phase % 2 + 1:size:2]
+
+        #Only the pairs that are out of order are swapped, so equal elements are left as they are (e.g. -0.0 and 0.0)
+        out_of_order = left_elements > right_elements
+        if out_of_order.any():
+            smaller_elements = np.where(out_of_order, right_elements, left_elements)
+            larger_elements = np.where(out_of_order, left_elements, right_elements)
+            left_elements[...] = smaller_elements
+            right_elements[...] = larger_elements
+            phases_without_swaps = 0
+        else:
+            phases_without_swaps += 1
+
+        phase += 1
+
+
+def bubble_sort(number_list, key=None, reverse=False):
+    if key is not None or reverse:
+        return sorting_with_a_key(number_list, key, reverse, bubble_sort)
+
+    if is_a_numpy_array(number_list):
+        return odd_even_transposition_sort(number_list)
+
     size = len(number_list)
 
     for i in range(size - 1):
@@ -21,3 +62,6 @@ if __name__ == '__main__':
     nums_list = [38, 28, 29, 7, 2, 15, 9]
     bubble_sort(nums_list)
     print(nums_list)
+
+    bubble_sort(nums_list, reverse=True)
+    print(nums_list)
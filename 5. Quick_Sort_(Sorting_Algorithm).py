@@ -1,3 +1,17 @@
+import math
+from import_algorithm_file import import_algorithm_file
+from sorting_with_a_key import sorting_with_a_key
+from optional_numpy import is_a_numpy_array, is_a_numeric_numpy_array, moving_nans_to_the_end, sorting_an_array_as_a_list
+
+insertion_sort = import_algorithm_file('6. Insertion_Sort_(Sorting_Algorithm).py').insertion_sort
+
+#Sublists with at most this many elements are sorted by the Insertion Sort Algorithm in Intro Sort
+insertion_sort_cutoff = 16
+
+#Sublists with at least this many elements pick their pivot with Tukey's ninther instead of a plain median-of-three
+ninther_cutoff = 128
+
+
 def swapping_two_elements_in_a_list(a, b, array):
     if array[a] != array[b] and a != b:
         temp = array[a]
@@ -15,7 +29,7 @@ def hoare_partition_scheme(number_list, start_index_of_list, end_index_of_list):
 
     while start_pointer <= end_pointer:
 
-        while start_pointer < len(number_list) and number_list[start_pointer] <= pivot:
+        while start_pointer <= end_index_of_list and number_list[start_pointer] <= pivot:
             start_pointer += 1
 
         while number_list[end_pointer] > pivot:
@@ -44,20 +58,319 @@ def lomuto_partition_scheme(number_list, start_index_of_list, end_index_of_list)
     return partition_index
 
 
-def quick_sort(number_list, start_index_of_list, end_index_of_list):
+def three_way_partition_scheme(number_list, start_index_of_list, end_index_of_list):
+
+    #Bentley-McIlroy 3-way partitioning. Keys equal to the pivot are first swapped out to both ends of the sublist and then swapped
+    #into the middle, so the list ends up as [< pivot | == pivot | > pivot] and the equal keys never have to be sorted again
+    pivot = number_list[start_index_of_list]
+
+    start_pointer = start_index_of_list
+    end_pointer = end_index_of_list + 1
+    end_of_left_equal_keys = start_index_of_list
+    start_of_right_equal_keys = end_index_of_list + 1
+
+    while True:
+        start_pointer += 1
+        while number_list[start_pointer] < pivot:
+            if start_pointer == end_index_of_list:
+                break
+            start_pointer += 1
+
+        end_pointer -= 1
+        while pivot < number_list[end_pointer]:
+            if end_pointer == start_index_of_list:
+                break
+            end_pointer -= 1
+
+        if start_pointer == end_pointer and number_list[start_pointer] == pivot:
+            end_of_left_equal_keys += 1
+            swapping_two_elements_in_a_list(end_of_left_equal_keys, start_pointer, number_list)
+
+        if start_pointer >= end_pointer:
+            break
+
+        swapping_two_elements_in_a_list(start_pointer, end_pointer, number_list)
+
+        if number_list[start_pointer] == pivot:
+            end_of_left_equal_keys += 1
+            swapping_two_elements_in_a_list(end_of_left_equal_keys, start_pointer, number_list)
+
+        if number_list[end_pointer] == pivot:
+            start_of_right_equal_keys -= 1
+            swapping_two_elements_in_a_list(start_of_right_equal_keys, end_pointer, number_list)
+
+    start_pointer = end_pointer + 1
+
+    for i in range(start_index_of_list, end_of_left_equal_keys + 1):
+        swapping_two_elements_in_a_list(i, end_pointer, number_list)
+        end_pointer -= 1
+
+    for i in range(end_index_of_list, start_of_right_equal_keys - 1, -1):
+        swapping_two_elements_in_a_list(i, start_pointer, number_list)
+        start_pointer += 1
+
+    #Everything up to 'end_pointer' is smaller than the pivot and everything from 'start_pointer' onwards is larger than the pivot
+    return end_pointer, start_pointer
+
+
+def dual_pivot_partition_scheme(number_list, start_index_of_list, end_index_of_list):
+
+    #Yaroslavskiy's dual-pivot partitioning, with the first and the last elements as the 2 pivots. The list ends up as
+    #[< left pivot | left pivot | between the pivots | right pivot | > right pivot]
+    if number_list[start_index_of_list] > number_list[end_index_of_list]:
+        swapping_two_elements_in_a_list(start_index_of_list, end_index_of_list, number_list)
+
+    left_pivot = number_list[start_index_of_list]
+    right_pivot = number_list[end_index_of_list]
+
+    less_pointer = start_index_of_list + 1
+    greater_pointer = end_index_of_list - 1
+    i = less_pointer
+
+    while i <= greater_pointer:
+        if number_list[i] < left_pivot:
+            swapping_two_elements_in_a_list(i, less_pointer, number_list)
+            less_pointer += 1
+
+        elif number_list[i] > right_pivot:
+            while number_list[greater_pointer] > right_pivot and i < greater_pointer:
+                greater_pointer -= 1
+
+            swapping_two_elements_in_a_list(i, greater_pointer, number_list)
+            greater_pointer -= 1
+
+            if number_list[i] < left_pivot:
+                swapping_two_elements_in_a_list(i, less_pointer, number_list)
+                less_pointer += 1
+
+        i += 1
+
+    less_pointer -= 1
+    greater_pointer += 1
+
+    swapping_two_elements_in_a_list(start_index_of_list, less_pointer, number_list)
+    swapping_two_elements_in_a_list(end_index_of_list, greater_pointer, number_list)
+
+    return less_pointer, greater_pointer
+
+
+partition_schemes = ['hoare', 'lomuto', 'three_way', 'dual_pivot']
+
+
+def partitioning_a_list(number_list, start_index_of_list, end_index_of_list, partition_scheme):
+
+    #Partitions the list with the chosen partition scheme, and returns the (start index, end index) of the sublists that still
+    #need to be sorted afterwards
+    if partition_scheme == 'hoare':
+        partitioning_point = hoare_partition_scheme(number_list, start_index_of_list, end_index_of_list)
+        return [(start_index_of_list, partitioning_point - 1), (partitioning_point + 1, end_index_of_list)]
+
+    if partition_scheme == 'lomuto':
+        partitioning_point = lomuto_partition_scheme(number_list, start_index_of_list, end_index_of_list)
+        return [(start_index_of_list, partitioning_point - 1), (partitioning_point + 1, end_index_of_list)]
+
+    if partition_scheme == 'three_way':
+        end_of_smaller_keys, start_of_larger_keys = three_way_partition_scheme(number_list, start_index_of_list, end_index_of_list)
+        return [(start_index_of_list, end_of_smaller_keys), (start_of_larger_keys, end_index_of_list)]
+
+    if partition_scheme == 'dual_pivot':
+        left_pivot_index, right_pivot_index = dual_pivot_partition_scheme(number_list, start_index_of_list, end_index_of_list)
+        sublists = [(start_index_of_list, left_pivot_index - 1), (right_pivot_index + 1, end_index_of_list)]
+
+        #When both pivots are equal, every key between them is equal to the pivots too, so that sublist is already sorted
+        if number_list[left_pivot_index] != number_list[right_pivot_index]:
+            sublists.append((left_pivot_index + 1, right_pivot_index - 1))
+        return sublists
+
+    raise ValueError(f"Unknown partition scheme {partition_scheme!r}, expected one of {partition_schemes}")
+
+
+def numpy_quick_sort(number_array, start_index_of_list, end_index_of_list):
+
+    if not is_a_numeric_numpy_array(number_array):
+        return sorting_an_array_as_a_list(number_array, intro_sort, start_index_of_list, end_index_of_list)
+
+    #NaN is neither smaller than, larger than nor equal to any pivot, so the NaNs are moved to the end first, and only the numbers
+    #before them are partitioned
+    end_index_of_list = moving_nans_to_the_end(number_array, start_index_of_list, end_index_of_list)
+
+    #Vectorized 3-way partitioning: every partition step picks out the keys smaller than, equal to and larger than the pivot with
+    #boolean masks over the whole sublist at once. The smaller sublist is pushed last, so it is sorted first and the stack stays short
+    stack = [(start_index_of_list, end_index_of_list)]
+
+    while stack:
+        start_index, end_index = stack.pop()
+
+        if end_index - start_index + 1 <= insertion_sort_cutoff:
+            insertion_sort(number_array, start_index, end_index)
+            continue
+
+        sublist = number_array[start_index:end_index + 1]
+        pivot = sublist[median_of_three(sublist, 0, len(sublist) // 2, len(sublist) - 1)]
+
+        #The keys equal to the pivot are written back as they are, not as copies of the pivot (e.g. -0.0 and 0.0 are equal but not the same)
+        smaller_keys = sublist[sublist < pivot]
+        equal_keys = sublist[sublist == pivot]
+        larger_keys = sublist[sublist > pivot]
+        sublist[:len(smaller_keys)] = smaller_keys
+        sublist[len(smaller_keys):len(smaller_keys) + len(equal_keys)] = equal_keys
+        sublist[len(sublist) - len(larger_keys):] = larger_keys
+
+        sublists = [(start_index, start_index + len(smaller_keys) - 1), (end_index - len(larger_keys) + 1, end_index)]
+        if len(smaller_keys) < len(larger_keys):
+            sublists.reverse()
+        stack.extend(sublists)
+
+
+def checking_the_partition_scheme_of_an_array(partition_scheme):
+    if partition_scheme != 'hoare':
+        raise ValueError(f"NumPy arrays are always sorted with a vectorized 3-way partition, so partition scheme {partition_scheme!r} "
+                         f"cannot be used with them (leave it as 'hoare', or sort a list instead)")
+
+
+def quick_sort(number_list, start_index_of_list, end_index_of_list, partition_scheme='hoare', key=None, reverse=False):
+
+    if key is not None or reverse:
+        return sorting_with_a_key(number_list, key, reverse,
+                                  lambda decorated_list: quick_sort(decorated_list, 0, len(decorated_list) - 1, partition_scheme),
+                                  start_index_of_list, end_index_of_list)
+
+    #The Quick Sort Algorithm runs as the Intro Sort Algorithm: a median-of-three or ninther pivot instead of always the first element,
+    #an explicit stack instead of recursion, and the Heap Sort Algorithm once the pivots keep being bad, so sorted, reverse-sorted and
+    #duplicate-heavy lists are O(n log n) too, and no recursion limit is ever hit. 'partition_scheme' can be 'hoare', 'lomuto',
+    #'three_way' (best for lists with many duplicates) or 'dual_pivot'
+    return intro_sort(number_list, start_index_of_list, end_index_of_list, partition_scheme)
+
+
+def median_of_three(number_list, a, b, c):
+    if number_list[a] < number_list[b]:
+        if number_list[b] < number_list[c]:
+            return b
+        return c if number_list[a] < number_list[c] else a
+
+    if number_list[a] < number_list[c]:
+        return a
+    return c if number_list[b] < number_list[c] else b
+
+
+def choosing_a_pivot_index(number_list, start_index_of_list, end_index_of_list):
+
+    middle_index = (start_index_of_list + end_index_of_list) // 2
+    size = end_index_of_list - start_index_of_list + 1
+
+    if size < ninther_cutoff:
+        return median_of_three(number_list, start_index_of_list, middle_index, end_index_of_list)
+
+    #Tukey's ninther: the median of the medians of three evenly spaced groups of three elements
+    eighth = size // 8
+    return median_of_three(number_list,
+                           median_of_three(number_list, start_index_of_list, start_index_of_list + eighth, start_index_of_list + 2 * eighth),
+                           median_of_three(number_list, middle_index - eighth, middle_index, middle_index + eighth),
+                           median_of_three(number_list, end_index_of_list - 2 * eighth, end_index_of_list - eighth, end_index_of_list))
+
+
+def sift_down(number_list, start_index_of_heap, root_index, end_index_of_heap):
+
+    #'root_index' and 'end_index_of_heap' are positions within the heap, which starts at 'start_index_of_heap' in the list
+    while True:
+        child_index = 2 * root_index + 1
+        if child_index > end_index_of_heap:
+            return
+
+        if child_index + 1 <= end_index_of_heap and number_list[start_index_of_heap + child_index] < number_list[start_index_of_heap + child_index + 1]:
+            child_index += 1
+
+        if number_list[start_index_of_heap + root_index] < number_list[start_index_of_heap + child_index]:
+            swapping_two_elements_in_a_list(start_index_of_heap + root_index, start_index_of_heap + child_index, number_list)
+            root_index = child_index
+        else:
+            return
+
+
+def heap_sort(number_list, start_index_of_list=0, end_index_of_list=None):
+
+    if end_index_of_list is None:
+        end_index_of_list = len(number_list) - 1
+
+    end_index_of_heap = end_index_of_list - start_index_of_list
+
+    for root_index in range((end_index_of_heap - 1) // 2, -1, -1):
+        sift_down(number_list, start_index_of_list, root_index, end_index_of_heap)
+
+    while end_index_of_heap > 0:
+        swapping_two_elements_in_a_list(start_index_of_list, start_index_of_list + end_index_of_heap, number_list)
+        end_index_of_heap -= 1
+        sift_down(number_list, start_index_of_list, 0, end_index_of_heap)
+
+
+def placing_the_pivots(number_list, start_index_of_list, end_index_of_list, partition_scheme):
+
+    #Moves the chosen pivot(s) to where the partition scheme expects them
+    if partition_scheme == 'lomuto':
+        pivot_index = choosing_a_pivot_index(number_list, start_index_of_list, end_index_of_list)
+        swapping_two_elements_in_a_list(end_index_of_list, pivot_index, number_list)
+
+    elif partition_scheme == 'dual_pivot':
+        third = (end_index_of_list - start_index_of_list + 1) // 3
+        swapping_two_elements_in_a_list(start_index_of_list, start_index_of_list + third, number_list)
+        swapping_two_elements_in_a_list(end_index_of_list, end_index_of_list - third, number_list)
+
+    else:
+        pivot_index = choosing_a_pivot_index(number_list, start_index_of_list, end_index_of_list)
+        swapping_two_elements_in_a_list(start_index_of_list, pivot_index, number_list)
+
+
+def intro_sort(number_list, start_index_of_list=0, end_index_of_list=None, partition_scheme='hoare'):
+
+    if end_index_of_list is None:
+        end_index_of_list = len(number_list) - 1
+
+    if is_a_numpy_array(number_list):
+        checking_the_partition_scheme_of_an_array(partition_scheme)
+        return numpy_quick_sort(number_list, start_index_of_list, end_index_of_list)
 
     if start_index_of_list >= end_index_of_list:
         return
 
-    else:
-        #Just change the 'hoare_partition_scheme' function here to 'lomuto_partition_scheme' function to carry out the Quick Sort Algorithm via Lomuto Partition scheme instead
-        #of via Hoare Partition scheme
-        partitioning_point = hoare_partition_scheme(number_list, start_index_of_list, end_index_of_list)
-        quick_sort(number_list, start_index_of_list, partitioning_point - 1)
-        quick_sort(number_list, partitioning_point + 1, end_index_of_list)
+    #Once a sublist has been partitioned this many times without getting small, the pivots are clearly bad and we switch to Heap Sort
+    depth_budget = 2 * int(math.log2(end_index_of_list - start_index_of_list + 1))
+
+    #An explicit stack instead of recursion. The larger partitions are pushed and the smallest one is handled first, so the stack
+    #never holds more than O(log n) sublists and no recursion limit is ever hit
+    stack = [(start_index_of_list, end_index_of_list, depth_budget)]
+
+    while stack:
+        start_index, end_index, remaining_depth = stack.pop()
+
+        while end_index - start_index + 1 > insertion_sort_cutoff and remaining_depth > 0:
+            remaining_depth -= 1
+
+            placing_the_pivots(number_list, start_index, end_index, partition_scheme)
+            sublists = partitioning_a_list(number_list, start_index, end_index, partition_scheme)
+            sublists.sort(key=lambda sublist: sublist[1] - sublist[0])
+
+            for start_index_of_sublist, end_index_of_sublist in sublists[1:]:
+                stack.append((start_index_of_sublist, end_index_of_sublist, remaining_depth))
+            start_index, end_index = sublists[0]
+
+        if end_index - start_index + 1 > insertion_sort_cutoff:
+            heap_sort(number_list, start_index, end_index)
+        else:
+            insertion_sort(number_list, start_index, end_index)
 
 
 if __name__ == '__main__':
     nums_list = [11, 9, 29, 7, 2, 15, 28]
     quick_sort(nums_list, 0, len(nums_list)-1)
     print(nums_list)
+
+    nums_list = [11, 9, 29, 7, 2, 15, 28]
+    quick_sort(nums_list, 0, len(nums_list)-1, partition_scheme='three_way')
+    print(nums_list)
+
+    quick_sort(nums_list, 0, len(nums_list)-1, reverse=True)
+    print(nums_list)
+
+    nums_list = [11, 9, 29, 7, 2, 15, 28]
+    intro_sort(nums_list)
+    print(nums_list)
@@ -1,19 +1,131 @@
-def insertion_sort(number_list):
+import bisect
+from sorting_with_a_key import sorting_with_a_key
+from optional_numpy import getting_numpy, is_a_numpy_array, is_a_numeric_numpy_array, moving_nans_to_the_end, sorting_an_array_as_a_list
 
-    for i in range(1, len(number_list)):
+
+def numpy_insertion_sort(number_array, start_index_of_list=0, end_index_of_list=None):
+    np = getting_numpy()
+
+    if not is_a_numeric_numpy_array(number_array):
+        return sorting_an_array_as_a_list(number_array, insertion_sort, start_index_of_list, end_index_of_list)
+
+    #A NaN is never smaller than the element before it, so it would never be moved
+    end_index_of_list = moving_nans_to_the_end(number_array, start_index_of_list, end_index_of_list)
+
+    for i in range(start_index_of_list + 1, end_index_of_list + 1):
+
+        anchor = number_array[i]
+
+        if not anchor < number_array[i - 1]:
+            continue
+
+        #The slot is found with a binary search, and the whole block after it is shifted right with one vectorized copy
+        j = start_index_of_list + int(np.searchsorted(number_array[start_index_of_list:i], anchor, side='right'))
+        number_array[j + 1:i + 1] = number_array[j:i]
+        number_array[j] = anchor
+
+
+def insertion_sort(number_list, start_index_of_list=0, end_index_of_list=None, key=None, reverse=False):
+
+    if key is not None or reverse:
+        return sorting_with_a_key(number_list, key, reverse, insertion_sort, start_index_of_list, end_index_of_list)
+
+    if is_a_numpy_array(number_list):
+        return numpy_insertion_sort(number_list, start_index_of_list, end_index_of_list)
+
+    if end_index_of_list is None:
+        end_index_of_list = len(number_list) - 1
+
+    for i in range(start_index_of_list + 1, end_index_of_list + 1):
 
         anchor = number_list[i]
 
         j = i - 1
  
-        while j >= 0 and anchor < number_list[j]:
+        while j >= start_index_of_list and anchor < number_list[j]:
             number_list[j + 1] = number_list[j]
             j = j - 1
 
         number_list[j + 1] = anchor
 
 
+def binary_insertion_sort(number_list, start_index_of_list=0, end_index_of_list=None, length_of_sorted_part=1):
+
+    #The first 'length_of_sorted_part' elements are already sorted (e.g. a run found by the Tim Sort Algorithm), and the rest are inserted
+    #into them one at a time. Every slot is found with a binary search (O(log i) comparisons instead of up to i), and the block of elements
+    #after the slot is shifted right by one with a single slice assignment (one memmove in C, on lists as well as on typed arrays) instead
+    #of one element at a time. It is stable, an element goes after every element equal to it
+    if is_a_numpy_array(number_list):
+        return numpy_insertion_sort(number_list, start_index_of_list, end_index_of_list)
+
+    if end_index_of_list is None:
+        end_index_of_list = len(number_list) - 1
+
+    for i in range(start_index_of_list + max(1, length_of_sorted_part), end_index_of_list + 1):
+
+        anchor = number_list[i]
+
+        #Already in order, which costs only this 1 comparison
+        if not anchor < number_list[i - 1]:
+            continue
+
+        j = bisect.bisect_right(number_list, anchor, start_index_of_list, i - 1)
+        number_list[j + 1:i + 1] = number_list[j:i]
+        number_list[j] = anchor
+
+
+def galloping_search_from_the_right(number_list, key, start_index, end_index):
+
+    #Finds the position after the last element <= 'key' in number_list[start_index:end_index] (like bisect.bisect_right). It checks
+    #positions end_index - 2, - 4, - 8, ... first and only then does a binary search within the last gap, so it only needs O(log k)
+    #comparisons when the answer is k positions from the end
+    if start_index >= end_index or not key < number_list[end_index - 1]:
+        return end_index
+
+    last_offset = 0
+    offset = 1
+    while end_index - 1 - offset >= start_index and key < number_list[end_index - 1 - offset]:
+        last_offset = offset
+        offset = offset * 2 + 1
+
+    return bisect.bisect_right(number_list, key, max(start_index, end_index - offset), end_index - 1 - last_offset)
+
+
+def galloping_insertion_sort(number_list, start_index_of_list=0, end_index_of_list=None, length_of_sorted_part=1):
+
+    #The same as 'binary_insertion_sort', but every slot is found by galloping backwards from the end of the sorted part, which takes
+    #O(log k) comparisons for an element that goes k positions back. For nearly sorted data, where most elements only go a few positions
+    #back, this is fewer comparisons than a binary search over the whole sorted part
+    if is_a_numpy_array(number_list):
+        return numpy_insertion_sort(number_list, start_index_of_list, end_index_of_list)
+
+    if end_index_of_list is None:
+        end_index_of_list = len(number_list) - 1
+
+    for i in range(start_index_of_list + max(1, length_of_sorted_part), end_index_of_list + 1):
+
+        anchor = number_list[i]
+
+        if not anchor < number_list[i - 1]:
+            continue
+
+        j = galloping_search_from_the_right(number_list, anchor, start_index_of_list, i - 1)
+        number_list[j + 1:i + 1] = number_list[j:i]
+        number_list[j] = anchor
+
+
 if __name__ == '__main__':
     nums_list = [21, 38, 29, 17, 4, 25, 11]
     insertion_sort(nums_list)
     print(nums_list)
+
+    insertion_sort(nums_list, key=lambda number: number % 10)
+    print(nums_list)
+
+    nums_list = [21, 38, 29, 17, 4, 25, 11]
+    binary_insertion_sort(nums_list)
+    print(nums_list)
+
+    nums_list = [21, 38, 29, 17, 4, 25, 11]
+    galloping_insertion_sort(nums_list)
+    print(nums_list)
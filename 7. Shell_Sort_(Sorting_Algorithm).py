@@ -1,8 +1,131 @@
-def shell_sort(number_list):
+import functools
+from sorting_with_a_key import sorting_with_a_key
+from optional_numpy import getting_numpy, is_a_numpy_array, is_a_numeric_numpy_array, moving_nans_to_the_end, sorting_an_array_as_a_list
 
-    gap = len(number_list)//2
+#The gaps of this many (gap sequence, list size) pairs are kept, so sorting many lists of the same size only computes the gaps once
+gap_cache_size = 256
 
-    while gap > 0:
+#Ciura's gaps, found experimentally to do the fewest comparisons. They are extended past 1750 by multiplying by 2.25
+ciura_gaps = (1, 4, 10, 23, 57, 132, 301, 701, 1750)
+
+gap_sequences = ['shell', 'knuth', 'sedgewick', 'tokuda', 'ciura', 'pratt']
+
+
+@functools.lru_cache(maxsize=gap_cache_size)
+def gaps_of_a_gap_sequence(gap_sequence, size):
+
+    #The gaps (largest first, always ending with 1) that Shell Sort uses for a list of 'size' elements:
+    #- 'shell': n/2, n/4, ..., 1 (Shell's original halving, O(n^2) in the worst case)
+    #- 'knuth': 1, 4, 13, 40, ... (3h + 1), up to n/3 (O(n^1.5))
+    #- 'sedgewick': 1, 8, 23, 77, 281, ... (4^k + 3 * 2^(k - 1) + 1, O(n^(4/3)))
+    #- 'tokuda': 1, 4, 9, 20, 46, 103, ... (ceil((9 * (9/4)^k - 4) / 5))
+    #- 'ciura': 1, 4, 10, 23, 57, 132, 301, 701, 1750, then x 2.25 (usually the fastest)
+    #- 'pratt': every 2^p * 3^q (O(n log^2 n) in the worst case, but with many more passes)
+    if gap_sequence not in gap_sequences:
+        raise ValueError(f"Unknown gap sequence {gap_sequence!r}, expected one of {gap_sequences}")
+
+    if size < 2:
+        return ()
+
+    if gap_sequence == 'shell':
+        gaps = []
+        gap = size // 2
+        while gap > 0:
+            gaps.append(gap)
+            gap //= 2
+        return tuple(gaps)
+
+    gaps = [1]
+
+    if gap_sequence == 'knuth':
+        while 3 * gaps[-1] + 1 <= max(1, size // 3):
+            gaps.append(3 * gaps[-1] + 1)
+
+    elif gap_sequence == 'sedgewick':
+        k = 1
+        while 4**k + 3 * 2**(k - 1) + 1 < size:
+            gaps.append(4**k + 3 * 2**(k - 1) + 1)
+            k += 1
+
+    elif gap_sequence == 'tokuda':
+        #Computed with integers only, as the ceiling of (9 * 9^k - 4 * 4^k) / (5 * 4^k), so no gap is off by one from float rounding
+        k = 1
+        while -(-(9 * 9**k - 4 * 4**k) // (5 * 4**k)) < size:
+            gaps.append(-(-(9 * 9**k - 4 * 4**k) // (5 * 4**k)))
+            k += 1
+
+    elif gap_sequence == 'ciura':
+        gaps = [gap for gap in ciura_gaps if gap < size]
+        while gaps[-1] >= ciura_gaps[-1] and int(gaps[-1] * 2.25) < size:
+            gaps.append(int(gaps[-1] * 2.25))
+
+    elif gap_sequence == 'pratt':
+        gaps = []
+        power_of_2 = 1
+        while power_of_2 < size:
+            gap = power_of_2
+            while gap < size:
+                gaps.append(gap)
+                gap *= 3
+            power_of_2 *= 2
+        gaps.sort()
+
+    return tuple(reversed(gaps))
+
+
+def numpy_shell_sort(number_array, gap_sequence='shell'):
+    np = getting_numpy()
+
+    if not is_a_numeric_numpy_array(number_array):
+        return sorting_an_array_as_a_list(number_array, lambda number_list: shell_sort(number_list, gap_sequence=gap_sequence))
+
+    number_array = number_array[:moving_nans_to_the_end(number_array) + 1]
+    size = len(number_array)
+
+    for gap in gaps_of_a_gap_sequence(gap_sequence, size):
+
+        #~~~(Start of vectorized 'gap-ed' sort for a gap iteration in Shell Sort)~~~
+
+        #Laid out as a matrix with 'gap' columns, every column is one of the 'gap-ed' sublists. The columns are all sorted at once with
+        #odd-even transposition between neighbouring rows (the end of the last row is padded with the largest element, which never
+        #moves up past the real elements)
+        number_of_rows = -(-size // gap)
+        padded_array = np.full(number_of_rows * gap, number_array.max(), dtype=number_array.dtype)
+        padded_array[:size] = number_array
+        matrix = padded_array.reshape(number_of_rows, gap)
+
+        phases_without_swaps = 0
+        phase = 0
+        while phases_without_swaps < 2 and number_of_rows > 1:
+            upper_rows = matrix[phase % 2:number_of_rows - 1:2]
+            lower_rows = matrix[phase % 2 + 1:number_of_rows:2]
+
+            out_of_order = upper_rows > lower_rows
+            if out_of_order.any():
+                smaller_elements = np.where(out_of_order, lower_rows, upper_rows)
+                larger_elements = np.where(out_of_order, upper_rows, lower_rows)
+                upper_rows[...] = smaller_elements
+                lower_rows[...] = larger_elements
+                phases_without_swaps = 0
+            else:
+                phases_without_swaps += 1
+
+            phase += 1
+
+        number_array[:] = padded_array[:size]
+
+        #~~~(End of vectorized 'gap-ed' sort for a gap iteration in Shell Sort)~~~
+
+
+def shell_sort(number_list, key=None, reverse=False, gap_sequence='shell'):
+    if key is not None or reverse:
+        return sorting_with_a_key(number_list, key, reverse, lambda decorated_list: shell_sort(decorated_list, gap_sequence=gap_sequence))
+
+    if is_a_numpy_array(number_list):
+        return numpy_shell_sort(number_list, gap_sequence)
+
+    #'gap_sequence' can be 'shell' (the default), 'knuth', 'sedgewick', 'tokuda', 'ciura' or 'pratt'
+    for gap in gaps_of_a_gap_sequence(gap_sequence, len(number_list)):
 
       
         #~~~(Start of 'gap-ed' Insertion Sort for a gap iteration in Shell Sort)~~~
@@ -22,10 +145,14 @@ def shell_sort(number_list):
         #~~~(End of 'gap-ed' Insertion Sort for a gap iteration in Shell Sort)~~~
 
 
-        gap = gap // 2
-
-
 if __name__ == '__main__':
     nums_list = [70, 3, 1, 56, 34, 12, 9, 13, 80]
     shell_sort(nums_list)
     print(nums_list)
+
+    shell_sort(nums_list, reverse=True)
+    print(nums_list)
+
+    nums_list = [70, 3, 1, 56, 34, 12, 9, 13, 80]
+    shell_sort(nums_list, gap_sequence='ciura')
+    print(nums_list)
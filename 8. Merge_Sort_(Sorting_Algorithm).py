@@ -1,6 +1,20 @@
-def merge_two_smaller_sorted_lists_to_a_merged_sorted_list(smaller_sorted_list_a, smaller_sorted_list_b, array):
+from import_algorithm_file import import_algorithm_file
+from sorting_with_a_key import sorting_with_a_key
+from optional_numpy import getting_numpy, is_a_numpy_array, is_a_numeric_numpy_array, moving_nans_to_the_end, sorting_an_array_as_a_list
 
-    i = j = k = 0
+insertion_sort = import_algorithm_file('6. Insertion_Sort_(Sorting_Algorithm).py').insertion_sort
+
+#The NumPy backend merges all pairs of runs up to this length at once with broadcast comparisons, and longer runs one pair at a time
+numpy_broadcast_merge_run_size = 8
+
+#Bottom-up Merge Sort first sorts runs of this many elements with the Insertion Sort Algorithm before it starts merging
+insertion_sort_run_size = 32
+
+
+def merge_two_smaller_sorted_lists_to_a_merged_sorted_list(smaller_sorted_list_a, smaller_sorted_list_b, array, start_index_of_array=0):
+
+    i = j = 0
+    k = start_index_of_array
 
     while i < len(smaller_sorted_list_a) and j < len(smaller_sorted_list_b):
         if smaller_sorted_list_a[i] <= smaller_sorted_list_b[j]:
@@ -23,7 +37,71 @@ def merge_two_smaller_sorted_lists_to_a_merged_sorted_list(smaller_sorted_list_a
         k += 1
 
 
-def merge_sort(array):
+def numpy_merge_sort(array):
+    np = getting_numpy()
+
+    if not is_a_numeric_numpy_array(array):
+        return sorting_an_array_as_a_list(array, bottom_up_merge_sort)
+
+    whole_array = array
+    array = array[:moving_nans_to_the_end(array) + 1]
+    size = len(array)
+
+    if size <= 1:
+        return whole_array
+
+    #Padded with the largest element up to a power of 2, so every merge pass is a whole number of equal-sized pairs of runs. The merges
+    #are stable, so the padding stays behind any real elements equal to it
+    padded_size = 1 << (size - 1).bit_length()
+    source_array = np.full(padded_size, array.max(), dtype=array.dtype)
+    source_array[:size] = array
+    destination_array = np.empty_like(source_array)
+
+    run_size = 1
+    while run_size < padded_size:
+        runs = source_array.reshape(-1, 2, run_size)
+        runs_a = runs[:, 0, :]
+        runs_b = runs[:, 1, :]
+        merged_runs = destination_array.reshape(-1, 2 * run_size)
+        positions_in_own_run = np.arange(run_size)
+
+        #Every element's position in the merged run is its position in its own run, plus the number of elements of the other run
+        #that go before it (with ties going to run a, to keep the merge stable)
+        if run_size <= numpy_broadcast_merge_run_size:
+            positions_of_run_a = positions_in_own_run + (runs_b[:, None, :] < runs_a[:, :, None]).sum(axis=2)
+            positions_of_run_b = positions_in_own_run + (runs_a[:, None, :] <= runs_b[:, :, None]).sum(axis=2)
+            pair_indices = np.arange(len(merged_runs))[:, None]
+            merged_runs[pair_indices, positions_of_run_a] = runs_a
+            merged_runs[pair_indices, positions_of_run_b] = runs_b
+
+        else:
+            for pair_index in range(len(merged_runs)):
+                run_a = runs_a[pair_index]
+                run_b = runs_b[pair_index]
+                merged_run = merged_runs[pair_index]
+
+                if run_a[-1] <= run_b[0]:
+                    merged_run[:run_size] = run_a
+                    merged_run[run_size:] = run_b
+                else:
+                    merged_run[positions_in_own_run + np.searchsorted(run_b, run_a, side='left')] = run_a
+                    merged_run[positions_in_own_run + np.searchsorted(run_a, run_b, side='right')] = run_b
+
+        source_array, destination_array = destination_array, source_array
+        run_size *= 2
+
+    array[:] = source_array[:size]
+
+    return whole_array
+
+
+def merge_sort(array, key=None, reverse=False):
+
+    if key is not None or reverse:
+        return sorting_with_a_key(array, key, reverse, merge_sort)
+
+    if is_a_numpy_array(array):
+        return numpy_merge_sort(array)
 
     if len(array) <= 1:
         return array
@@ -39,7 +117,96 @@ def merge_sort(array):
     merge_two_smaller_sorted_lists_to_a_merged_sorted_list(left_smaller_subarray, right_smaller_subarray, array)
 
 
+def merging_two_adjacent_runs(source_list, destination_list, start_index_of_run_a, start_index_of_run_b, end_index_of_run_b):
+
+    #Merges the sorted runs source_list[start_index_of_run_a:start_index_of_run_b] and source_list[start_index_of_run_b:end_index_of_run_b]
+    #into the same positions of destination_list
+    i = start_index_of_run_a
+    j = start_index_of_run_b
+    k = start_index_of_run_a
+
+    #The 2 runs are already in order, so they only need to be copied over
+    if source_list[start_index_of_run_b - 1] <= source_list[start_index_of_run_b]:
+        for k in range(start_index_of_run_a, end_index_of_run_b):
+            destination_list[k] = source_list[k]
+        return
+
+    while i < start_index_of_run_b and j < end_index_of_run_b:
+        if source_list[i] <= source_list[j]:
+            destination_list[k] = source_list[i]
+            i += 1
+
+        else:
+            destination_list[k] = source_list[j]
+            j += 1
+        k += 1
+
+    while i < start_index_of_run_b:
+        destination_list[k] = source_list[i]
+        i += 1
+        k += 1
+
+    while j < end_index_of_run_b:
+        destination_list[k] = source_list[j]
+        j += 1
+        k += 1
+
+
+def bottom_up_merge_sort(array, scratch_buffer=None):
+
+    if is_a_numpy_array(array):
+        return numpy_merge_sort(array)
+
+    size = len(array)
+
+    if size <= 1:
+        return array
+
+    #The only auxiliary list is allocated once here (or passed in by the caller, so repeated sorts allocate nothing), and every
+    #merge pass ping-pongs between it and the list being sorted instead of slicing out new sublists
+    if scratch_buffer is None:
+        scratch_buffer = [None] * size
+    elif len(scratch_buffer) < size:
+        raise ValueError(f"The scratch buffer has {len(scratch_buffer)} elements, it needs at least {size}")
+
+    for start_index_of_run in range(0, size, insertion_sort_run_size):
+        insertion_sort(array, start_index_of_run, min(start_index_of_run + insertion_sort_run_size, size) - 1)
+
+    source_list = array
+    destination_list = scratch_buffer
+    run_size = insertion_sort_run_size
+
+    while run_size < size:
+        for start_index_of_run_a in range(0, size, 2 * run_size):
+            start_index_of_run_b = min(start_index_of_run_a + run_size, size)
+            end_index_of_run_b = min(start_index_of_run_a + 2 * run_size, size)
+
+            if start_index_of_run_b == end_index_of_run_b:
+                #A leftover run without a partner to merge with, which only needs to be copied over
+                for k in range(start_index_of_run_a, end_index_of_run_b):
+                    destination_list[k] = source_list[k]
+            else:
+                merging_two_adjacent_runs(source_list, destination_list, start_index_of_run_a, start_index_of_run_b, end_index_of_run_b)
+
+        source_list, destination_list = destination_list, source_list
+        run_size *= 2
+
+    #After an odd number of merge passes, the sorted elements are in the scratch buffer
+    if source_list is not array:
+        for k in range(size):
+            array[k] = source_list[k]
+
+    return array
+
+
 if __name__ == '__main__':
     nums_list = [21, 38, 29, 17, 4, 25, 32, 9]
     merge_sort(nums_list)
     print(nums_list)
+
+    merge_sort(nums_list, reverse=True)
+    print(nums_list)
+
+    nums_list = [21, 38, 29, 17, 4, 25, 32, 9]
+    bottom_up_merge_sort(nums_list)
+    print(nums_list)
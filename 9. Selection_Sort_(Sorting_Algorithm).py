@@ -1,4 +1,30 @@
-def selection_sort(number_list):
+from sorting_with_a_key import sorting_with_a_key
+from optional_numpy import getting_numpy, is_a_numpy_array, is_a_numeric_numpy_array, moving_nans_to_the_end, sorting_an_array_as_a_list
+
+
+def numpy_selection_sort(number_array):
+    np = getting_numpy()
+
+    if not is_a_numeric_numpy_array(number_array):
+        return sorting_an_array_as_a_list(number_array, selection_sort)
+
+    #'argmin' gives back the first NaN as the minimum, so the NaNs are moved out of the way first
+    number_array = number_array[:moving_nans_to_the_end(number_array) + 1]
+    for i in range(len(number_array) - 1):
+        #The inner loop of the Selection Sort Algorithm is one vectorized 'argmin' over the unsorted part of the array
+        minimum_element_index = i + int(np.argmin(number_array[i:]))
+
+        if number_array[i] != number_array[minimum_element_index]:
+            number_array[[i, minimum_element_index]] = number_array[[minimum_element_index, i]]
+
+
+def selection_sort(number_list, key=None, reverse=False):
+    if key is not None or reverse:
+        return sorting_with_a_key(number_list, key, reverse, selection_sort)
+
+    if is_a_numpy_array(number_list):
+        return numpy_selection_sort(number_list)
+
     for i in range(len(number_list) - 1):
         minimum_element_index = i
 
@@ -14,3 +40,6 @@ if __name__ == '__main__':
     nums_list = [21, 38, 29, 17, 4, 25, 11]
     selection_sort(nums_list)
     print(nums_list)
+
+    selection_sort(nums_list, reverse=True)
+    print(nums_list)
@@ -0,0 +1,695 @@
+#This benchmark suite runs every Searching and Sorting Algorithm in this repository over seeded inputs of different shapes (random,
+#sorted, reverse sorted, few unique, organ pipe, nearly sorted and sawtooth) and a geometric sweep of sizes, with warm-up runs and
+#repeated timings, and writes the results to a JSON file. Two results files can then be compared, flagging every benchmark that got
+#slower by more than a threshold, so a change can be gated on not making any of the algorithms slower. The results can also be fitted
+#to the usual complexity classes, and checked against the Big O table in the README
+
+#Usage:
+#    python benchmark_suite.py run --output results.json
+#    python benchmark_suite.py run --output results.json --algorithms tim_sort,intro_sort --distributions random,sorted --maximum-size 4096
+#    python benchmark_suite.py compare baseline.json results.json --threshold 0.1
+#    python benchmark_suite.py fit results.json --predict-size 10000000
+#    python benchmark_suite.py run --output results.json --count-operations --algorithms quick_sort,quick_sort_lomuto
+#    python benchmark_suite.py external --file-size-mb 4096 --memory-budget-mb 256
+#    python benchmark_suite.py crossover insertion_sort binary_insertion_sort --distributions random,nearly_sorted
+#    python benchmark_suite.py startup --algorithms tim_sort,intro_sort --repeats 10
+
+import argparse
+import json
+import math
+import os
+import platform
+import re
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from time_it import TimingCollector
+from operation_counting import counting_operations
+from import_algorithm_file import import_algorithm_file
+
+linear_search_module = import_algorithm_file('1. Linear_Search_(Searching_Algorithm).py')
+iterative_binary_search_module = import_algorithm_file('2. Iterative_Binary_Search_(Searching_Algorithm).py')
+recursive_binary_search_module = import_algorithm_file('3. Recursive_Binary_Search_(Searching_Algorithm).py')
+bubble_sort_module = import_algorithm_file('4. Bubble_Sort_(Sorting_Algorithm).py')
+quick_sort_module = import_algorithm_file('5. Quick_Sort_(Sorting_Algorithm).py')
+insertion_sort_module = import_algorithm_file('6. Insertion_Sort_(Sorting_Algorithm).py')
+shell_sort_module = import_algorithm_file('7. Shell_Sort_(Sorting_Algorithm).py')
+merge_sort_module = import_algorithm_file('8. Merge_Sort_(Sorting_Algorithm).py')
+selection_sort_module = import_algorithm_file('9. Selection_Sort_(Sorting_Algorithm).py')
+tim_sort_module = import_algorithm_file('10. Tim_Sort_(Sorting_Algorithm).py')
+parallel_merge_sort_module = import_algorithm_file('11. Parallel_Merge_Sort_(Sorting_Algorithm).py')
+sorted_index_module = import_algorithm_file('12. Sorted_Index_(Searching_Algorithm).py')
+integer_sorting_module = import_algorithm_file('13. Counting_Sort_And_Radix_Sort_(Sorting_Algorithm).py')
+external_merge_sort_module = import_algorithm_file('14. External_Merge_Sort_(Sorting_Algorithm).py')
+sorted_list_module = import_algorithm_file('18. Sorted_List_(Searching_Algorithm).py')
+
+#Every searching benchmark looks up this many keys (half of them taken from the list, half of them most likely not in it)
+number_of_search_keys = 1000
+
+#Once the median time of an algorithm on a distribution goes over this, the larger sizes of that distribution are skipped for it
+maximum_seconds_per_measurement = 2.0
+
+#Benchmarks whose baseline median is below this are too short to compare reliably, and are never flagged as regressions (or fitted)
+minimum_milliseconds_to_compare = 0.05
+
+#Complexity classes from the slowest growing to the fastest growing, which the 'fit' command fits the timings to
+complexity_classes = {
+    '1': lambda n: 1.0,
+    'log n': lambda n: math.log2(n),
+    'n': lambda n: float(n),
+    'n log n': lambda n: n * math.log2(n),
+    'n^2': lambda n: float(n) ** 2,
+}
+
+readme_file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'README.md')
+
+
+#~~~(Input distributions, all of non-negative integers so the Counting Sort and LSD Radix Sort Algorithms can be run on them too)~~~
+
+def random_input(size, random_number_generator):
+    return [random_number_generator.randrange(10 * size) for i in range(size)]
+
+
+def sorted_input(size, random_number_generator):
+    return list(range(size))
+
+
+def reverse_sorted_input(size, random_number_generator):
+    return list(range(size - 1, -1, -1))
+
+
+def few_unique_input(size, random_number_generator):
+    return [random_number_generator.randrange(16) for i in range(size)]
+
+
+def organ_pipe_input(size, random_number_generator):
+    #Ascending up to the middle, then descending back down, e.g. [0, 1, 2, 3, 3, 2, 1, 0]
+    return [min(i, size - 1 - i) for i in range(size)]
+
+
+def nearly_sorted_input(size, random_number_generator):
+    #A sorted list with 1% of its elements (at least 1) swapped with another random element
+    number_list = list(range(size))
+    for i in range(max(1, size // 100)):
+        a = random_number_generator.randrange(size)
+        b = random_number_generator.randrange(size)
+        number_list[a], number_list[b] = number_list[b], number_list[a]
+    return number_list
+
+
+def sawtooth_input(size, random_number_generator):
+    #8 ascending runs one after another, e.g. [0, 1, 2, 0, 1, 2, ...]
+    run_length = max(1, size // 8)
+    return [i % run_length for i in range(size)]
+
+
+distributions = {
+    'random': random_input,
+    'sorted': sorted_input,
+    'reverse_sorted': reverse_sorted_input,
+    'few_unique': few_unique_input,
+    'organ_pipe': organ_pipe_input,
+    'nearly_sorted': nearly_sorted_input,
+    'sawtooth': sawtooth_input,
+}
+
+
+#~~~(Algorithms: every sorting algorithm is given a copy of the input, every searching algorithm a sorted copy and a list of keys)~~~
+
+def searching_every_key(searching_algorithm):
+    def searching_algorithm_over_every_key(sorted_list, keys):
+        for key in keys:
+            searching_algorithm(sorted_list, key)
+    return searching_algorithm_over_every_key
+
+
+def recursive_binary_search_over_every_key(sorted_list, keys):
+    for key in keys:
+        recursive_binary_search_module.recursive_binary_search(sorted_list, key, 0, len(sorted_list) - 1)
+
+
+def finding_every_key_in_a_sorted_structure(sorted_structure, keys):
+    #For the Sorted Index and the Sorted List, which are built from the sorted list before the timing starts
+    for key in keys:
+        sorted_structure.find(key)
+
+
+#Name -> (function, largest size it is run on, or None for every size). The O(n^2) algorithms are capped so a full sweep finishes
+sorting_algorithms = {
+    'bubble_sort': (bubble_sort_module.bubble_sort, 4096),
+    'quick_sort': (lambda number_list: quick_sort_module.quick_sort(number_list, 0, len(number_list) - 1), None),
+    'quick_sort_lomuto': (lambda number_list: quick_sort_module.quick_sort(number_list, 0, len(number_list) - 1, 'lomuto'), None),
+    'quick_sort_three_way': (lambda number_list: quick_sort_module.quick_sort(number_list, 0, len(number_list) - 1, 'three_way'), None),
+    'quick_sort_dual_pivot': (lambda number_list: quick_sort_module.quick_sort(number_list, 0, len(number_list) - 1, 'dual_pivot'), None),
+    'intro_sort': (quick_sort_module.intro_sort, None),
+    'heap_sort': (quick_sort_module.heap_sort, None),
+    'insertion_sort': (insertion_sort_module.insertion_sort, 4096),
+    'binary_insertion_sort': (insertion_sort_module.binary_insertion_sort, 65536),
+    'galloping_insertion_sort': (insertion_sort_module.galloping_insertion_sort, 65536),
+    'shell_sort': (shell_sort_module.shell_sort, None),
+    'shell_sort_knuth': (lambda number_list: shell_sort_module.shell_sort(number_list, gap_sequence='knuth'), None),
+    'shell_sort_sedgewick': (lambda number_list: shell_sort_module.shell_sort(number_list, gap_sequence='sedgewick'), None),
+    'shell_sort_tokuda': (lambda number_list: shell_sort_module.shell_sort(number_list, gap_sequence='tokuda'), None),
+    'shell_sort_ciura': (lambda number_list: shell_sort_module.shell_sort(number_list, gap_sequence='ciura'), None),
+    'shell_sort_pratt': (lambda number_list: shell_sort_module.shell_sort(number_list, gap_sequence='pratt'), None),
+    'merge_sort': (merge_sort_module.merge_sort, None),
+    'bottom_up_merge_sort': (merge_sort_module.bottom_up_merge_sort, None),
+    'selection_sort': (selection_sort_module.selection_sort, 4096),
+    'tim_sort': (tim_sort_module.tim_sort, None),
+    'parallel_merge_sort': (parallel_merge_sort_module.parallel_merge_sort, None),
+    'counting_sort': (integer_sorting_module.counting_sort, None),
+    'lsd_radix_sort': (integer_sorting_module.lsd_radix_sort, None),
+    'integer_sort': (integer_sorting_module.integer_sort, None),
+    'python_sort': (list.sort, None),
+}
+
+searching_algorithms = {
+    'linear_search': (searching_every_key(linear_search_module.linear_search), 4096),
+    'iterative_binary_search': (searching_every_key(iterative_binary_search_module.iterative_binary_search), None),
+    'recursive_binary_search': (recursive_binary_search_over_every_key, None),
+    'interpolation_search': (searching_every_key(iterative_binary_search_module.interpolation_search), None),
+    'exponential_search': (searching_every_key(iterative_binary_search_module.exponential_search), None),
+    'search': (searching_every_key(iterative_binary_search_module.search), None),
+    'batch_binary_search': (iterative_binary_search_module.batch_binary_search, None),
+    'sorted_index': (finding_every_key_in_a_sorted_structure, None),
+    'sorted_list': (finding_every_key_in_a_sorted_structure, None),
+}
+
+#Algorithms whose comparisons, swaps, writes and allocations can be counted with the 'operation_counting.py' file (the others do arithmetic
+#on the elements, or copy them out of the list into typed arrays or other processes)
+algorithms_with_operation_counts = {
+    'bubble_sort', 'quick_sort', 'quick_sort_lomuto', 'quick_sort_three_way', 'quick_sort_dual_pivot', 'intro_sort', 'heap_sort',
+    'insertion_sort', 'binary_insertion_sort', 'galloping_insertion_sort', 'shell_sort', 'shell_sort_knuth', 'shell_sort_sedgewick', 'shell_sort_tokuda', 'shell_sort_ciura', 'shell_sort_pratt',
+    'merge_sort', 'bottom_up_merge_sort', 'selection_sort', 'tim_sort',
+    'linear_search', 'iterative_binary_search', 'recursive_binary_search', 'exponential_search', 'batch_binary_search',
+}
+
+#Searching algorithms that search a structure built from the sorted list instead of the list itself. It is built before the timing starts
+preparing_the_sorted_list = {
+    'sorted_index': sorted_index_module.SortedIndex,
+    'sorted_list': sorted_list_module.SortedList,
+}
+
+
+def geometric_sizes(minimum_size, maximum_size, growth_factor):
+    sizes = []
+    size = minimum_size
+    while size <= maximum_size:
+        sizes.append(size)
+        size = int(size * growth_factor)
+    return sizes
+
+
+def counting_the_operations_of_an_algorithm(algorithm_name, number_list, keys):
+
+    #One extra run, not timed, on a counting copy of the input (or of the sorted input, for a searching algorithm)
+    if algorithm_name in sorting_algorithms:
+        return counting_operations(sorting_algorithms[algorithm_name][0], number_list).as_dict()
+    return counting_operations(searching_algorithms[algorithm_name][0], sorted(number_list), keys).as_dict()
+
+
+def benchmarking_an_algorithm(algorithm_name, number_list, keys, warmup, repeats, timing_collector):
+
+    #Every run gets a fresh copy of the input, so every run sorts the same input. The copying itself is not timed
+    if algorithm_name in sorting_algorithms:
+        sorting_algorithm = sorting_algorithms[algorithm_name][0]
+
+        for i in range(warmup + repeats):
+            number_list_copy = number_list[:]
+            if i < warmup:
+                sorting_algorithm(number_list_copy)
+                if i == 0 and number_list_copy != sorted(number_list):
+                    raise RuntimeError(f"{algorithm_name} did not sort its input")
+            else:
+                with timing_collector.timing(algorithm_name):
+                    sorting_algorithm(number_list_copy)
+
+    else:
+        searching_algorithm = searching_algorithms[algorithm_name][0]
+        sorted_list = sorted(number_list)
+        if algorithm_name in preparing_the_sorted_list:
+            sorted_list = preparing_the_sorted_list[algorithm_name](sorted_list)
+
+        for i in range(warmup + repeats):
+            if i < warmup:
+                searching_algorithm(sorted_list, keys)
+            else:
+                with timing_collector.timing(algorithm_name):
+                    searching_algorithm(sorted_list, keys)
+
+    return timing_collector.statistics()[algorithm_name]
+
+
+def running_the_benchmarks(algorithm_names, distribution_names, sizes, warmup=1, repeats=5, seed=0, count_operations=False):
+
+    results = []
+
+    for algorithm_name in algorithm_names:
+        maximum_size = {**sorting_algorithms, **searching_algorithms}[algorithm_name][1]
+
+        for distribution_name in distribution_names:
+            for size in sizes:
+                if maximum_size is not None and size > maximum_size:
+                    break
+
+                #Every (distribution, size) pair gets the same input for every algorithm, however many algorithms are run
+                random_number_generator = random.Random(f"{seed}-{distribution_name}-{size}")
+                number_list = distributions[distribution_name](size, random_number_generator)
+                keys = [number_list[random_number_generator.randrange(size)] if i % 2 == 0 else random_number_generator.randrange(10 * size)
+                        for i in range(number_of_search_keys)]
+
+                statistics = benchmarking_an_algorithm(algorithm_name, number_list, keys, warmup, repeats, TimingCollector())
+                results.append({'algorithm': algorithm_name, 'distribution': distribution_name, 'size': size, **statistics})
+                if count_operations and algorithm_name in algorithms_with_operation_counts:
+                    results[-1].update(counting_the_operations_of_an_algorithm(algorithm_name, number_list, keys))
+                print(f"{algorithm_name:<24} {distribution_name:<15} {size:>9}  median {statistics['median_ms']:.3f} ms"
+                      + ''.join(f", {results[-1][operation]} {operation}" for operation in ['comparisons', 'swaps', 'writes', 'allocations']
+                                if operation in results[-1]), flush=True)
+
+                if statistics['median_ms'] > maximum_seconds_per_measurement * 1000:
+                    break
+
+    return results
+
+
+def comparing_the_results(baseline_results, new_results, threshold):
+
+    #Matches the benchmarks in the 2 results files by (algorithm, distribution, size). A benchmark regressed if its median time went
+    #up by more than 'threshold' (e.g. 0.1 for 10%)
+    baseline_medians = {(result['algorithm'], result['distribution'], result['size']): result['median_ms'] for result in baseline_results}
+
+    comparisons = []
+    for result in new_results:
+        benchmark = (result['algorithm'], result['distribution'], result['size'])
+        if benchmark not in baseline_medians:
+            continue
+
+        baseline_median = baseline_medians[benchmark]
+        ratio = result['median_ms'] / baseline_median if baseline_median else float('inf')
+        regressed = baseline_median >= minimum_milliseconds_to_compare and ratio > 1 + threshold
+        comparisons.append({'algorithm': benchmark[0], 'distribution': benchmark[1], 'size': benchmark[2],
+                            'baseline_median_ms': baseline_median, 'new_median_ms': result['median_ms'], 'ratio': ratio,
+                            'regressed': regressed})
+
+    return comparisons
+
+
+def fitting_a_complexity_class(sizes, times):
+
+    #Fits time = c * f(n) for every complexity class f by least squares on the relative errors (so the large sizes, with their much
+    #larger times, don't drown out the small ones), and picks the class with the smallest error. Gives back (class, c, error)
+    best_fit = None
+
+    for complexity_class, f in complexity_classes.items():
+        constant = sum(f(n) / t for n, t in zip(sizes, times)) / sum((f(n) / t) ** 2 for n, t in zip(sizes, times))
+        error = sum((1 - constant * f(n) / t) ** 2 for n, t in zip(sizes, times))
+
+        if best_fit is None or error < best_fit[2]:
+            best_fit = (complexity_class, constant, error)
+
+    return best_fit
+
+
+def complexity_class_of_a_big_o_notation(big_o_notation):
+
+    #E.g. 'O(n log n)' -> 'n log n'. When there are several cases (e.g. 'O(log log n) (uniform), O(log n) (otherwise)') the worst one is
+    #taken. Other variables are taken as constants (the k in O(n + k) and the w in O(n * w))
+    classes_of_every_case = []
+    for case in re.findall(r'O\(([^)]*)\)', big_o_notation):
+        if 'n^2' in case:
+            classes_of_every_case.append('n^2')
+        elif re.search(r'n\s*log', case):
+            classes_of_every_case.append('n log n')
+        elif 'log' in case:
+            classes_of_every_case.append('log n')
+        elif 'n' in case:
+            classes_of_every_case.append('n')
+        else:
+            classes_of_every_case.append('1')
+
+    return max(classes_of_every_case, key=list(complexity_classes).index) if classes_of_every_case else None
+
+
+def documented_complexity_classes(readme_path=readme_file_path):
+
+    #Reads the time complexity column of the Big O tables in the README, e.g. '| Bottom-up Merge Sort | O(n) | O(n log n) |' ->
+    #{'bottom_up_merge_sort': 'n log n'}
+    documented_classes = {}
+
+    with open(readme_path, encoding='utf-8') as readme_file:
+        for line in readme_file:
+            cells = [cell.strip() for cell in line.strip().strip('|').split('|')]
+            if len(cells) != 3 or not cells[2].startswith('O('):
+                continue
+
+            algorithm_name = re.sub(r'[^0-9a-z]+', '_', cells[0].lower()).strip('_')
+            documented_classes[algorithm_name] = complexity_class_of_a_big_o_notation(cells[2])
+
+    return documented_classes
+
+
+def fitting_the_results(results, documented_classes):
+
+    #One fit per (algorithm, distribution). A searching benchmark times a fixed number of lookups, so its fit is the complexity of one
+    #lookup. Measurements too short to be reliable are left out, and at least 3 sizes are needed for a fit
+    timings = {}
+    for result in results:
+        if result['median_ms'] >= minimum_milliseconds_to_compare:
+            timings.setdefault((result['algorithm'], result['distribution']), []).append((result['size'], result['median_ms']))
+
+    fits = []
+    for (algorithm_name, distribution_name), sizes_and_times in timings.items():
+        if len(sizes_and_times) < 3:
+            continue
+
+        sizes, times = zip(*sorted(sizes_and_times))
+        complexity_class, constant, error = fitting_a_complexity_class(sizes, times)
+        documented_class = documented_classes.get(algorithm_name)
+        worse_than_documented = documented_class is not None and \
+            list(complexity_classes).index(complexity_class) > list(complexity_classes).index(documented_class)
+
+        fits.append({'algorithm': algorithm_name, 'distribution': distribution_name, 'complexity_class': complexity_class,
+                     'constant_ms': constant, 'error': error, 'documented_class': documented_class,
+                     'worse_than_documented': worse_than_documented})
+
+    return fits
+
+
+def finding_the_crossover_sizes(results, baseline_algorithm_name, candidate_algorithm_name):
+
+    #For every distribution, the smallest size from which the candidate algorithm is faster than the baseline algorithm at that size and
+    #at every larger size measured, or None if it never is (e.g. the size from which Binary Insertion Sort beats Insertion Sort)
+    medians = {(result['algorithm'], result['distribution'], result['size']): result['median_ms'] for result in results}
+    crossover_sizes = {}
+
+    for distribution_name in dict.fromkeys(result['distribution'] for result in results):
+        sizes = sorted(size for algorithm_name, distribution, size in medians
+                       if algorithm_name == baseline_algorithm_name and distribution == distribution_name
+                       and (candidate_algorithm_name, distribution_name, size) in medians)
+
+        crossover_sizes[distribution_name] = None
+        for size in reversed(sizes):
+            if medians[(candidate_algorithm_name, distribution_name, size)] >= medians[(baseline_algorithm_name, distribution_name, size)]:
+                break
+            crossover_sizes[distribution_name] = size
+
+    return crossover_sizes
+
+
+#~~~(Startup benchmark: the cost of importing the 'searching_and_sorting_algorithms' package and of the first call of every algorithm)~~~
+
+#Algorithms of the package that sort a whole list given on its own, which the startup benchmark times the first call of
+startup_algorithms = ['bubble_sort', 'intro_sort', 'heap_sort', 'insertion_sort', 'binary_insertion_sort', 'galloping_insertion_sort',
+                      'shell_sort', 'merge_sort', 'bottom_up_merge_sort', 'selection_sort', 'tim_sort', 'counting_sort', 'lsd_radix_sort',
+                      'integer_sort', 'argsort']
+
+#Run in a new Python process for every measurement, so nothing is already imported or compiled into memory. Prints the nanoseconds taken
+#by importing the package, by the first use of the algorithm (which loads its algorithm file, and the files that one reuses), and by the
+#first and the second call of the algorithm on a copy of the same list
+startup_measurement_code = '''
+import json
+import time
+
+start_time = time.perf_counter_ns()
+import searching_and_sorting_algorithms
+import_time = time.perf_counter_ns() - start_time
+
+number_list = searching_and_sorting_algorithms.loading_a_fixture('large_unsorted_list_for_sorting')[:{size}]
+
+start_time = time.perf_counter_ns()
+algorithm = searching_and_sorting_algorithms.{algorithm_name}
+loading_time = time.perf_counter_ns() - start_time
+
+call_times = []
+for i in range(2):
+    number_list_copy = number_list[:]
+    start_time = time.perf_counter_ns()
+    algorithm(number_list_copy)
+    call_times.append(time.perf_counter_ns() - start_time)
+
+print(json.dumps([import_time, loading_time, *call_times]))
+'''
+
+
+def measuring_the_startup_of_an_algorithm(algorithm_name, size):
+    completed_process = subprocess.run([sys.executable, '-c', startup_measurement_code.format(algorithm_name=algorithm_name, size=size)],
+                                       cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, check=True)
+    return json.loads(completed_process.stdout)
+
+
+def benchmarking_the_startup(algorithm_names, size, warmup, repeats):
+
+    #The medians over 'repeats' new processes per algorithm. The warm-up processes are not timed, they only write the compiled
+    #bytecode of every file into the '__pycache__' folders, like any earlier run would have
+    timing_collector = TimingCollector()
+
+    for algorithm_name in algorithm_names:
+        for i in range(warmup):
+            measuring_the_startup_of_an_algorithm(algorithm_name, size)
+
+        for i in range(repeats):
+            import_time, loading_time, first_call_time, second_call_time = measuring_the_startup_of_an_algorithm(algorithm_name, size)
+            timing_collector.record("import searching_and_sorting_algorithms", import_time)
+            timing_collector.record(f"{algorithm_name} (first use)", loading_time)
+            timing_collector.record(f"{algorithm_name} (first call)", first_call_time)
+            timing_collector.record(f"{algorithm_name} (second call)", second_call_time)
+
+    return timing_collector
+
+
+def generating_a_file_of_random_integers(file_path, file_size, seed, block_size=64 * 1024 * 1024):
+
+    #Random bytes are random 64-bit integers, so the file is written a block of random bytes at a time, in constant memory
+    random_number_generator = random.Random(seed)
+    file_size -= file_size % 8
+
+    with open(file_path, 'wb') as generated_file:
+        for offset in range(0, file_size, block_size):
+            generated_file.write(random_number_generator.randbytes(min(block_size, file_size - offset)))
+
+
+def checking_a_file_is_sorted(file_path, block_size=8 * 1024 * 1024):
+
+    #Streams through the file a block at a time, checking every block is sorted and starts after the end of the previous block
+    last_number = None
+    with open(file_path, 'rb') as sorted_file:
+        while True:
+            data = sorted_file.read(block_size)
+            if not data:
+                return True
+            numbers = memoryview(data).cast('q')
+            if (last_number is not None and numbers[0] < last_number) or any(numbers[i] > numbers[i + 1] for i in range(len(numbers) - 1)):
+                return False
+            last_number = numbers[-1]
+
+
+def benchmarking_the_external_merge_sort(file_size_mb, memory_budget_mb, seed, temporary_directory, verify):
+
+    #Sorts one generated file of random 64-bit integers with buffered reads and with 'mmap' reads in the merge
+    timing_collector = TimingCollector()
+
+    with tempfile.TemporaryDirectory(dir=temporary_directory) as directory_path:
+        input_file_path = os.path.join(directory_path, 'input.bin')
+        output_file_path = os.path.join(directory_path, 'output.bin')
+
+        with timing_collector.timing(f"generating {file_size_mb} MB"):
+            generating_a_file_of_random_integers(input_file_path, file_size_mb * 1024 * 1024, seed)
+
+        for use_mmap in [False, True]:
+            name = f"external_merge_sort ({'mmap' if use_mmap else 'buffered'} reads, {memory_budget_mb} MB memory budget)"
+            with timing_collector.timing(name):
+                external_merge_sort_module.external_merge_sort(input_file_path, output_file_path, 'q', memory_budget_mb * 1024 * 1024,
+                                                               use_mmap, directory_path)
+            print(f"{name}: {file_size_mb / (timing_collector.statistics()[name]['total_ms'] / 1000):.2f} MB/s", flush=True)
+
+            if verify and not checking_a_file_is_sorted(output_file_path):
+                raise RuntimeError(f"{name} did not sort the file")
+            os.remove(output_file_path)
+
+    print(timing_collector.report())
+
+
+def adding_the_run_arguments(parser, default_output):
+    parser.add_argument('--output', default=default_output)
+    parser.add_argument('--algorithms', default=','.join([*sorting_algorithms, *searching_algorithms]),
+                        help="comma separated algorithm names (default: every algorithm)")
+    parser.add_argument('--distributions', default=','.join(distributions),
+                        help="comma separated distribution names (default: every distribution)")
+    parser.add_argument('--minimum-size', type=int, default=16)
+    parser.add_argument('--maximum-size', type=int, default=65536)
+    parser.add_argument('--growth-factor', type=float, default=4)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--count-operations', action='store_true',
+                        help="also count the comparisons, swaps, writes and allocations of every algorithm that supports it")
+
+
+def running_the_benchmarks_from_the_arguments(parser, arguments):
+
+    algorithm_names = arguments.algorithms.split(',')
+    distribution_names = arguments.distributions.split(',')
+
+    for algorithm_name in algorithm_names:
+        if algorithm_name not in sorting_algorithms and algorithm_name not in searching_algorithms:
+            parser.error(f"unknown algorithm {algorithm_name!r}")
+    for distribution_name in distribution_names:
+        if distribution_name not in distributions:
+            parser.error(f"unknown distribution {distribution_name!r}")
+
+    sizes = geometric_sizes(arguments.minimum_size, arguments.maximum_size, arguments.growth_factor)
+    results = running_the_benchmarks(algorithm_names, distribution_names, sizes, arguments.warmup, arguments.repeats, arguments.seed,
+                                     arguments.count_operations)
+
+    if arguments.output is not None:
+        with open(arguments.output, 'w') as results_file:
+            json.dump({
+                'metadata': {
+                    'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                    'python_version': platform.python_version(),
+                    'platform': platform.platform(),
+                    'seed': arguments.seed,
+                    'sizes': sizes,
+                    'warmup': arguments.warmup,
+                    'repeats': arguments.repeats,
+                    'count_operations': arguments.count_operations,
+                },
+                'results': results,
+            }, results_file, indent=4)
+
+        print(f"Wrote {len(results)} results to {arguments.output}")
+
+    return results
+
+
+def main(arguments=None):
+
+    parser = argparse.ArgumentParser(description="Benchmark suite for the Searching and Sorting Algorithms in this repository")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help="run the benchmarks and write the results to a JSON file")
+    adding_the_run_arguments(run_parser, 'benchmark_results.json')
+
+    compare_parser = subparsers.add_parser('compare', help="compare 2 results files and flag the regressions")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('new')
+    compare_parser.add_argument('--threshold', type=float, default=0.1,
+                                help="relative slowdown of the median time that counts as a regression (default: 0.1)")
+
+    fit_parser = subparsers.add_parser('fit', help="fit the results to complexity classes and check them against the README")
+    fit_parser.add_argument('results', nargs='?', help="results file to fit (default: run the benchmarks first)")
+    fit_parser.add_argument('--readme', default=readme_file_path)
+    fit_parser.add_argument('--predict-size', type=int, help="also predict the time of every algorithm at this size")
+    adding_the_run_arguments(fit_parser, None)
+
+    external_parser = subparsers.add_parser('external', help="benchmark the External Merge Sort Algorithm on a generated file")
+    external_parser.add_argument('--file-size-mb', type=int, default=2048)
+    external_parser.add_argument('--memory-budget-mb', type=int, default=256)
+    external_parser.add_argument('--temporary-directory', help="where the generated file and the runs go (default: the system temp directory)")
+    external_parser.add_argument('--seed', type=int, default=0)
+    external_parser.add_argument('--verify', action='store_true', help="check the output file is sorted")
+
+    crossover_parser = subparsers.add_parser('crossover', help="find the size from which one algorithm gets faster than another")
+    crossover_parser.add_argument('baseline_algorithm')
+    crossover_parser.add_argument('candidate_algorithm')
+    crossover_parser.add_argument('--distributions', default=','.join(distributions),
+                                  help="comma separated distribution names (default: every distribution)")
+    crossover_parser.add_argument('--minimum-size', type=int, default=2)
+    crossover_parser.add_argument('--maximum-size', type=int, default=4096)
+    crossover_parser.add_argument('--growth-factor', type=float, default=2)
+    crossover_parser.add_argument('--warmup', type=int, default=1)
+    crossover_parser.add_argument('--repeats', type=int, default=25)
+    crossover_parser.add_argument('--seed', type=int, default=0)
+
+    startup_parser = subparsers.add_parser('startup', help="time importing the package and the first call of every algorithm")
+    startup_parser.add_argument('--algorithms', default=','.join(startup_algorithms),
+                                help="comma separated algorithm names (default: every algorithm that sorts a list on its own)")
+    startup_parser.add_argument('--size', type=int, default=100, help="number of elements every first call sorts")
+    startup_parser.add_argument('--warmup', type=int, default=1)
+    startup_parser.add_argument('--repeats', type=int, default=5)
+    startup_parser.add_argument('--output', help="also write the statistics to this JSON file")
+
+    arguments = parser.parse_args(arguments)
+
+    if arguments.command == 'startup':
+        algorithm_names = arguments.algorithms.split(',')
+        for algorithm_name in algorithm_names:
+            if algorithm_name not in startup_algorithms:
+                parser.error(f"unknown algorithm {algorithm_name!r}, expected one of {startup_algorithms}")
+
+        timing_collector = benchmarking_the_startup(algorithm_names, arguments.size, arguments.warmup, arguments.repeats)
+        print(timing_collector.report())
+
+        if arguments.output is not None:
+            with open(arguments.output, 'w') as results_file:
+                json.dump(timing_collector.statistics(), results_file, indent=4)
+        return 0
+
+    if arguments.command == 'external':
+        benchmarking_the_external_merge_sort(arguments.file_size_mb, arguments.memory_budget_mb, arguments.seed,
+                                             arguments.temporary_directory, arguments.verify)
+        return 0
+
+    if arguments.command == 'crossover':
+        arguments.algorithms = f"{arguments.baseline_algorithm},{arguments.candidate_algorithm}"
+        arguments.output = None
+        arguments.count_operations = False
+        results = running_the_benchmarks_from_the_arguments(parser, arguments)
+
+        for distribution_name, crossover_size in finding_the_crossover_sizes(results, arguments.baseline_algorithm,
+                                                                              arguments.candidate_algorithm).items():
+            if crossover_size is None:
+                print(f"{distribution_name:<15} {arguments.candidate_algorithm} is never faster than {arguments.baseline_algorithm} at every larger size")
+            else:
+                print(f"{distribution_name:<15} {arguments.candidate_algorithm} is faster than {arguments.baseline_algorithm} from {crossover_size} elements")
+        return 0
+
+    if arguments.command == 'run':
+        running_the_benchmarks_from_the_arguments(parser, arguments)
+        return 0
+
+    if arguments.command == 'fit':
+        if arguments.results is not None:
+            with open(arguments.results) as results_file:
+                results = json.load(results_file)['results']
+        else:
+            results = running_the_benchmarks_from_the_arguments(parser, arguments)
+
+        fits = fitting_the_results(results, documented_complexity_classes(arguments.readme))
+
+        for fit in fits:
+            line = (f"{fit['algorithm']:<24} {fit['distribution']:<15} O({fit['complexity_class']})".ljust(52)
+                    + f" c = {fit['constant_ms'] * 1e6:.3g} ns, documented O({fit['documented_class'] or '?'})")
+            if arguments.predict_size is not None:
+                predicted_ms = fit['constant_ms'] * complexity_classes[fit['complexity_class']](arguments.predict_size)
+                line += f", {predicted_ms:.3f} ms predicted at n = {arguments.predict_size}"
+            if fit['worse_than_documented']:
+                line += "  WARNING: worse than documented"
+            print(line)
+
+        print(f"{sum(fit['worse_than_documented'] for fit in fits)} of {len(fits)} fits are worse than the documented complexity")
+        return 0
+
+    with open(arguments.baseline) as baseline_file:
+        baseline_results = json.load(baseline_file)['results']
+    with open(arguments.new) as new_file:
+        new_results = json.load(new_file)['results']
+
+    comparisons = comparing_the_results(baseline_results, new_results, arguments.threshold)
+
+    for comparison in comparisons:
+        print(f"{comparison['algorithm']:<24} {comparison['distribution']:<15} {comparison['size']:>9}  "
+              f"{comparison['baseline_median_ms']:>10.3f} ms -> {comparison['new_median_ms']:>10.3f} ms  {comparison['ratio']:>6.2f}x"
+              + ("  REGRESSION" if comparison['regressed'] else ""))
+
+    regressions = [comparison for comparison in comparisons if comparison['regressed']]
+    print(f"{len(regressions)} of {len(comparisons)} benchmarks regressed by more than {arguments.threshold:.0%}")
+
+    #A non-zero exit status, so a CI job running the comparison fails when anything regressed
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,62 +1,71 @@
-import time
-from time_it import time_it
+import bisect
+import os
+import random
+import tempfile
+from array import array
+from time_it import time_it, timing_collector
+import searching_and_sorting_algorithms
+from searching_and_sorting_algorithms import loading_a_fixture
 
-#Linear Search Algorithm
-@time_it
-def linear_search(numbers_list, number_to_find):
-    for index, element in enumerate(numbers_list):
-        if element == number_to_find:
-            return index
-        
-    return -1
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
+#Every Searching Algorithm below comes from the 'searching_and_sorting_algorithms' package, which loads each algorithm file the first
+#time one of its algorithms is used, and is wrapped with 'time_it' here so every call is timed
 
+#Linear Search Algorithm (from the '1. Linear_Search_(Searching_Algorithm).py' file)
+linear_search = time_it(searching_and_sorting_algorithms.linear_search)
 
-#Iterative Binary Search Algorithm
-@time_it
-def iterative_binary_search(numbers_list, number_to_find):
 
-    left_index = 0
-    right_index = len(numbers_list) - 1
-    middle_index = 0
 
-    while left_index <= right_index:
-        middle_index = (left_index + right_index) // 2
-        middle_number = numbers_list[middle_index]
+#Iterative Binary Search Algorithm (from the '2. Iterative_Binary_Search_(Searching_Algorithm).py' file)
+iterative_binary_search = time_it(searching_and_sorting_algorithms.iterative_binary_search)
 
-        if middle_number == number_to_find:
-            return middle_index
-        
-        if middle_number < number_to_find:
-            left_index = middle_index + 1
-        else:
-            right_index = middle_index - 1
 
-    return -1
 
+#Recursive Binary Search Algorithm (from the '3. Recursive_Binary_Search_(Searching_Algorithm).py' file)
+recursive_binary_search = time_it(searching_and_sorting_algorithms.recursive_binary_search)
 
 
-#Recursive Binary Search Algorithm
-# @time_it
-def recursive_binary_search(numbers_list, number_to_find, left_index, right_index):
 
-    if right_index < left_index:
-        return -1
-    
-    middle_index = (left_index + right_index) // 2
-    if middle_index >= len(numbers_list) or middle_index < 0:
-        return -1
-    middle_number = numbers_list[middle_index]
+#Search Index (a hash index built after repeated Linear Searches of the same unsorted list, from the
+#'1. Linear_Search_(Searching_Algorithm).py' file)
+SearchIndex = searching_and_sorting_algorithms.SearchIndex
 
-    if middle_number == number_to_find:
-        return middle_index
-    
-    if middle_number < number_to_find:
-        left_index = middle_index + 1
-    else:
-        right_index = middle_index - 1
 
-    return recursive_binary_search(numbers_list, number_to_find, left_index, right_index)
+
+#Batched Binary Search Algorithm (many keys per call, from the '2. Iterative_Binary_Search_(Searching_Algorithm).py' file)
+batch_binary_search = time_it(searching_and_sorting_algorithms.batch_binary_search)
+
+
+
+#Sorted Index (keys in Eytzinger order in a typed array, from the '12. Sorted_Index_(Searching_Algorithm).py' file)
+SortedIndex = searching_and_sorting_algorithms.SortedIndex
+
+
+
+#Memory Mapped Binary Search (searches a sorted file of fixed-width records without reading it into memory, from the
+#'15. Memory_Mapped_Binary_Search_(Searching_Algorithm).py' file)
+MemoryMappedSortedFile = searching_and_sorting_algorithms.MemoryMappedSortedFile
+
+
+
+#Sorted List (stays sorted under inserts, deletes and batches of inserts, from the '18. Sorted_List_(Searching_Algorithm).py' file)
+SortedList = searching_and_sorting_algorithms.SortedList
+
+
+
+#A list that counts how many times its elements are read, to count the probes a searching algorithm makes
+class ProbeCountingList(list):
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.number_of_probes = 0
+
+    def __getitem__(self, index):
+        self.number_of_probes += 1
+        return super().__getitem__(index)
 
 
 
@@ -75,20 +84,42 @@ if __name__ == '__main__':
     #Testing the searching algorithms on an unsorted List
     print("Testing the searching algorithms on a large unsorted List:")
 
-    large_unsorted_list = [6307, 9949, 4984, 6460, 4200, 4747, 3835, 8996, 2264, 5701, 9712, 2279, 1242, 7974, 6937, 747, 2259, 2725, 2505, 7770, 705, 5700, 5453, 7675, 5854, 2145, 2846, 2811, 907, 9039, 7543, 2793, 5440, 547, 2352, 132, 2714, 3002, 3999, 8984, 8933, 7000, 5932, 8327, 6939, 6282, 2481, 3720, 3731, 3647, 926, 9132, 8585, 3384, 368, 8942, 6935, 8365, 9536, 7472, 3372, 3493, 6612, 888, 8031, 2159, 8832, 5974, 4286, 9078, 1599, 9174, 429, 7366, 9680, 187, 1732, 4302, 3501, 3119, 6925, 7193, 6487, 4857, 8033, 4224, 2712, 6982, 7357, 3749, 4239, 4573, 6694, 6826, 2155, 1422, 2563, 6757, 867, 5340, 3085, 1059, 5997, 4645, 8903, 8683, 6961, 7889, 9635, 2131, 4480, 4793, 1305, 8509, 8552, 8151, 7551, 508, 8986, 2510, 4056, 6153, 2717, 9124, 3192, 4566, 6662, 8158, 3733, 455, 5503, 2175, 3305, 1991, 5859, 334, 7685, 322, 8230, 3131, 9422, 4886, 6739, 6259, 1714, 9480, 3155, 1517, 8956, 9325, 8767, 8532, 7366, 751, 3702, 9396, 515, 5424, 6985, 717, 7244, 9484, 3322, 3797, 4573, 2883, 8039, 7641, 573, 1121, 3170, 951, 2134, 9372, 9597, 3755, 151, 932, 339, 2592, 2925, 1323, 5351, 2554, 167, 2494, 9492, 2952, 1082, 631, 5952, 6865, 5436, 8564, 8327, 4827, 6197, 3367, 8047, 2977, 2183, 5989, 4843, 2224, 3827, 2501, 6996, 9813, 4951, 9899, 4247, 3335, 983, 4682, 2469, 3082, 3609, 9356, 9567, 4471, 6899, 5851, 1254, 2995, 1364, 6403, 745, 9240, 9469, 1094, 854, 8240, 6985, 5074, 4886, 4393, 9864, 692, 5729, 4919, 9985, 2077, 1904, 2520, 9637, 4472, 9672, 1356, 2716, 3456, 5301, 938, 6950, 9224, 6467, 348, 2823, 1740, 1557, 3122, 3372, 6433, 744, 5301, 6692, 1603, 2106, 7510, 7694, 7889, 4587, 309, 5905, 2609, 4393, 3667, 9901, 2749, 9804, 3179, 1283, 2415, 907, 4639, 2705, 9722, 5560, 6800, 9499, 8334, 9510, 2284, 134, 7231, 4375, 1689, 7192, 6983, 8587, 9842, 5996, 8845, 9255, 7723, 6981, 9130, 9021, 2207, 635, 1846, 1884, 1925, 7392, 6254, 4483, 5183, 769, 6307, 9949, 4984, 6460, 4200, 4747, 3835, 8996, 2264, 5701, 9712, 2279, 1242, 7974, 6937, 747, 2259, 2725, 2505, 7770, 705, 5700, 5453, 7675, 5854, 2145, 2846, 2811, 907, 9039, 7543, 2793, 5440, 547, 2352, 132, 2714, 3002, 3999, 8984, 8933, 7000, 5932, 8327, 6939, 6282, 2481, 3720, 3731, 3647, 926, 9132, 8585, 3384, 368, 8942, 6935, 8365, 9536, 7472, 3372, 3493, 6612, 888, 8031, 2159, 8832, 5974, 4286, 9078, 1599, 9174, 429, 7366, 9680, 187, 1732, 4302, 3501, 3119, 6925, 7193, 6487, 4857, 8033, 4224, 2712, 6982, 7357, 3749, 4239, 4573, 6694, 6826, 2155, 1422, 2563, 6757, 867, 5340, 3085, 1059, 5997, 4645, 8903, 8683, 6961, 7889, 9635, 2131, 4480, 4793, 1305, 8509, 8552, 8151, 7551, 508, 8986, 2510, 4056, 6153, 2717, 9124, 3192, 4566, 6662, 8158, 3733, 455, 5503, 2175, 3305, 1991, 5859, 334, 7685, 322, 8230, 3131, 9422, 4886, 6739, 6259, 1714, 9480, 3155, 1517, 8956, 9325, 8767, 8532, 7366, 751, 3702, 9396, 515, 5424, 6985, 717, 7244, 9484, 3322, 3797, 4573, 2883, 8039, 7641, 573, 1121, 3170, 951, 2134, 9372, 9597, 3755, 151, 932, 339, 2592, 2925, 1323, 5351, 2554, 167, 2494, 9492, 2952, 1082, 631, 5952, 6865, 5436, 8564, 8327, 4827, 6197, 3367, 8047, 2977, 2183, 5989, 4843, 2224, 3827, 2501, 6996, 9813, 4951, 9899, 4247, 3335, 983, 4682, 2469, 3082, 3609, 9356, 9567, 4471, 6899, 5851, 1254, 2995, 1364, 6403, 745, 9240, 9469, 1094, 854, 8240, 6985, 5074, 4886, 4393, 9864, 692, 5729, 4919, 9985, 2077, 1904, 2520, 9637, 4472, 9672, 1356, 2716, 3456, 5301, 938, 6950, 9224, 6467, 348, 2823, 1740, 1557, 3122, 3372, 6433, 744, 5301, 6692, 1603, 2106, 7510, 7694, 7889, 4587, 309, 5905, 2609, 4393, 3667, 9901, 2749, 9804, 3179, 1283, 2415, 907, 4639, 2705, 9722, 5560, 6800, 9499, 8334, 9510, 2284, 134, 7231, 4375, 1689, 7192, 6983, 8587, 9842, 5996, 8845, 9255, 7723, 6981, 9130, 9021, 2207, 635, 1846, 1884, 1925, 7392, 6254, 4483, 5183, 769, 6307, 9949, 4984, 6460, 4200, 4747, 3835, 8996, 2264, 5701, 9712, 2279, 1242, 7974, 6937, 747, 2259, 2725, 2505, 7770, 705, 5700, 5453, 7675, 5854, 2145, 2846, 2811, 907, 9039, 7543, 2793, 5440, 547, 2352, 132, 2714, 3002, 3999, 8984, 8933, 7000, 5932, 8327, 6939, 6282, 2481, 3720, 3731, 3647, 926, 9132, 8585, 3384, 368, 8942, 6935, 8365, 9536, 7472, 3372, 3493, 6612, 888, 8031, 2159, 8832, 5974, 4286, 9078, 1599, 9174, 429, 7366, 9680, 187, 1732, 4302, 3501, 3119, 6925, 7193, 6487, 4857, 8033, 4224, 2712, 6982, 7357, 3749, 4239, 4573, 6694, 6826, 2155, 1422, 2563, 6757, 867, 5340, 3085, 1059, 5997, 4645, 8903, 8683, 6961, 7889, 9635, 2131, 4480, 4793, 1305, 8509, 8552, 8151, 7551, 508, 8986, 2510, 4056, 6153, 2717, 9124, 3192, 4566, 6662, 8158, 3733, 455, 5503, 2175, 3305, 1991, 5859, 334, 7685, 322, 8230, 3131, 9422, 4886, 6739, 6259, 1714, 9480, 3155, 1517, 8956, 9325, 8767, 8532, 7366, 751, 3702, 9396, 515, 5424, 6985, 717, 7244, 9484, 3322, 3797, 4573, 2883, 8039, 7641, 573, 1121, 3170, 951, 2134, 9372, 9597, 3755, 151, 932, 339, 2592, 2925, 1323, 5351, 2554, 167, 2494, 9492, 2952, 1082, 631, 5952, 6865, 5436, 8564, 8327, 4827, 6197, 3367, 8047, 2977, 2183, 5989, 4843, 2224, 3827, 2501, 6996, 9813, 4951, 9899, 4247, 3335, 983, 4682, 2469, 3082, 3609, 9356, 9567, 4471, 6899, 5851, 1254, 2995, 1364, 6403, 745, 9240, 9469, 1094, 854, 8240, 6985, 5074, 4886, 4393, 9864, 692, 5729, 4919, 9985, 2077, 1904, 2520, 9637, 4472, 9672, 1356, 2716, 3456, 5301, 938, 6950, 9224, 6467, 348, 2823, 1740, 1557, 3122, 3372, 6433, 744, 5301, 6692, 1603, 2106, 7510, 7694, 7889, 4587, 309, 5905, 2609, 4393, 3667, 9901, 2749, 9804, 3179, 1283, 2415, 907, 4639, 2705, 9722, 5560, 6800, 9499, 8334, 9510, 2284, 134, 7231, 4375, 1689, 7192, 6983, 8587, 9842, 5996, 8845, 9255, 7723, 6981, 9130, 9021, 2207, 635, 1846, 1884, 1925, 7392, 6254, 4483, 5183, 769, 6307, 9949, 4984, 6460, 4200, 4747, 3835, 8996, 2264, 5701, 9712, 2279, 1242, 7974, 6937, 747, 2259, 2725, 2505, 7770, 705, 5700, 5453, 7675, 5854, 2145, 2846, 2811, 907, 9039, 7543, 2793, 5440, 547, 2352, 132, 2714, 3002, 3999, 8984, 8933, 7000, 5932, 8327, 6939, 6282, 2481, 3720, 3731, 3647, 926, 9132, 8585, 3384, 368, 8942, 6935, 8365, 9536, 7472, 3372, 3493, 6612, 888, 8031, 2159, 8832, 5974, 4286, 9078, 1599, 9174, 429, 7366, 9680, 187, 1732, 4302, 3501, 3119, 6925, 7193, 6487, 4857, 8033, 4224, 2712, 6982, 7357, 3749, 4239, 4573, 6694, 6826, 2155, 1422, 2563, 6757, 867, 5340, 3085, 1059, 5997, 4645, 8903, 8683, 6961, 7889, 9635, 2131, 4480, 4793, 1305, 8509, 8552, 8151, 7551, 508, 8986, 2510, 4056, 6153, 2717, 9124, 3192, 4566, 6662, 8158, 3733, 455, 5503, 2175, 3305, 1991, 5859, 334, 7685, 322, 8230, 3131, 9422, 4886, 6739, 6259, 1714, 9480, 3155, 1517, 8956, 9325, 8767, 8532, 7366, 751, 3702, 9396, 515, 5424, 6985, 717, 7244, 9484, 3322, 3797, 4573, 2883, 8039, 7641, 573, 1121, 3170, 951, 2134, 9372, 9597, 3755, 151, 932, 339, 2592, 2925, 1323, 5351, 2554, 167, 2494, 9492, 2952, 1082, 631, 5952, 6865, 5436, 8564, 8327, 4827, 6197, 3367, 8047, 2977, 2183, 5989, 4843, 2224, 3827, 2501, 6996, 9813, 4951, 9899, 4247, 3335, 983, 4682, 2469, 3082, 3609, 9356, 9567, 4471, 6899, 5851, 1254, 2995, 1364, 6403, 745, 9240, 9469, 1094, 854, 8240, 6985, 5074, 4886, 4393, 9864, 692, 5729, 4919, 9985, 2077, 1904, 2520, 9637, 4472, 9672, 1356, 2716, 3456, 5301, 938, 6950, 9224, 6467, 348, 2823, 1740, 1557, 3122, 3372, 6433, 744, 5301, 6692, 1603, 2106, 7510, 7694, 7889, 4587, 309, 5905, 2609, 4393, 3667, 9901, 2749, 9804, 3179, 1283, 2415, 907, 4639, 2705, 9722, 5560, 6800, 9499, 8334, 9510, 2284, 134, 7231, 4375, 1689, 7192, 6983, 8587, 9842, 5996, 8845, 9255, 7723, 6981, 9130, 9021, 2207, 635, 1846, 1884, 1925, 7392, 6254, 4483, 5183, 769, 6307, 9949, 4984, 6460, 4200, 4747, 3835, 8996, 2264, 5701, 9712, 2279, 1242, 7974, 6937, 747, 2259, 2725, 2505, 7770, 705, 5700, 5453, 7675, 5854, 2145, 2846, 2811, 907, 9039, 7543, 2793, 5440, 547, 2352, 132, 2714, 3002, 3999, 8984, 8933, 7000, 5932, 8327, 6939, 6282, 2481, 3720, 3731, 3647, 926, 9132, 8585, 3384, 368, 8942, 6935, 8365, 9536, 7472, 3372, 3493, 6612, 888, 8031, 2159, 8832, 5974, 4286, 9078, 1599, 9174, 429, 7366, 9680, 187, 1732, 4302, 3501, 3119, 6925, 7193, 6487, 4857, 8033, 4224, 2712, 6982, 7357, 3749, 4239, 4573, 6694, 6826, 2155, 1422, 2563, 6757, 867, 5340, 3085, 1059, 5997, 4645, 8903, 8683, 6961, 7889, 9635, 2131, 4480, 4793, 1305, 8509, 8552, 8151, 7551, 508, 8986, 2510, 4056, 6153, 2717, 9124, 3192, 4566, 6662, 8158, 3733, 455, 5503, 2175, 3305, 1991, 5859, 334, 7685, 322, 8230, 3131, 9422, 4886, 6739, 6259, 1714, 9480, 3155, 1517, 8956, 9325, 8767, 8532, 7366, 751, 3702, 9396, 515, 5424, 6985, 717, 7244, 9484, 3322, 3797, 4573, 2883, 8039, 7641, 573, 1121, 3170, 951, 2134, 9372, 9597, 3755, 151, 932, 339, 2592, 2925, 1323, 5351, 2554, 167, 2494, 9492, 2952, 1082, 631, 5952, 6865, 5436, 8564, 8327, 4827, 6197, 3367, 8047, 2977, 2183, 5989, 4843, 2224, 3827, 2501, 6996, 9813, 4951, 9899, 4247, 3335, 983, 4682, 2469, 3082, 3609, 9356, 9567, 4471, 6899, 5851, 1254, 2995, 1364, 6403, 745, 9240, 9469, 1094, 854, 8240, 6985, 5074, 4886, 4393, 9864, 692, 5729, 4919, 9985, 2077, 1904, 2520, 9637, 4472, 9672, 1356, 2716, 3456, 5301, 938, 6950, 9224, 6467, 348, 2823, 1740, 1557, 3122, 3372, 6433, 744, 5301, 6692, 1603, 2106, 7510, 7694, 7889, 4587, 309, 5905, 2609, 4393, 3667, 9901, 2749, 9804, 3179, 1283, 2415, 907, 4639, 2705, 9722, 5560, 6800, 9499, 8334, 9510, 2284, 134, 7231, 4375, 1689, 7192, 6983, 8587, 9842, 5996, 8845, 9255, 7723, 6981, 9130, 9021, 2207, 635, 1846, 1884, 1925, 7392, 6254, 4483, 5183, 769, 6307, 9949, 4984, 6460, 4200, 4747, 3835, 8996, 2264, 5701, 9712, 2279, 1242, 7974, 6937, 747, 2259, 2725, 2505, 7770, 705, 5700, 5453, 7675, 5854, 2145, 2846, 2811, 907, 9039, 7543, 2793, 5440, 547, 2352, 132, 2714, 3002, 3999, 8984, 8933, 7000, 5932, 8327, 6939, 6282, 2481, 3720, 3731, 3647, 926, 9132, 8585, 3384, 368, 8942, 6935, 8365, 9536, 7472, 3372, 3493, 6612, 888, 8031, 2159, 8832, 5974, 4286, 9078, 1599, 9174, 429, 7366, 9680, 187, 1732, 4302, 3501, 3119, 6925, 7193, 6487, 4857, 8033, 4224, 2712, 6982, 7357, 3749, 4239, 4573, 6694, 6826, 2155, 1422, 2563, 6757, 867, 5340, 3085, 1059, 5997, 4645, 8903, 8683, 6961, 7889, 9635, 2131, 4480, 4793, 1305, 8509, 8552, 8151, 7551, 508, 8986, 2510, 4056, 6153, 2717, 9124, 3192, 4566, 6662, 8158, 3733, 455, 5503, 2175, 3305, 1991, 5859, 334, 7685, 322, 8230, 3131, 9422, 4886, 6739, 6259, 1714, 9480, 3155, 1517, 8956, 9325, 8767, 8532, 7366, 751, 3702, 9396, 515, 5424, 6985, 717, 7244, 9484, 3322, 3797, 4573, 2883, 8039, 7641, 573, 1121, 3170, 951, 2134, 9372, 9597, 3755, 151, 932, 339, 2592, 2925, 1323, 5351, 2554, 167, 2494, 9492, 2952, 1082, 631, 5952, 6865, 5436, 8564, 8327, 4827, 6197, 3367, 8047, 2977, 2183, 5989, 4843, 2224, 3827, 2501, 6996, 9813, 4951, 9899, 4247, 3335, 983, 4682, 2469, 3082, 3609, 9356, 9567, 4471, 6899, 5851, 1254, 2995, 1364, 6403, 745, 9240, 9469, 1094, 854, 8240, 6985, 5074, 4886, 4393, 9864, 692, 5729, 4919, 9985, 2077, 1904, 2520, 9637, 4472, 9672, 1356, 2716, 3456, 5301, 938, 6950, 9224, 6467, 348, 2823, 1740, 1557, 3122, 3372, 6433, 744, 5301, 6692, 1603, 2106, 7510, 7694, 7889, 4587, 309, 5905, 2609, 4393, 3667, 9901, 2749, 9804, 3179, 1283, 2415, 907, 4639, 2705, 9722, 5560, 6800, 9499, 8334, 9510, 2284, 134, 7231, 4375, 1689, 7192, 6983, 8587, 9842, 5996, 8845, 9255, 7723, 6981, 9130, 9021, 2207, 635, 1846, 1884, 1925, 7392, 6254, 4483, 5183, 769, 696969]
+    large_unsorted_list = loading_a_fixture('large_unsorted_list_for_searching')
     index = linear_search(large_unsorted_list, 696969)
 
     #Not including the Iterative and Recursive Binary Search Algorithms here since they don't work for unsorted Lists
     # index2 = iterative_binary_search(large_unsorted_list, 10000000)
 
-    # #Manually implementing the time cuz time_it dont work for recursive functions
-    # start_time = time.time()
     # index3 = recursive_binary_search(large_unsorted_list, 10000000, 0, len(large_unsorted_list))
-    # end_time = time.time()
-    # print(recursive_binary_search.__name__ + " took " + str((end_time - start_time) * 1000) + " milliseconds")
 
     index4 = python_search_function(large_unsorted_list, 696969)
 
+    print(timing_collector.report())
+    timing_collector.reset()
+
+    print("\n")
+
+
+    #///////////////////////////////////////////////////////
+
+
+    #Testing the same unsorted List searched many times: a Linear Search every time vs. a Search Index, which builds its hash index on
+    #the first search and answers every later search from it
+    print("Testing 1000 searches on the same large unsorted List:")
+
+    numbers_to_find = random.Random(0).choices(large_unsorted_list, k=999) + [696969]
+
+    with timing_collector.timing("linear_search every time"):
+        indices = [searching_and_sorting_algorithms.linear_search(large_unsorted_list, number) for number in numbers_to_find]
+
+    with timing_collector.timing("SearchIndex.find"):
+        search_index = SearchIndex(large_unsorted_list)
+        indices = [search_index.find(number) for number in numbers_to_find]
+
+    print(timing_collector.report())
+    timing_collector.reset()
+    print(f"Search Index counters: {search_index.statistics()}")
+
     print("\n")
     
 
@@ -103,12 +134,168 @@ if __name__ == '__main__':
 
     index2 = iterative_binary_search(large_sorted_list, 1000000)
 
-    #Manually implementing the function time tracking code for Recursive Binary Search (a recursive function) since the 'time_it' decorator
-    #dosen't work for recursive functions
-    start_time = time.time()
     index3 = recursive_binary_search(large_sorted_list, 1000000, 0, len(large_sorted_list))
-    end_time = time.time()
-    print(recursive_binary_search.__name__ + " took " + str((end_time - start_time) * 1000) + " milliseconds")
 
     index4 = python_search_function(large_sorted_list, 1000000)
 
+    print(timing_collector.report())
+    timing_collector.reset()
+
+    print("\n")
+
+
+    #///////////////////////////////////////////////////////
+
+
+    #Testing many lookups against the same large sorted List, one Iterative Binary Search call per key vs. one batched call for all keys
+    print("Testing 100000 lookups on a large sorted List:")
+
+    random_number_generator = random.Random(0)
+    keys_to_find = [random_number_generator.randint(0, 2000000) for i in range(100000)]
+
+    with timing_collector.timing("iterative_binary_search (once per key)"):
+        indices = [searching_and_sorting_algorithms.iterative_binary_search(large_sorted_list, key) for key in keys_to_find]
+
+    indices2 = batch_binary_search(large_sorted_list, keys_to_find)
+
+    if np is not None:
+        large_sorted_array = np.array(large_sorted_list)
+        keys_to_find_array = np.array(keys_to_find)
+        with timing_collector.timing("batch_binary_search (NumPy backend)"):
+            indices3 = searching_and_sorting_algorithms.batch_binary_search(large_sorted_array, keys_to_find_array)
+
+    print(timing_collector.report())
+    timing_collector.reset()
+
+    print("\n")
+
+
+    #///////////////////////////////////////////////////////
+
+
+    #Testing the Sorted Index against the Iterative Binary Search Algorithm and Python's 'bisect' module over sorted Lists of growing
+    #size, with 10000 lookups each. (Sizes of 10**7 and 10**8 can be added on machines with enough memory for them)
+    print("Testing 10000 lookups on sorted Lists of growing size:")
+
+    for size in [10**3, 10**4, 10**5, 10**6]:
+        sorted_list = [2 * i for i in range(size)]
+        keys_to_find = [random_number_generator.randint(0, 2 * size) for i in range(10000)]
+
+        with timing_collector.timing("SortedIndex construction on " + str(size) + " keys"):
+            sorted_index = SortedIndex(sorted_list)
+
+        with timing_collector.timing("SortedIndex.find on " + str(size) + " keys"):
+            indices = [sorted_index.find(key) for key in keys_to_find]
+
+        with timing_collector.timing("iterative_binary_search on " + str(size) + " keys"):
+            indices2 = [searching_and_sorting_algorithms.iterative_binary_search(sorted_list, key) for key in keys_to_find]
+
+        with timing_collector.timing("bisect.bisect_left on " + str(size) + " keys"):
+            indices3 = [bisect.bisect_left(sorted_list, key) for key in keys_to_find]
+
+    print(timing_collector.report())
+    timing_collector.reset()
+
+    print("\n")
+
+
+    #///////////////////////////////////////////////////////
+
+
+    #Testing the Interpolation, Exponential and adaptive searches against the Iterative Binary Search Algorithm, on a uniformly
+    #distributed sorted List (like the large sorted List above) and on a skewed one, counting the probes as well as the time
+    for distribution_name, sorted_list in [("uniform", [i for i in range(1000001)]), ("skewed", [i * i for i in range(1000001)])]:
+        print("Testing 10000 lookups on a large " + distribution_name + " sorted List:")
+
+        probe_counting_list = ProbeCountingList(sorted_list)
+        keys_to_find = [sorted_list[random_number_generator.randrange(len(sorted_list))] for i in range(10000)]
+
+        for searching_algorithm in [searching_and_sorting_algorithms.iterative_binary_search, searching_and_sorting_algorithms.interpolation_search,
+                                    searching_and_sorting_algorithms.exponential_search, searching_and_sorting_algorithms.search]:
+            with timing_collector.timing(searching_algorithm.__name__):
+                indices = [searching_algorithm(sorted_list, key) for key in keys_to_find]
+
+            probe_counting_list.number_of_probes = 0
+            indices = [searching_algorithm(probe_counting_list, key) for key in keys_to_find]
+
+            print(searching_algorithm.__name__ + " made " + str(probe_counting_list.number_of_probes / len(keys_to_find)) + " probes per lookup")
+
+        print(timing_collector.report())
+        timing_collector.reset()
+        print("")
+
+
+    #///////////////////////////////////////////////////////
+
+
+    #Testing a sorted file of 10**7 64-bit integers on disk (80 MB), read into a list and searched with the Iterative Binary Search
+    #Algorithm vs. memory mapped and searched in place. Opening the memory mapped file does not read it, so it takes the same time
+    #however large the file is
+    print("Testing 10000 lookups on a large sorted file:")
+
+    with tempfile.TemporaryDirectory() as directory_path:
+        sorted_file_path = os.path.join(directory_path, 'sorted_numbers.bin')
+        with open(sorted_file_path, 'wb') as sorted_file:
+            for start in range(0, 2 * 10**7, 2 * 10**6):
+                array('q', range(start, start + 2 * 10**6, 2)).tofile(sorted_file)
+
+        keys_to_find = [random_number_generator.randrange(2 * 10**7) for i in range(10000)]
+
+        with timing_collector.timing("reading the file into a list"):
+            sorted_numbers = array('q')
+            with open(sorted_file_path, 'rb') as sorted_file:
+                sorted_numbers.frombytes(sorted_file.read())
+            sorted_list = sorted_numbers.tolist()
+            del sorted_numbers
+
+        with timing_collector.timing("iterative_binary_search on the list"):
+            indices = [searching_and_sorting_algorithms.iterative_binary_search(sorted_list, key) for key in keys_to_find]
+        del sorted_list
+
+        with timing_collector.timing("opening the memory mapped file"):
+            sorted_numbers_file = MemoryMappedSortedFile(sorted_file_path)
+
+        with timing_collector.timing("MemoryMappedSortedFile.find on the file"):
+            offsets = [sorted_numbers_file.find(key) for key in keys_to_find]
+
+        sorted_numbers_file.close()
+
+    print(timing_collector.report())
+    timing_collector.reset()
+
+    print("\n")
+
+
+    #///////////////////////////////////////////////////////
+
+
+    #Testing rounds of appending new numbers followed by lookups: appending to a list and sorting it again before every round of
+    #lookups with the Iterative Binary Search Algorithm vs. adding the new numbers to a Sorted List, one at a time or as one batch
+    print("Testing 1000 rounds of 10 new numbers and 10 lookups on a large sorted List:")
+
+    initial_numbers = [random_number_generator.randrange(10**9) for i in range(200000)]
+    rounds = [([random_number_generator.randrange(10**9) for i in range(10)], [random_number_generator.randrange(10**9) for i in range(10)])
+              for i in range(1000)]
+
+    with timing_collector.timing("appending, then sorting again (list.sort)"):
+        sorted_list = sorted(initial_numbers)
+        for new_numbers, keys_to_find in rounds:
+            sorted_list.extend(new_numbers)
+            sorted_list.sort()
+            indices = [searching_and_sorting_algorithms.iterative_binary_search(sorted_list, key) for key in keys_to_find]
+
+    with timing_collector.timing("SortedList.add one at a time"):
+        sorted_numbers = SortedList(initial_numbers)
+        for new_numbers, keys_to_find in rounds:
+            for number in new_numbers:
+                sorted_numbers.add(number)
+            indices = [sorted_numbers.find(key) for key in keys_to_find]
+
+    with timing_collector.timing("SortedList.extend with the batch"):
+        sorted_numbers = SortedList(initial_numbers)
+        for new_numbers, keys_to_find in rounds:
+            sorted_numbers.extend(new_numbers)
+            indices = [sorted_numbers.find(key) for key in keys_to_find]
+
+    print(timing_collector.report())
+    timing_collector.reset()
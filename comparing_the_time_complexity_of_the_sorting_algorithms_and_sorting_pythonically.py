@@ -1,261 +1,252 @@
-import sys
+import asyncio
+import os
+import random
 import time
-from time_it import time_it
+from array import array
+from time_it import time_it, timing_collector
+import searching_and_sorting_algorithms
+from searching_and_sorting_algorithms import loading_a_fixture, async_shell_sort, async_merge_sort, async_quick_sort, loop_blocking_collector
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 #About Python's recursion limit:
-#When you execute a recursive function in Python on a large input ( > 10^3 (1000)), you might encounter a 
-#“maximum recursion depth exceeded error”. This is a common error when executing algorithms such as 
-#DFS, factorial, etc. on large inputs. This is also common in competitive programming on multiple 
-#platforms when you are trying to run a recursive algorithm on various test cases. 
+#The Quick Sort Algorithm used to be recursive, and always took the first element as the pivot, so on the large sorted List below it
+#recursed once per element and needed 'sys.setrecursionlimit(10**6)' to not raise 'RecursionError: maximum recursion depth exceeded'.
+#It now runs as the Intro Sort Algorithm (ninther pivots and an explicit stack, see the '5. Quick_Sort_(Sorting_Algorithm).py' file),
+#which never goes more than O(log n) deep, so the recursion limit is left as it is
 
-#This case occurred for when we are trying to carry out Quick Sort Algorithm (recursive function) on  
-#the large sorted List (see the main code below), where the number of recursive loops created
-#exceeded 10^3 (1000), and you will get this error,
-    #'RecursionError: maximum recursion depth exceeded'
 
+#Every Sorting Algorithm below comes from the 'searching_and_sorting_algorithms' package, which loads each algorithm file the first time
+#one of its algorithms is used, and is wrapped with 'time_it' here so every call is timed
 
-#Solution to this:
-#Handling recursion limit – The “sys” module in Python provides a function called 'setrecursionlimit()'
-#to modify the recursion limit in Python. It takes one parameter, the value of the new recursion limit. 
-#By default, this value is usually 10^3. If you are dealing with large inputs, you can set it to, 10^6 
-#so that large inputs can be handled without any errors.
+#Bubble Sort Algorithm (from the '4. Bubble_Sort_(Sorting_Algorithm).py' file)
+bubble_sort = time_it(searching_and_sorting_algorithms.bubble_sort)
 
-#Source(s): https://stackoverflow.com/questions/72309971/quicksort-recursionerror (stackoverflow)
-#           https://www.geeksforgeeks.org/python-handling-recursion-limit/ (GeeksforGeeks)
 
-#Hence the reason for this line of code
-sys.setrecursionlimit(10**6)
 
+#Quick Sort Algorithm (from the '5. Quick_Sort_(Sorting_Algorithm).py' file). Pass 'lomuto' as the 4th argument to carry out the Quick
+#Sort Algorithm via Lomuto Partition scheme instead of via Hoare Partition scheme
+quick_sort = time_it(searching_and_sorting_algorithms.quick_sort)
+
+
+
+#Intro Sort Algorithm (Quick Sort with a Heap Sort fallback and an Insertion Sort cutoff, from the '5. Quick_Sort_(Sorting_Algorithm).py' file)
+intro_sort = time_it(searching_and_sorting_algorithms.intro_sort)
 
-#Bubble Sort Algorithm
-@time_it
-def bubble_sort(number_list):
-    size = len(number_list)
 
-    for i in range(size - 1):
 
-        swapped = False
-        for j in range(size - 1 - i):
+#Insertion Sort Algorithm (from the '6. Insertion_Sort_(Sorting_Algorithm).py' file)
+insertion_sort = time_it(searching_and_sorting_algorithms.insertion_sort)
 
-            if number_list[j] > number_list[j+1]:
-                temp = number_list[j]
 
-                number_list[j] = number_list[j+1]
-                number_list[j+1] = temp
-                swapped = True
 
-        if not swapped:
-            break
+#Shell Sort Algorithm (from the '7. Shell_Sort_(Sorting_Algorithm).py' file)
+shell_sort = time_it(searching_and_sorting_algorithms.shell_sort)
 
 
 
-#Quick Sort Algorithm
-def swapping_two_elements_in_a_list(a, b, array):
-    if array[a] != array[b] and a != b:
-        temp = array[a]
-        array[a] = array[b]
-        array[b] = temp
+#Merge Sort Algorithm (from the '8. Merge_Sort_(Sorting_Algorithm).py' file)
+merge_sort = time_it(searching_and_sorting_algorithms.merge_sort)
 
-def hoare_partition_scheme(number_list, start_index_of_list, end_index_of_list):
 
-    pivot_index = start_index_of_list
-    pivot = number_list[pivot_index]
 
-    start_pointer = pivot_index + 1
-    end_pointer = end_index_of_list
+#Bottom-up Merge Sort Algorithm (iterative, with a single reusable scratch buffer, from the '8. Merge_Sort_(Sorting_Algorithm).py' file)
+bottom_up_merge_sort = time_it(searching_and_sorting_algorithms.bottom_up_merge_sort)
 
-    while start_pointer <= end_pointer:
 
-        while start_pointer < len(number_list) and number_list[start_pointer] <= pivot:
-            start_pointer += 1
 
-        while number_list[end_pointer] > pivot:
-            end_pointer -= 1
+#Tim Sort Algorithm (adaptive Merge Sort over the natural runs in the list, from the '10. Tim_Sort_(Sorting_Algorithm).py' file)
+tim_sort = time_it(searching_and_sorting_algorithms.tim_sort)
 
-        if start_pointer < end_pointer:
-            swapping_two_elements_in_a_list(start_pointer, end_pointer, number_list)  
-            
-    swapping_two_elements_in_a_list(pivot_index, end_pointer, number_list)
 
-    return end_pointer
 
-def lomuto_partition_scheme(number_list, start_index_of_list, end_index_of_list):
-  
-    pivot = number_list[end_index_of_list]
-    partition_index = start_index_of_list
+#Parallel Merge Sort Algorithm (sorts chunks in worker processes and merges them, from the '11. Parallel_Merge_Sort_(Sorting_Algorithm).py' file)
+parallel_merge_sort = searching_and_sorting_algorithms.parallel_merge_sort
 
-    for i in range(start_index_of_list, end_index_of_list):
-        if number_list[i] <= pivot:
-            swapping_two_elements_in_a_list(i, partition_index, number_list)
-            partition_index += 1
 
-    swapping_two_elements_in_a_list(partition_index, end_index_of_list, number_list)
 
-    return partition_index
+#Counting Sort and LSD Radix Sort Algorithms (non-comparison sorts for integers, with 'integer_sort' picking between them and the
+#Tim Sort Algorithm from the range of the keys, from the '13. Counting_Sort_And_Radix_Sort_(Sorting_Algorithm).py' file)
+counting_sort = time_it(searching_and_sorting_algorithms.counting_sort)
+lsd_radix_sort = time_it(searching_and_sorting_algorithms.lsd_radix_sort)
+integer_sort = time_it(searching_and_sorting_algorithms.integer_sort)
 
-# @time_it
-def quick_sort(number_list, start_index_of_list, end_index_of_list):
 
-    if start_index_of_list >= end_index_of_list:
-        return
 
-    else:
-        #Just change the 'hoare_partition_scheme' function here to 'lomuto_partition_scheme' function to carry out the Quick Sort 
-        #Algorithm via Lomuto Partition scheme instead of via Hoare Partition scheme
-        partitioning_point = hoare_partition_scheme(number_list, start_index_of_list, end_index_of_list)
-        quick_sort(number_list, start_index_of_list, partitioning_point - 1)
-        quick_sort(number_list, partitioning_point + 1, end_index_of_list)
+#Selection Sort Algorithm (from the '9. Selection_Sort_(Sorting_Algorithm).py' file)
+selection_sort = time_it(searching_and_sorting_algorithms.selection_sort)
 
 
 
-#Insertion Sort Algorithm
+#Common Pythonic way to sort a list, created as a function
 @time_it
-def insertion_sort(number_list):
+def python_sort_function(number_list):
+    number_list.sort()
 
-    for i in range(1, len(number_list)):
 
-        anchor = number_list[i]
 
-        j = i - 1
- 
-        while j >= 0 and anchor < number_list[j]:
-            number_list[j + 1] = number_list[j]
-            j = j - 1
+#An asyncio task that wakes up every millisecond, and gives back the longest it ever had to wait past that millisecond for the event
+#loop, i.e. how long a sorting algorithm running on the same event loop kept every other task waiting
+async def measuring_the_longest_event_loop_delay(stop_event):
+    longest_delay = 0
+    while not stop_event.is_set():
+        start_time = time.perf_counter_ns()
+        await asyncio.sleep(0.001)
+        longest_delay = max(longest_delay, time.perf_counter_ns() - start_time - 1000000)
+    return longest_delay
 
-        number_list[j + 1] = anchor
+async def sorting_next_to_another_task(sorting_coroutine):
+    stop_event = asyncio.Event()
+    delay_task = asyncio.create_task(measuring_the_longest_event_loop_delay(stop_event))
+    await asyncio.sleep(0)
+    await sorting_coroutine
+    stop_event.set()
+    return await delay_task
 
 
 
-#Shell Sort Algorithm
-@time_it
-def shell_sort(number_list):
 
-    gap = len(number_list)//2
+if __name__ == '__main__':
+    #Testing the sorting algorithms on a large sorted List
+    print("Testing the sorting algorithms on a large sorted List:")
 
-    while gap > 0:
+    large_unsorted_list = loading_a_fixture('large_unsorted_list_for_sorting')
+    bubble_sort(large_unsorted_list)
 
-      
-        #~~~(Start of 'gap-ed' Insertion Sort for a gap iteration in Shell Sort)~~~
-        
-        for i in range(gap, len(number_list)):
+    large_unsorted_list2 = loading_a_fixture('large_unsorted_list_for_sorting')
+    quick_sort(large_unsorted_list2, 0, len(large_unsorted_list2) - 1)
 
-            anchor = number_list[i]
+    large_unsorted_list_for_intro_sort = loading_a_fixture('large_unsorted_list_for_sorting')
+    intro_sort(large_unsorted_list_for_intro_sort)
 
-            j = i - gap
+    large_unsorted_list3 = loading_a_fixture('large_unsorted_list_for_sorting')
+    insertion_sort(large_unsorted_list3)
 
-            while j >= 0 and anchor < number_list[j]:
-                number_list[j + gap] = number_list[j]
-                j -= gap
+    large_unsorted_list4 = loading_a_fixture('large_unsorted_list_for_sorting')
+    shell_sort(large_unsorted_list4)
 
-            number_list[j + gap] = anchor
+    large_unsorted_list5 = loading_a_fixture('large_unsorted_list_for_sorting')
+    merge_sort(large_unsorted_list5)
 
-        #~~~(End of 'gap-ed' Insertion Sort for a gap iteration in Shell Sort)~~~
+    large_unsorted_list_for_bottom_up_merge_sort = loading_a_fixture('large_unsorted_list_for_sorting')
+    bottom_up_merge_sort(large_unsorted_list_for_bottom_up_merge_sort)
 
+    large_unsorted_list6 = loading_a_fixture('large_unsorted_list_for_sorting')
+    selection_sort(large_unsorted_list6)
 
-        gap = gap // 2
+    large_unsorted_list7 = loading_a_fixture('large_unsorted_list_for_sorting')
+    python_sort_function(large_unsorted_list7) 
 
+    print(timing_collector.report())
+    timing_collector.reset()
 
+    print("\n")
 
-#Merge Sort Algorithm
-def merge_two_smaller_sorted_lists_to_a_merged_sorted_list(smaller_sorted_list_a, smaller_sorted_list_b, array):
 
-    i = j = k = 0
+    #//////////////////////////////////////////////////////////////////
 
-    while i < len(smaller_sorted_list_a) and j < len(smaller_sorted_list_b):
-        if smaller_sorted_list_a[i] <= smaller_sorted_list_b[j]:
-            array[k] = smaller_sorted_list_a[i]
-            i += 1
 
-        else:
-            array[k] = smaller_sorted_list_b[j]
-            j += 1
-        k += 1
+    #Testing the sorting algorithms on a large unsorted List
+    print("Testing the sorting algorithms on a large unsorted List:")
 
-    while i < len(smaller_sorted_list_a):
-        array[k] = smaller_sorted_list_a[i]
-        i += 1
-        k += 1
+    large_sorted_list = [i for i in range(10001)]
+    bubble_sort(large_sorted_list)
 
-    while j < len(smaller_sorted_list_b):
-        array[k] = smaller_sorted_list_b[j]
-        j += 1
-        k += 1
+    large_sorted_list2 = [i for i in range(10001)]
+    quick_sort(large_sorted_list2, 0, len(large_sorted_list2) - 1)
 
-# @time_it
-def merge_sort(array):
+    large_sorted_list_for_intro_sort = [i for i in range(10001)]
+    intro_sort(large_sorted_list_for_intro_sort)
 
-    if len(array) <= 1:
-        return array
-    
-    middle_element_index = len(array)//2
-    
-    left_smaller_subarray = array[:middle_element_index]
-    right_smaller_subarray = array[middle_element_index:]
+    large_sorted_list3 = [i for i in range(10001)]
+    insertion_sort(large_sorted_list3)
 
-    merge_sort(left_smaller_subarray)
-    merge_sort(right_smaller_subarray)
+    large_sorted_list4 = [i for i in range(10001)]
+    shell_sort(large_sorted_list4)
 
-    merge_two_smaller_sorted_lists_to_a_merged_sorted_list(left_smaller_subarray, right_smaller_subarray, array)
+    large_sorted_list5 = [i for i in range(10001)]
+    merge_sort(large_sorted_list5)
 
+    large_sorted_list_for_bottom_up_merge_sort = [i for i in range(10001)]
+    bottom_up_merge_sort(large_sorted_list_for_bottom_up_merge_sort)
 
+    large_sorted_list6 = [i for i in range(10001)]
+    selection_sort(large_sorted_list6)
 
-#Selection Sort Algorithm
-@time_it
-def selection_sort(number_list):
-    for i in range(len(number_list) - 1):
-        minimum_element_index = i
+    large_sorted_list7 = [i for i in range(10001)]
+    python_sort_function(large_sorted_list7)     
 
-        for j in range(i + 1, len(number_list)):
-            if number_list[j] < number_list[minimum_element_index]:
-                minimum_element_index = j
 
-        if number_list[i] != number_list[minimum_element_index]:
-            number_list[i], number_list[minimum_element_index] = number_list[minimum_element_index], number_list[i]
+    print(timing_collector.report())
+    timing_collector.reset()
 
+    print("\n")
 
 
-#Common Pythonic way to sort a list, created as a function
-@time_it
-def python_sort_function(number_list):
-    number_list.sort()
+    #//////////////////////////////////////////////////////////////////
 
 
+    #Testing the Quick Sort partition schemes on a large List with very few unique values (like the large unsorted List above,
+    #which only has ~300 unique values). The Hoare and Lomuto Partition schemes send every key equal to the pivot to the same side,
+    #while the 3-way Partition scheme sets all of them aside in one go
+    print("Testing the Quick Sort partition schemes on a large duplicate-heavy List:")
 
+    random_number_generator = random.Random(0)
+    large_duplicate_heavy_list = [random_number_generator.randint(0, 300) for i in range(20000)]
 
-if __name__ == '__main__':
-    #Testing the sorting algorithms on a large sorted List
-    print("Testing the sorting algorithms on a large sorted List:")
+    for partition_scheme in searching_and_sorting_algorithms.partition_schemes:
+        large_duplicate_heavy_list_copy = large_duplicate_heavy_list[:]
+        with timing_collector.timing("quick_sort (" + partition_scheme + " partition scheme)"):
+            searching_and_sorting_algorithms.quick_sort(large_duplicate_heavy_list_copy, 0, len(large_duplicate_heavy_list_copy) - 1, partition_scheme)
 
-    large_unsorted_list = [6307, 9949, 4984, 6460, 4200, 4747, 3835, 8996, 2264, 5701, 9712, 2279, 1242, 7974, 6937, 747, 2259, 2725, 2505, 7770, 705, 5700, 5453, 7675, 5854, 2145, 2846, 2811, 907, 9039, 7543, 2793, 5440, 547, 2352, 132, 2714, 3002, 3999, 8984, 8933, 7000, 5932, 8327, 6939, 6282, 2481, 3720, 3731, 3647, 926, 9132, 8585, 3384, 368, 8942, 6935, 8365, 9536, 7472, 3372, 3493, 6612, 888, 8031, 2159, 8832, 5974, 4286, 9078, 1599, 9174, 429, 7366, 9680, 187, 1732, 4302, 3501, 3119, 6925, 7193, 6487, 4857, 8033, 4224, 2712, 6982, 7357, 3749, 4239, 4573, 6694, 6826, 2155, 1422, 2563, 6757, 867, 5340, 3085, 1059, 5997, 4645, 8903, 8683, 6961, 7889, 9635, 2131, 4480, 4793, 1305, 8509, 8552, 8151, 7551, 508, 8986, 2510, 4056, 6153, 2717, 9124, 3192, 4566, 6662, 8158, 3733, 455, 5503, 2175, 3305, 1991, 5859, 334, 7685, 322, 8230, 3131, 9422, 4886, 6739, 6259, 1714, 9480, 3155, 1517, 8956, 9325, 8767, 8532, 7366, 751, 3702, 9396, 515, 5424, 6985, 717, 7244, 9484, 3322, 3797, 4573, 2883, 8039, 7641, 573, 1121, 3170, 951, 2134, 9372, 9597, 3755, 151, 932, 339, 2592, 2925, 1323, 5351, 2554, 167, 2494, 9492, 2952, 1082, 631, 5952, 6865, 5436, 8564, 8327, 4827, 6197, 3367, 8047, 2977, 2183, 5989, 4843, 2224, 3827, 2501, 6996, 9813, 4951, 9899, 4247, 3335, 983, 4682, 2469, 3082, 3609, 9356, 9567, 4471, 6899, 5851, 1254, 2995, 1364, 6403, 745, 9240, 9469, 1094, 854, 8240, 6985, 5074, 4886, 4393, 9864, 692, 5729, 4919, 9985, 2077, 1904, 2520, 9637, 4472, 9672, 1356, 2716, 3456, 5301, 938, 6950, 9224, 6467, 348, 2823, 1740, 1557, 3122, 3372, 6433, 744, 5301, 6692, 1603, 2106, 7510, 7694, 7889, 4587, 309, 5905, 2609, 4393, 3667, 9901, 2749, 9804, 3179, 1283, 2415, 907, 4639, 2705, 9722, 5560, 6800, 9499, 8334, 9510, 2284, 134, 7231, 4375, 1689, 7192, 6983, 8587, 9842, 5996, 8845, 9255, 7723, 6981, 9130, 9021, 2207, 635, 1846, 1884, 1925, 7392, 6254, 4483, 5183, 769, 6307, 9949, 4984, 6460, 4200, 4747, 3835, 8996, 2264, 5701, 9712, 2279, 1242, 7974, 6937, 747, 2259, 2725, 2505, 7770, 705, 5700, 5453, 7675, 5854, 2145, 2846, 2811, 907, 9039, 7543, 2793, 5440, 547, 2352, 132, 2714, 3002, 3999, 8984, 8933, 7000, 5932, 8327, 6939, 6282, 2481, 3720, 3731, 3647, 926, 9132, 8585, 3384, 368, 8942, 6935, 8365, 9536, 7472, 3372, 3493, 6612, 888, 8031, 2159, 8832, 5974, 4286, 9078, 1599, 9174, 429, 7366, 9680, 187, 1732, 4302, 3501, 3119, 6925, 7193, 6487, 4857, 8033, 4224, 2712, 6982, 7357, 3749, 4239, 4573, 6694, 6826, 2155, 1422, 2563, 6757, 867, 5340, 3085, 1059, 5997, 4645, 8903, 8683, 6961, 7889, 9635, 2131, 4480, 4793, 1305, 8509, 8552, 8151, 7551, 508, 8986, 2510, 4056, 6153, 2717, 9124, 3192, 4566, 6662, 8158, 3733, 455, 5503, 2175, 3305, 1991, 5859, 334, 7685, 322, 8230, 3131, 9422, 4886, 6739, 6259, 1714, 9480, 3155, 1517, 8956, 9325, 8767, 8532, 7366, 751, 3702, 9396, 515, 5424, 6985, 717, 7244, 9484, 3322, 3797, 4573, 2883, 8039, 7641, 573, 1121, 3170, 951, 2134, 9372, 9597, 3755, 151, 932, 339, 2592, 2925, 1323, 5351, 2554, 167, 2494, 9492, 2952, 1082, 631, 5952, 6865, 5436, 8564, 8327, 4827, 6197, 3367, 8047, 2977, 2183, 5989, 4843, 2224, 3827, 2501, 6996, 9813, 4951, 9899, 4247, 3335, 983, 4682, 2469, 3082, 3609, 9356, 9567, 4471, 6899, 5851, 1254, 2995, 1364, 6403, 745, 9240, 9469, 1094, 854, 8240, 6985, 5074, 4886, 4393, 9864, 692, 5729, 4919, 9985, 2077, 1904, 2520, 9637, 4472, 9672, 1356, 2716, 3456, 5301, 938, 6950, 9224, 6467, 348, 2823, 1740, 1557, 3122, 3372, 6433, 744, 5301, 6692, 1603, 2106, 7510, 7694, 7889, 4587, 309, 5905, 2609, 4393, 3667, 9901, 2749, 9804, 3179, 1283, 2415, 907, 4639, 2705, 9722, 5560, 6800, 9499, 8334, 9510, 2284, 134, 7231, 4375, 1689, 7192, 6983, 8587, 9842, 5996, 8845, 9255, 7723, 6981, 9130, 9021, 2207, 635, 1846, 1884, 1925, 7392, 6254, 4483, 5183, 769]
-    bubble_sort(large_unsorted_list)
+    for partition_scheme in searching_and_sorting_algorithms.partition_schemes:
+        large_duplicate_heavy_list_copy = large_duplicate_heavy_list[:]
+        with timing_collector.timing("intro_sort (" + partition_scheme + " partition scheme)"):
+            searching_and_sorting_algorithms.intro_sort(large_duplicate_heavy_list_copy, partition_scheme=partition_scheme)
 
-    #Manually implementing the function time tracking code for Quick Sort (a recursive function) since the 'time_it' decorator
-    #dosen't work for recursive functions
-    large_unsorted_list2 = [6307, 9949, 4984, 6460, 4200, 4747, 3835, 8996, 2264, 5701, 9712, 2279, 1242, 7974, 6937, 747, 2259, 2725, 2505, 7770, 705, 5700, 5453, 7675, 5854, 2145, 2846, 2811, 907, 9039, 7543, 2793, 5440, 547, 2352, 132, 2714, 3002, 3999, 8984, 8933, 7000, 5932, 8327, 6939, 6282, 2481, 3720, 3731, 3647, 926, 9132, 8585, 3384, 368, 8942, 6935, 8365, 9536, 7472, 3372, 3493, 6612, 888, 8031, 2159, 8832, 5974, 4286, 9078, 1599, 9174, 429, 7366, 9680, 187, 1732, 4302, 3501, 3119, 6925, 7193, 6487, 4857, 8033, 4224, 2712, 6982, 7357, 3749, 4239, 4573, 6694, 6826, 2155, 1422, 2563, 6757, 867, 5340, 3085, 1059, 5997, 4645, 8903, 8683, 6961, 7889, 9635, 2131, 4480, 4793, 1305, 8509, 8552, 8151, 7551, 508, 8986, 2510, 4056, 6153, 2717, 9124, 3192, 4566, 6662, 8158, 3733, 455, 5503, 2175, 3305, 1991, 5859, 334, 7685, 322, 8230, 3131, 9422, 4886, 6739, 6259, 1714, 9480, 3155, 1517, 8956, 9325, 8767, 8532, 7366, 751, 3702, 9396, 515, 5424, 6985, 717, 7244, 9484, 3322, 3797, 4573, 2883, 8039, 7641, 573, 1121, 3170, 951, 2134, 9372, 9597, 3755, 151, 932, 339, 2592, 2925, 1323, 5351, 2554, 167, 2494, 9492, 2952, 1082, 631, 5952, 6865, 5436, 8564, 8327, 4827, 6197, 3367, 8047, 2977, 2183, 5989, 4843, 2224, 3827, 2501, 6996, 9813, 4951, 9899, 4247, 3335, 983, 4682, 2469, 3082, 3609, 9356, 9567, 4471, 6899, 5851, 1254, 2995, 1364, 6403, 745, 9240, 9469, 1094, 854, 8240, 6985, 5074, 4886, 4393, 9864, 692, 5729, 4919, 9985, 2077, 1904, 2520, 9637, 4472, 9672, 1356, 2716, 3456, 5301, 938, 6950, 9224, 6467, 348, 2823, 1740, 1557, 3122, 3372, 6433, 744, 5301, 6692, 1603, 2106, 7510, 7694, 7889, 4587, 309, 5905, 2609, 4393, 3667, 9901, 2749, 9804, 3179, 1283, 2415, 907, 4639, 2705, 9722, 5560, 6800, 9499, 8334, 9510, 2284, 134, 7231, 4375, 1689, 7192, 6983, 8587, 9842, 5996, 8845, 9255, 7723, 6981, 9130, 9021, 2207, 635, 1846, 1884, 1925, 7392, 6254, 4483, 5183, 769, 6307, 9949, 4984, 6460, 4200, 4747, 3835, 8996, 2264, 5701, 9712, 2279, 1242, 7974, 6937, 747, 2259, 2725, 2505, 7770, 705, 5700, 5453, 7675, 5854, 2145, 2846, 2811, 907, 9039, 7543, 2793, 5440, 547, 2352, 132, 2714, 3002, 3999, 8984, 8933, 7000, 5932, 8327, 6939, 6282, 2481, 3720, 3731, 3647, 926, 9132, 8585, 3384, 368, 8942, 6935, 8365, 9536, 7472, 3372, 3493, 6612, 888, 8031, 2159, 8832, 5974, 4286, 9078, 1599, 9174, 429, 7366, 9680, 187, 1732, 4302, 3501, 3119, 6925, 7193, 6487, 4857, 8033, 4224, 2712, 6982, 7357, 3749, 4239, 4573, 6694, 6826, 2155, 1422, 2563, 6757, 867, 5340, 3085, 1059, 5997, 4645, 8903, 8683, 6961, 7889, 9635, 2131, 4480, 4793, 1305, 8509, 8552, 8151, 7551, 508, 8986, 2510, 4056, 6153, 2717, 9124, 3192, 4566, 6662, 8158, 3733, 455, 5503, 2175, 3305, 1991, 5859, 334, 7685, 322, 8230, 3131, 9422, 4886, 6739, 6259, 1714, 9480, 3155, 1517, 8956, 9325, 8767, 8532, 7366, 751, 3702, 9396, 515, 5424, 6985, 717, 7244, 9484, 3322, 3797, 4573, 2883, 8039, 7641, 573, 1121, 3170, 951, 2134, 9372, 9597, 3755, 151, 932, 339, 2592, 2925, 1323, 5351, 2554, 167, 2494, 9492, 2952, 1082, 631, 5952, 6865, 5436, 8564, 8327, 4827, 6197, 3367, 8047, 2977, 2183, 5989, 4843, 2224, 3827, 2501, 6996, 9813, 4951, 9899, 4247, 3335, 983, 4682, 2469, 3082, 3609, 9356, 9567, 4471, 6899, 5851, 1254, 2995, 1364, 6403, 745, 9240, 9469, 1094, 854, 8240, 6985, 5074, 4886, 4393, 9864, 692, 5729, 4919, 9985, 2077, 1904, 2520, 9637, 4472, 9672, 1356, 2716, 3456, 5301, 938, 6950, 9224, 6467, 348, 2823, 1740, 1557, 3122, 3372, 6433, 744, 5301, 6692, 1603, 2106, 7510, 7694, 7889, 4587, 309, 5905, 2609, 4393, 3667, 9901, 2749, 9804, 3179, 1283, 2415, 907, 4639, 2705, 9722, 5560, 6800, 9499, 8334, 9510, 2284, 134, 7231, 4375, 1689, 7192, 6983, 8587, 9842, 5996, 8845, 9255, 7723, 6981, 9130, 9021, 2207, 635, 1846, 1884, 1925, 7392, 6254, 4483, 5183, 769]
-    start_time = time.time()
-    quick_sort(large_unsorted_list2, 0, len(large_unsorted_list2) - 1)
-    end_time = time.time()
-    print(quick_sort.__name__ + " took " + str((end_time - start_time) * 1000) + " milliseconds")
+    large_duplicate_heavy_list_copy = large_duplicate_heavy_list[:]
+    python_sort_function(large_duplicate_heavy_list_copy)
 
-    large_unsorted_list3 = [6307, 9949, 4984, 6460, 4200, 4747, 3835, 8996, 2264, 5701, 9712, 2279, 1242, 7974, 6937, 747, 2259, 2725, 2505, 7770, 705, 5700, 5453, 7675, 5854, 2145, 2846, 2811, 907, 9039, 7543, 2793, 5440, 547, 2352, 132, 2714, 3002, 3999, 8984, 8933, 7000, 5932, 8327, 6939, 6282, 2481, 3720, 3731, 3647, 926, 9132, 8585, 3384, 368, 8942, 6935, 8365, 9536, 7472, 3372, 3493, 6612, 888, 8031, 2159, 8832, 5974, 4286, 9078, 1599, 9174, 429, 7366, 9680, 187, 1732, 4302, 3501, 3119, 6925, 7193, 6487, 4857, 8033, 4224, 2712, 6982, 7357, 3749, 4239, 4573, 6694, 6826, 2155, 1422, 2563, 6757, 867, 5340, 3085, 1059, 5997, 4645, 8903, 8683, 6961, 7889, 9635, 2131, 4480, 4793, 1305, 8509, 8552, 8151, 7551, 508, 8986, 2510, 4056, 6153, 2717, 9124, 3192, 4566, 6662, 8158, 3733, 455, 5503, 2175, 3305, 1991, 5859, 334, 7685, 322, 8230, 3131, 9422, 4886, 6739, 6259, 1714, 9480, 3155, 1517, 8956, 9325, 8767, 8532, 7366, 751, 3702, 9396, 515, 5424, 6985, 717, 7244, 9484, 3322, 3797, 4573, 2883, 8039, 7641, 573, 1121, 3170, 951, 2134, 9372, 9597, 3755, 151, 932, 339, 2592, 2925, 1323, 5351, 2554, 167, 2494, 9492, 2952, 1082, 631, 5952, 6865, 5436, 8564, 8327, 4827, 6197, 3367, 8047, 2977, 2183, 5989, 4843, 2224, 3827, 2501, 6996, 9813, 4951, 9899, 4247, 3335, 983, 4682, 2469, 3082, 3609, 9356, 9567, 4471, 6899, 5851, 1254, 2995, 1364, 6403, 745, 9240, 9469, 1094, 854, 8240, 6985, 5074, 4886, 4393, 9864, 692, 5729, 4919, 9985, 2077, 1904, 2520, 9637, 4472, 9672, 1356, 2716, 3456, 5301, 938, 6950, 9224, 6467, 348, 2823, 1740, 1557, 3122, 3372, 6433, 744, 5301, 6692, 1603, 2106, 7510, 7694, 7889, 4587, 309, 5905, 2609, 4393, 3667, 9901, 2749, 9804, 3179, 1283, 2415, 907, 4639, 2705, 9722, 5560, 6800, 9499, 8334, 9510, 2284, 134, 7231, 4375, 1689, 7192, 6983, 8587, 9842, 5996, 8845, 9255, 7723, 6981, 9130, 9021, 2207, 635, 1846, 1884, 1925, 7392, 6254, 4483, 5183, 769, 6307, 9949, 4984, 6460, 4200, 4747, 3835, 8996, 2264, 5701, 9712, 2279, 1242, 7974, 6937, 747, 2259, 2725, 2505, 7770, 705, 5700, 5453, 7675, 5854, 2145, 2846, 2811, 907, 9039, 7543, 2793, 5440, 547, 2352, 132, 2714, 3002, 3999, 8984, 8933, 7000, 5932, 8327, 6939, 6282, 2481, 3720, 3731, 3647, 926, 9132, 8585, 3384, 368, 8942, 6935, 8365, 9536, 7472, 3372, 3493, 6612, 888, 8031, 2159, 8832, 5974, 4286, 9078, 1599, 9174, 429, 7366, 9680, 187, 1732, 4302, 3501, 3119, 6925, 7193, 6487, 4857, 8033, 4224, 2712, 6982, 7357, 3749, 4239, 4573, 6694, 6826, 2155, 1422, 2563, 6757, 867, 5340, 3085, 1059, 5997, 4645, 8903, 8683, 6961, 7889, 9635, 2131, 4480, 4793, 1305, 8509, 8552, 8151, 7551, 508, 8986, 2510, 4056, 6153, 2717, 9124, 3192, 4566, 6662, 8158, 3733, 455, 5503, 2175, 3305, 1991, 5859, 334, 7685, 322, 8230, 3131, 9422, 4886, 6739, 6259, 1714, 9480, 3155, 1517, 8956, 9325, 8767, 8532, 7366, 751, 3702, 9396, 515, 5424, 6985, 717, 7244, 9484, 3322, 3797, 4573, 2883, 8039, 7641, 573, 1121, 3170, 951, 2134, 9372, 9597, 3755, 151, 932, 339, 2592, 2925, 1323, 5351, 2554, 167, 2494, 9492, 2952, 1082, 631, 5952, 6865, 5436, 8564, 8327, 4827, 6197, 3367, 8047, 2977, 2183, 5989, 4843, 2224, 3827, 2501, 6996, 9813, 4951, 9899, 4247, 3335, 983, 4682, 2469, 3082, 3609, 9356, 9567, 4471, 6899, 5851, 1254, 2995, 1364, 6403, 745, 9240, 9469, 1094, 854, 8240, 6985, 5074, 4886, 4393, 9864, 692, 5729, 4919, 9985, 2077, 1904, 2520, 9637, 4472, 9672, 1356, 2716, 3456, 5301, 938, 6950, 9224, 6467, 348, 2823, 1740, 1557, 3122, 3372, 6433, 744, 5301, 6692, 1603, 2106, 7510, 7694, 7889, 4587, 309, 5905, 2609, 4393, 3667, 9901, 2749, 9804, 3179, 1283, 2415, 907, 4639, 2705, 9722, 5560, 6800, 9499, 8334, 9510, 2284, 134, 7231, 4375, 1689, 7192, 6983, 8587, 9842, 5996, 8845, 9255, 7723, 6981, 9130, 9021, 2207, 635, 1846, 1884, 1925, 7392, 6254, 4483, 5183, 769]
-    insertion_sort(large_unsorted_list3)
 
-    large_unsorted_list4 = [6307, 9949, 4984, 6460, 4200, 4747, 3835, 8996, 2264, 5701, 9712, 2279, 1242, 7974, 6937, 747, 2259, 2725, 2505, 7770, 705, 5700, 5453, 7675, 5854, 2145, 2846, 2811, 907, 9039, 7543, 2793, 5440, 547, 2352, 132, 2714, 3002, 3999, 8984, 8933, 7000, 5932, 8327, 6939, 6282, 2481, 3720, 3731, 3647, 926, 9132, 8585, 3384, 368, 8942, 6935, 8365, 9536, 7472, 3372, 3493, 6612, 888, 8031, 2159, 8832, 5974, 4286, 9078, 1599, 9174, 429, 7366, 9680, 187, 1732, 4302, 3501, 3119, 6925, 7193, 6487, 4857, 8033, 4224, 2712, 6982, 7357, 3749, 4239, 4573, 6694, 6826, 2155, 1422, 2563, 6757, 867, 5340, 3085, 1059, 5997, 4645, 8903, 8683, 6961, 7889, 9635, 2131, 4480, 4793, 1305, 8509, 8552, 8151, 7551, 508, 8986, 2510, 4056, 6153, 2717, 9124, 3192, 4566, 6662, 8158, 3733, 455, 5503, 2175, 3305, 1991, 5859, 334, 7685, 322, 8230, 3131, 9422, 4886, 6739, 6259, 1714, 9480, 3155, 1517, 8956, 9325, 8767, 8532, 7366, 751, 3702, 9396, 515, 5424, 6985, 717, 7244, 9484, 3322, 3797, 4573, 2883, 8039, 7641, 573, 1121, 3170, 951, 2134, 9372, 9597, 3755, 151, 932, 339, 2592, 2925, 1323, 5351, 2554, 167, 2494, 9492, 2952, 1082, 631, 5952, 6865, 5436, 8564, 8327, 4827, 6197, 3367, 8047, 2977, 2183, 5989, 4843, 2224, 3827, 2501, 6996, 9813, 4951, 9899, 4247, 3335, 983, 4682, 2469, 3082, 3609, 9356, 9567, 4471, 6899, 5851, 1254, 2995, 1364, 6403, 745, 9240, 9469, 1094, 854, 8240, 6985, 5074, 4886, 4393, 9864, 692, 5729, 4919, 9985, 2077, 1904, 2520, 9637, 4472, 9672, 1356, 2716, 3456, 5301, 938, 6950, 9224, 6467, 348, 2823, 1740, 1557, 3122, 3372, 6433, 744, 5301, 6692, 1603, 2106, 7510, 7694, 7889, 4587, 309, 5905, 2609, 4393, 3667, 9901, 2749, 9804, 3179, 1283, 2415, 907, 4639, 2705, 9722, 5560, 6800, 9499, 8334, 9510, 2284, 134, 7231, 4375, 1689, 7192, 6983, 8587, 9842, 5996, 8845, 9255, 7723, 6981, 9130, 9021, 2207, 635, 1846, 1884, 1925, 7392, 6254, 4483, 5183, 769, 6307, 9949, 4984, 6460, 4200, 4747, 3835, 8996, 2264, 5701, 9712, 2279, 1242, 7974, 6937, 747, 2259, 2725, 2505, 7770, 705, 5700, 5453, 7675, 5854, 2145, 2846, 2811, 907, 9039, 7543, 2793, 5440, 547, 2352, 132, 2714, 3002, 3999, 8984, 8933, 7000, 5932, 8327, 6939, 6282, 2481, 3720, 3731, 3647, 926, 9132, 8585, 3384, 368, 8942, 6935, 8365, 9536, 7472, 3372, 3493, 6612, 888, 8031, 2159, 8832, 5974, 4286, 9078, 1599, 9174, 429, 7366, 9680, 187, 1732, 4302, 3501, 3119, 6925, 7193, 6487, 4857, 8033, 4224, 2712, 6982, 7357, 3749, 4239, 4573, 6694, 6826, 2155, 1422, 2563, 6757, 867, 5340, 3085, 1059, 5997, 4645, 8903, 8683, 6961, 7889, 9635, 2131, 4480, 4793, 1305, 8509, 8552, 8151, 7551, 508, 8986, 2510, 4056, 6153, 2717, 9124, 3192, 4566, 6662, 8158, 3733, 455, 5503, 2175, 3305, 1991, 5859, 334, 7685, 322, 8230, 3131, 9422, 4886, 6739, 6259, 1714, 9480, 3155, 1517, 8956, 9325, 8767, 8532, 7366, 751, 3702, 9396, 515, 5424, 6985, 717, 7244, 9484, 3322, 3797, 4573, 2883, 8039, 7641, 573, 1121, 3170, 951, 2134, 9372, 9597, 3755, 151, 932, 339, 2592, 2925, 1323, 5351, 2554, 167, 2494, 9492, 2952, 1082, 631, 5952, 6865, 5436, 8564, 8327, 4827, 6197, 3367, 8047, 2977, 2183, 5989, 4843, 2224, 3827, 2501, 6996, 9813, 4951, 9899, 4247, 3335, 983, 4682, 2469, 3082, 3609, 9356, 9567, 4471, 6899, 5851, 1254, 2995, 1364, 6403, 745, 9240, 9469, 1094, 854, 8240, 6985, 5074, 4886, 4393, 9864, 692, 5729, 4919, 9985, 2077, 1904, 2520, 9637, 4472, 9672, 1356, 2716, 3456, 5301, 938, 6950, 9224, 6467, 348, 2823, 1740, 1557, 3122, 3372, 6433, 744, 5301, 6692, 1603, 2106, 7510, 7694, 7889, 4587, 309, 5905, 2609, 4393, 3667, 9901, 2749, 9804, 3179, 1283, 2415, 907, 4639, 2705, 9722, 5560, 6800, 9499, 8334, 9510, 2284, 134, 7231, 4375, 1689, 7192, 6983, 8587, 9842, 5996, 8845, 9255, 7723, 6981, 9130, 9021, 2207, 635, 1846, 1884, 1925, 7392, 6254, 4483, 5183, 769]
-    shell_sort(large_unsorted_list4)
+    print(timing_collector.report())
+    timing_collector.reset()
 
-    #Manually implementing the function time tracking code for Merge Sort (a recursive function) since the 'time_it' decorator
-    #dosen't work for recursive functions
-    large_unsorted_list5 = [6307, 9949, 4984, 6460, 4200, 4747, 3835, 8996, 2264, 5701, 9712, 2279, 1242, 7974, 6937, 747, 2259, 2725, 2505, 7770, 705, 5700, 5453, 7675, 5854, 2145, 2846, 2811, 907, 9039, 7543, 2793, 5440, 547, 2352, 132, 2714, 3002, 3999, 8984, 8933, 7000, 5932, 8327, 6939, 6282, 2481, 3720, 3731, 3647, 926, 9132, 8585, 3384, 368, 8942, 6935, 8365, 9536, 7472, 3372, 3493, 6612, 888, 8031, 2159, 8832, 5974, 4286, 9078, 1599, 9174, 429, 7366, 9680, 187, 1732, 4302, 3501, 3119, 6925, 7193, 6487, 4857, 8033, 4224, 2712, 6982, 7357, 3749, 4239, 4573, 6694, 6826, 2155, 1422, 2563, 6757, 867, 5340, 3085, 1059, 5997, 4645, 8903, 8683, 6961, 7889, 9635, 2131, 4480, 4793, 1305, 8509, 8552, 8151, 7551, 508, 8986, 2510, 4056, 6153, 2717, 9124, 3192, 4566, 6662, 8158, 3733, 455, 5503, 2175, 3305, 1991, 5859, 334, 7685, 322, 8230, 3131, 9422, 4886, 6739, 6259, 1714, 9480, 3155, 1517, 8956, 9325, 8767, 8532, 7366, 751, 3702, 9396, 515, 5424, 6985, 717, 7244, 9484, 3322, 3797, 4573, 2883, 8039, 7641, 573, 1121, 3170, 951, 2134, 9372, 9597, 3755, 151, 932, 339, 2592, 2925, 1323, 5351, 2554, 167, 2494, 9492, 2952, 1082, 631, 5952, 6865, 5436, 8564, 8327, 4827, 6197, 3367, 8047, 2977, 2183, 5989, 4843, 2224, 3827, 2501, 6996, 9813, 4951, 9899, 4247, 3335, 983, 4682, 2469, 3082, 3609, 9356, 9567, 4471, 6899, 5851, 1254, 2995, 1364, 6403, 745, 9240, 9469, 1094, 854, 8240, 6985, 5074, 4886, 4393, 9864, 692, 5729, 4919, 9985, 2077, 1904, 2520, 9637, 4472, 9672, 1356, 2716, 3456, 5301, 938, 6950, 9224, 6467, 348, 2823, 1740, 1557, 3122, 3372, 6433, 744, 5301, 6692, 1603, 2106, 7510, 7694, 7889, 4587, 309, 5905, 2609, 4393, 3667, 9901, 2749, 9804, 3179, 1283, 2415, 907, 4639, 2705, 9722, 5560, 6800, 9499, 8334, 9510, 2284, 134, 7231, 4375, 1689, 7192, 6983, 8587, 9842, 5996, 8845, 9255, 7723, 6981, 9130, 9021, 2207, 635, 1846, 1884, 1925, 7392, 6254, 4483, 5183, 769, 6307, 9949, 4984, 6460, 4200, 4747, 3835, 8996, 2264, 5701, 9712, 2279, 1242, 7974, 6937, 747, 2259, 2725, 2505, 7770, 705, 5700, 5453, 7675, 5854, 2145, 2846, 2811, 907, 9039, 7543, 2793, 5440, 547, 2352, 132, 2714, 3002, 3999, 8984, 8933, 7000, 5932, 8327, 6939, 6282, 2481, 3720, 3731, 3647, 926, 9132, 8585, 3384, 368, 8942, 6935, 8365, 9536, 7472, 3372, 3493, 6612, 888, 8031, 2159, 8832, 5974, 4286, 9078, 1599, 9174, 429, 7366, 9680, 187, 1732, 4302, 3501, 3119, 6925, 7193, 6487, 4857, 8033, 4224, 2712, 6982, 7357, 3749, 4239, 4573, 6694, 6826, 2155, 1422, 2563, 6757, 867, 5340, 3085, 1059, 5997, 4645, 8903, 8683, 6961, 7889, 9635, 2131, 4480, 4793, 1305, 8509, 8552, 8151, 7551, 508, 8986, 2510, 4056, 6153, 2717, 9124, 3192, 4566, 6662, 8158, 3733, 455, 5503, 2175, 3305, 1991, 5859, 334, 7685, 322, 8230, 3131, 9422, 4886, 6739, 6259, 1714, 9480, 3155, 1517, 8956, 9325, 8767, 8532, 7366, 751, 3702, 9396, 515, 5424, 6985, 717, 7244, 9484, 3322, 3797, 4573, 2883, 8039, 7641, 573, 1121, 3170, 951, 2134, 9372, 9597, 3755, 151, 932, 339, 2592, 2925, 1323, 5351, 2554, 167, 2494, 9492, 2952, 1082, 631, 5952, 6865, 5436, 8564, 8327, 4827, 6197, 3367, 8047, 2977, 2183, 5989, 4843, 2224, 3827, 2501, 6996, 9813, 4951, 9899, 4247, 3335, 983, 4682, 2469, 3082, 3609, 9356, 9567, 4471, 6899, 5851, 1254, 2995, 1364, 6403, 745, 9240, 9469, 1094, 854, 8240, 6985, 5074, 4886, 4393, 9864, 692, 5729, 4919, 9985, 2077, 1904, 2520, 9637, 4472, 9672, 1356, 2716, 3456, 5301, 938, 6950, 9224, 6467, 348, 2823, 1740, 1557, 3122, 3372, 6433, 744, 5301, 6692, 1603, 2106, 7510, 7694, 7889, 4587, 309, 5905, 2609, 4393, 3667, 9901, 2749, 9804, 3179, 1283, 2415, 907, 4639, 2705, 9722, 5560, 6800, 9499, 8334, 9510, 2284, 134, 7231, 4375, 1689, 7192, 6983, 8587, 9842, 5996, 8845, 9255, 7723, 6981, 9130, 9021, 2207, 635, 1846, 1884, 1925, 7392, 6254, 4483, 5183, 769]
-    start_time = time.time()
-    merge_sort(large_unsorted_list5)
-    end_time = time.time()
-    print(merge_sort.__name__ + " took " + str((end_time - start_time) * 1000) + " milliseconds")
+    print("\n")
 
-    large_unsorted_list6 = [6307, 9949, 4984, 6460, 4200, 4747, 3835, 8996, 2264, 5701, 9712, 2279, 1242, 7974, 6937, 747, 2259, 2725, 2505, 7770, 705, 5700, 5453, 7675, 5854, 2145, 2846, 2811, 907, 9039, 7543, 2793, 5440, 547, 2352, 132, 2714, 3002, 3999, 8984, 8933, 7000, 5932, 8327, 6939, 6282, 2481, 3720, 3731, 3647, 926, 9132, 8585, 3384, 368, 8942, 6935, 8365, 9536, 7472, 3372, 3493, 6612, 888, 8031, 2159, 8832, 5974, 4286, 9078, 1599, 9174, 429, 7366, 9680, 187, 1732, 4302, 3501, 3119, 6925, 7193, 6487, 4857, 8033, 4224, 2712, 6982, 7357, 3749, 4239, 4573, 6694, 6826, 2155, 1422, 2563, 6757, 867, 5340, 3085, 1059, 5997, 4645, 8903, 8683, 6961, 7889, 9635, 2131, 4480, 4793, 1305, 8509, 8552, 8151, 7551, 508, 8986, 2510, 4056, 6153, 2717, 9124, 3192, 4566, 6662, 8158, 3733, 455, 5503, 2175, 3305, 1991, 5859, 334, 7685, 322, 8230, 3131, 9422, 4886, 6739, 6259, 1714, 9480, 3155, 1517, 8956, 9325, 8767, 8532, 7366, 751, 3702, 9396, 515, 5424, 6985, 717, 7244, 9484, 3322, 3797, 4573, 2883, 8039, 7641, 573, 1121, 3170, 951, 2134, 9372, 9597, 3755, 151, 932, 339, 2592, 2925, 1323, 5351, 2554, 167, 2494, 9492, 2952, 1082, 631, 5952, 6865, 5436, 8564, 8327, 4827, 6197, 3367, 8047, 2977, 2183, 5989, 4843, 2224, 3827, 2501, 6996, 9813, 4951, 9899, 4247, 3335, 983, 4682, 2469, 3082, 3609, 9356, 9567, 4471, 6899, 5851, 1254, 2995, 1364, 6403, 745, 9240, 9469, 1094, 854, 8240, 6985, 5074, 4886, 4393, 9864, 692, 5729, 4919, 9985, 2077, 1904, 2520, 9637, 4472, 9672, 1356, 2716, 3456, 5301, 938, 6950, 9224, 6467, 348, 2823, 1740, 1557, 3122, 3372, 6433, 744, 5301, 6692, 1603, 2106, 7510, 7694, 7889, 4587, 309, 5905, 2609, 4393, 3667, 9901, 2749, 9804, 3179, 1283, 2415, 907, 4639, 2705, 9722, 5560, 6800, 9499, 8334, 9510, 2284, 134, 7231, 4375, 1689, 7192, 6983, 8587, 9842, 5996, 8845, 9255, 7723, 6981, 9130, 9021, 2207, 635, 1846, 1884, 1925, 7392, 6254, 4483, 5183, 769, 6307, 9949, 4984, 6460, 4200, 4747, 3835, 8996, 2264, 5701, 9712, 2279, 1242, 7974, 6937, 747, 2259, 2725, 2505, 7770, 705, 5700, 5453, 7675, 5854, 2145, 2846, 2811, 907, 9039, 7543, 2793, 5440, 547, 2352, 132, 2714, 3002, 3999, 8984, 8933, 7000, 5932, 8327, 6939, 6282, 2481, 3720, 3731, 3647, 926, 9132, 8585, 3384, 368, 8942, 6935, 8365, 9536, 7472, 3372, 3493, 6612, 888, 8031, 2159, 8832, 5974, 4286, 9078, 1599, 9174, 429, 7366, 9680, 187, 1732, 4302, 3501, 3119, 6925, 7193, 6487, 4857, 8033, 4224, 2712, 6982, 7357, 3749, 4239, 4573, 6694, 6826, 2155, 1422, 2563, 6757, 867, 5340, 3085, 1059, 5997, 4645, 8903, 8683, 6961, 7889, 9635, 2131, 4480, 4793, 1305, 8509, 8552, 8151, 7551, 508, 8986, 2510, 4056, 6153, 2717, 9124, 3192, 4566, 6662, 8158, 3733, 455, 5503, 2175, 3305, 1991, 5859, 334, 7685, 322, 8230, 3131, 9422, 4886, 6739, 6259, 1714, 9480, 3155, 1517, 8956, 9325, 8767, 8532, 7366, 751, 3702, 9396, 515, 5424, 6985, 717, 7244, 9484, 3322, 3797, 4573, 2883, 8039, 7641, 573, 1121, 3170, 951, 2134, 9372, 9597, 3755, 151, 932, 339, 2592, 2925, 1323, 5351, 2554, 167, 2494, 9492, 2952, 1082, 631, 5952, 6865, 5436, 8564, 8327, 4827, 6197, 3367, 8047, 2977, 2183, 5989, 4843, 2224, 3827, 2501, 6996, 9813, 4951, 9899, 4247, 3335, 983, 4682, 2469, 3082, 3609, 9356, 9567, 4471, 6899, 5851, 1254, 2995, 1364, 6403, 745, 9240, 9469, 1094, 854, 8240, 6985, 5074, 4886, 4393, 9864, 692, 5729, 4919, 9985, 2077, 1904, 2520, 9637, 4472, 9672, 1356, 2716, 3456, 5301, 938, 6950, 9224, 6467, 348, 2823, 1740, 1557, 3122, 3372, 6433, 744, 5301, 6692, 1603, 2106, 7510, 7694, 7889, 4587, 309, 5905, 2609, 4393, 3667, 9901, 2749, 9804, 3179, 1283, 2415, 907, 4639, 2705, 9722, 5560, 6800, 9499, 8334, 9510, 2284, 134, 7231, 4375, 1689, 7192, 6983, 8587, 9842, 5996, 8845, 9255, 7723, 6981, 9130, 9021, 2207, 635, 1846, 1884, 1925, 7392, 6254, 4483, 5183, 769]
-    selection_sort(large_unsorted_list6)
 
-    large_unsorted_list7 = [6307, 9949, 4984, 6460, 4200, 4747, 3835, 8996, 2264, 5701, 9712, 2279, 1242, 7974, 6937, 747, 2259, 2725, 2505, 7770, 705, 5700, 5453, 7675, 5854, 2145, 2846, 2811, 907, 9039, 7543, 2793, 5440, 547, 2352, 132, 2714, 3002, 3999, 8984, 8933, 7000, 5932, 8327, 6939, 6282, 2481, 3720, 3731, 3647, 926, 9132, 8585, 3384, 368, 8942, 6935, 8365, 9536, 7472, 3372, 3493, 6612, 888, 8031, 2159, 8832, 5974, 4286, 9078, 1599, 9174, 429, 7366, 9680, 187, 1732, 4302, 3501, 3119, 6925, 7193, 6487, 4857, 8033, 4224, 2712, 6982, 7357, 3749, 4239, 4573, 6694, 6826, 2155, 1422, 2563, 6757, 867, 5340, 3085, 1059, 5997, 4645, 8903, 8683, 6961, 7889, 9635, 2131, 4480, 4793, 1305, 8509, 8552, 8151, 7551, 508, 8986, 2510, 4056, 6153, 2717, 9124, 3192, 4566, 6662, 8158, 3733, 455, 5503, 2175, 3305, 1991, 5859, 334, 7685, 322, 8230, 3131, 9422, 4886, 6739, 6259, 1714, 9480, 3155, 1517, 8956, 9325, 8767, 8532, 7366, 751, 3702, 9396, 515, 5424, 6985, 717, 7244, 9484, 3322, 3797, 4573, 2883, 8039, 7641, 573, 1121, 3170, 951, 2134, 9372, 9597, 3755, 151, 932, 339, 2592, 2925, 1323, 5351, 2554, 167, 2494, 9492, 2952, 1082, 631, 5952, 6865, 5436, 8564, 8327, 4827, 6197, 3367, 8047, 2977, 2183, 5989, 4843, 2224, 3827, 2501, 6996, 9813, 4951, 9899, 4247, 3335, 983, 4682, 2469, 3082, 3609, 9356, 9567, 4471, 6899, 5851, 1254, 2995, 1364, 6403, 745, 9240, 9469, 1094, 854, 8240, 6985, 5074, 4886, 4393, 9864, 692, 5729, 4919, 9985, 2077, 1904, 2520, 9637, 4472, 9672, 1356, 2716, 3456, 5301, 938, 6950, 9224, 6467, 348, 2823, 1740, 1557, 3122, 3372, 6433, 744, 5301, 6692, 1603, 2106, 7510, 7694, 7889, 4587, 309, 5905, 2609, 4393, 3667, 9901, 2749, 9804, 3179, 1283, 2415, 907, 4639, 2705, 9722, 5560, 6800, 9499, 8334, 9510, 2284, 134, 7231, 4375, 1689, 7192, 6983, 8587, 9842, 5996, 8845, 9255, 7723, 6981, 9130, 9021, 2207, 635, 1846, 1884, 1925, 7392, 6254, 4483, 5183, 769, 6307, 9949, 4984, 6460, 4200, 4747, 3835, 8996, 2264, 5701, 9712, 2279, 1242, 7974, 6937, 747, 2259, 2725, 2505, 7770, 705, 5700, 5453, 7675, 5854, 2145, 2846, 2811, 907, 9039, 7543, 2793, 5440, 547, 2352, 132, 2714, 3002, 3999, 8984, 8933, 7000, 5932, 8327, 6939, 6282, 2481, 3720, 3731, 3647, 926, 9132, 8585, 3384, 368, 8942, 6935, 8365, 9536, 7472, 3372, 3493, 6612, 888, 8031, 2159, 8832, 5974, 4286, 9078, 1599, 9174, 429, 7366, 9680, 187, 1732, 4302, 3501, 3119, 6925, 7193, 6487, 4857, 8033, 4224, 2712, 6982, 7357, 3749, 4239, 4573, 6694, 6826, 2155, 1422, 2563, 6757, 867, 5340, 3085, 1059, 5997, 4645, 8903, 8683, 6961, 7889, 9635, 2131, 4480, 4793, 1305, 8509, 8552, 8151, 7551, 508, 8986, 2510, 4056, 6153, 2717, 9124, 3192, 4566, 6662, 8158, 3733, 455, 5503, 2175, 3305, 1991, 5859, 334, 7685, 322, 8230, 3131, 9422, 4886, 6739, 6259, 1714, 9480, 3155, 1517, 8956, 9325, 8767, 8532, 7366, 751, 3702, 9396, 515, 5424, 6985, 717, 7244, 9484, 3322, 3797, 4573, 2883, 8039, 7641, 573, 1121, 3170, 951, 2134, 9372, 9597, 3755, 151, 932, 339, 2592, 2925, 1323, 5351, 2554, 167, 2494, 9492, 2952, 1082, 631, 5952, 6865, 5436, 8564, 8327, 4827, 6197, 3367, 8047, 2977, 2183, 5989, 4843, 2224, 3827, 2501, 6996, 9813, 4951, 9899, 4247, 3335, 983, 4682, 2469, 3082, 3609, 9356, 9567, 4471, 6899, 5851, 1254, 2995, 1364, 6403, 745, 9240, 9469, 1094, 854, 8240, 6985, 5074, 4886, 4393, 9864, 692, 5729, 4919, 9985, 2077, 1904, 2520, 9637, 4472, 9672, 1356, 2716, 3456, 5301, 938, 6950, 9224, 6467, 348, 2823, 1740, 1557, 3122, 3372, 6433, 744, 5301, 6692, 1603, 2106, 7510, 7694, 7889, 4587, 309, 5905, 2609, 4393, 3667, 9901, 2749, 9804, 3179, 1283, 2415, 907, 4639, 2705, 9722, 5560, 6800, 9499, 8334, 9510, 2284, 134, 7231, 4375, 1689, 7192, 6983, 8587, 9842, 5996, 8845, 9255, 7723, 6981, 9130, 9021, 2207, 635, 1846, 1884, 1925, 7392, 6254, 4483, 5183, 769]
-    python_sort_function(large_unsorted_list7) 
+    #//////////////////////////////////////////////////////////////////
+
+
+    #Testing the sorting algorithms on a large nearly sorted List, like an appended time series with a few late arrivals (1 in every 100
+    #elements is taken out and appended at the end). Only the Tim Sort Algorithm (and Python's own sort, which is also a Tim Sort) makes
+    #use of the runs that are already in order. The Bubble and Selection Sort Algorithms are left out since the late arrivals make them
+    #take several seconds here
+    print("Testing the sorting algorithms on a large nearly sorted List:")
+
+    large_nearly_sorted_list = [i for i in range(10001)]
+    for i in range(len(large_nearly_sorted_list) // 100):
+        large_nearly_sorted_list.append(large_nearly_sorted_list.pop(random_number_generator.randrange(len(large_nearly_sorted_list))))
+
+    large_nearly_sorted_list_copy = large_nearly_sorted_list[:]
+    quick_sort(large_nearly_sorted_list_copy, 0, len(large_nearly_sorted_list_copy) - 1)
+
+    intro_sort(large_nearly_sorted_list[:])
+    insertion_sort(large_nearly_sorted_list[:])
+    shell_sort(large_nearly_sorted_list[:])
+
+    large_nearly_sorted_list_copy = large_nearly_sorted_list[:]
+    merge_sort(large_nearly_sorted_list_copy)
+
+    bottom_up_merge_sort(large_nearly_sorted_list[:])
+    tim_sort(large_nearly_sorted_list[:])
+    python_sort_function(large_nearly_sorted_list[:])
+
+
+    print(timing_collector.report())
+    timing_collector.reset()
 
     print("\n")
 
@@ -263,36 +254,209 @@ if __name__ == '__main__':
     #//////////////////////////////////////////////////////////////////
 
 
-    #Testing the sorting algorithms on a large unsorted List
-    print("Testing the sorting algorithms on a large unsorted List:")
+    #Testing the Parallel Merge Sort Algorithm on a very large List with more and more worker processes (up to the number of cores
+    #on this machine), with the chunks pickled to the workers and with the chunks sorted in a shared memory block
+    print("Testing the Parallel Merge Sort Algorithm on a very large unsorted List:")
 
-    large_sorted_list = [i for i in range(10001)]
-    bubble_sort(large_sorted_list)
+    very_large_unsorted_list = [random_number_generator.randint(0, 10**9) for i in range(500000)]
 
-    #Manually implementing the function time tracking code for Quick Sort (a recursive function) since the 'time_it' decorator
-    #dosen't work for recursive functions
-    large_sorted_list2 = [i for i in range(10001)]
-    start_time = time.time()
-    quick_sort(large_sorted_list2, 0, len(large_sorted_list2) - 1)
-    end_time = time.time()
-    print(quick_sort.__name__ + " took " + str((end_time - start_time) * 1000) + " milliseconds")
+    bottom_up_merge_sort(very_large_unsorted_list[:])
+    single_process_time = timing_collector.statistics()['bottom_up_merge_sort']['total_ms']
 
-    large_sorted_list3 = [i for i in range(10001)]
-    insertion_sort(large_sorted_list3)
+    numbers_of_workers = [number_of_workers for number_of_workers in [2, 4, 8, 16, 32] if number_of_workers < (os.cpu_count() or 1)] + [os.cpu_count() or 1]
+    for number_of_workers in numbers_of_workers:
+        for use_shared_memory in [False, True]:
+            very_large_unsorted_list_copy = very_large_unsorted_list[:]
+            parallel_merge_sort_name = "parallel_merge_sort (" + str(number_of_workers) + " workers" + (", shared memory" if use_shared_memory else "") + ")"
+            with timing_collector.timing(parallel_merge_sort_name):
+                parallel_merge_sort(very_large_unsorted_list_copy, number_of_workers=number_of_workers, use_shared_memory=use_shared_memory)
 
-    large_sorted_list4 = [i for i in range(10001)]
-    shell_sort(large_sorted_list4)
+    print(timing_collector.report())
+    for name, statistics in timing_collector.statistics().items():
+        if name.startswith('parallel_merge_sort'):
+            print(name + ": " + str(round(single_process_time / statistics['total_ms'], 2)) + "x speedup")
+    timing_collector.reset()
 
-    #Manually implementing the function time tracking code for Merge Sort (a recursive function) since the 'time_it' decorator
-    #dosen't work for recursive functions
-    large_sorted_list5 = [i for i in range(10001)]
-    start_time = time.time()
-    merge_sort(large_sorted_list5)
-    end_time = time.time()
-    print(merge_sort.__name__ + " took " + str((end_time - start_time) * 1000) + " milliseconds")
+    print("\n")
 
-    large_sorted_list6 = [i for i in range(10001)]
-    selection_sort(large_sorted_list6)
 
-    large_sorted_list7 = [i for i in range(10001)]
-    python_sort_function(large_sorted_list7)     
+    #//////////////////////////////////////////////////////////////////
+
+
+    #Testing the non-comparison integer sorting algorithms on a very large List of bounded non-negative integers (0 to 10000, like the
+    #large unsorted List above), both as a Python list and as a typed array('I'), against the comparison sorting algorithms
+    print("Testing the integer sorting algorithms on a very large List of bounded non-negative integers:")
+
+    very_large_bounded_integer_list = [random_number_generator.randint(0, 10000) for i in range(200000)]
+
+    intro_sort(very_large_bounded_integer_list[:])
+    bottom_up_merge_sort(very_large_bounded_integer_list[:])
+    tim_sort(very_large_bounded_integer_list[:])
+    counting_sort(very_large_bounded_integer_list[:])
+    lsd_radix_sort(very_large_bounded_integer_list[:])
+    integer_sort(very_large_bounded_integer_list[:])
+    python_sort_function(very_large_bounded_integer_list[:])
+
+    for algorithm_name in ['counting_sort', 'lsd_radix_sort', 'integer_sort']:
+        very_large_bounded_integer_array = array('I', very_large_bounded_integer_list)
+        with timing_collector.timing(algorithm_name + " (array('I'))"):
+            getattr(searching_and_sorting_algorithms, algorithm_name)(very_large_bounded_integer_array)
+
+    print(timing_collector.report())
+    timing_collector.reset()
+
+    print("\n")
+
+
+    #//////////////////////////////////////////////////////////////////
+
+
+    #Testing the Quick Select Algorithm against sorting the whole list, for reading one rank (the median), several ranks (the
+    #percentiles) and the 100 smallest elements in order
+    print("Testing the Quick Select Algorithm against sorting on a very large unsorted List:")
+
+    very_large_unsorted_list = [random_number_generator.randint(0, 10**9) for i in range(200000)]
+
+    with timing_collector.timing("median (intro_sort, then the middle element)"):
+        very_large_unsorted_list_copy = very_large_unsorted_list[:]
+        searching_and_sorting_algorithms.intro_sort(very_large_unsorted_list_copy)
+        middle_element = very_large_unsorted_list_copy[len(very_large_unsorted_list_copy) // 2]
+
+    with timing_collector.timing("median (quick select)"):
+        middle_element = searching_and_sorting_algorithms.select(very_large_unsorted_list, len(very_large_unsorted_list) // 2)
+
+    with timing_collector.timing("percentiles (intro_sort, then 99 elements)"):
+        very_large_unsorted_list_copy = very_large_unsorted_list[:]
+        searching_and_sorting_algorithms.intro_sort(very_large_unsorted_list_copy)
+        percentiles = [very_large_unsorted_list_copy[-(-i * len(very_large_unsorted_list_copy) // 100) - 1] for i in range(1, 100)]
+
+    with timing_collector.timing("percentiles (quick select quantiles)"):
+        percentiles = searching_and_sorting_algorithms.quantiles(very_large_unsorted_list, [i / 100 for i in range(1, 100)])
+
+    with timing_collector.timing("100 smallest (intro_sort)"):
+        searching_and_sorting_algorithms.intro_sort(very_large_unsorted_list[:])
+
+    with timing_collector.timing("100 smallest (quick select partial_sort)"):
+        searching_and_sorting_algorithms.partial_sort(very_large_unsorted_list[:], 100)
+
+    print(timing_collector.report())
+    timing_collector.reset()
+
+    print("\n")
+
+
+    #//////////////////////////////////////////////////////////////////
+
+
+    #Testing the Incremental Quick Sort Algorithm against sorting the whole list, for the first element and the first 100 elements in
+    #order, and the bounded heap of 'top_k' against sorting, for the 100 largest elements of a generator
+    print("Testing the Incremental Quick Sort Algorithm against sorting on a very large unsorted List:")
+
+    with timing_collector.timing("first element (intro_sort)"):
+        very_large_unsorted_list_copy = very_large_unsorted_list[:]
+        searching_and_sorting_algorithms.intro_sort(very_large_unsorted_list_copy)
+        first_element = very_large_unsorted_list_copy[0]
+
+    with timing_collector.timing("first element (sorted_stream)"):
+        first_element = next(searching_and_sorting_algorithms.sorted_stream(very_large_unsorted_list))
+
+    with timing_collector.timing("first 100 elements (sorted_stream)"):
+        sorted_stream = searching_and_sorting_algorithms.sorted_stream(very_large_unsorted_list)
+        first_100_elements = [next(sorted_stream) for i in range(100)]
+
+    with timing_collector.timing("all elements (sorted_stream)"):
+        all_elements = list(searching_and_sorting_algorithms.sorted_stream(very_large_unsorted_list))
+
+    with timing_collector.timing("100 largest of a generator (sorted)"):
+        largest_100_elements = sorted((number * 2 for number in very_large_unsorted_list), reverse=True)[:100]
+
+    with timing_collector.timing("100 largest of a generator (top_k)"):
+        largest_100_elements = searching_and_sorting_algorithms.top_k((number * 2 for number in very_large_unsorted_list), 100)
+
+    print(timing_collector.report())
+    timing_collector.reset()
+
+    print("\n")
+
+
+    #//////////////////////////////////////////////////////////////////
+
+
+    #Testing the list backend and the NumPy backend of the sorting algorithms side by side. Every sorting algorithm file uses its
+    #vectorized NumPy backend when it is given a NumPy array instead of a list
+    if np is not None:
+        print("Testing the list and NumPy backends of the sorting algorithms on a large unsorted List:")
+
+        backend_test_list = [random_number_generator.randint(0, 10000) for i in range(3000)]
+
+        algorithms_with_a_numpy_backend = [
+            ('bubble_sort', searching_and_sorting_algorithms.bubble_sort),
+            ('quick_sort', lambda number_list: searching_and_sorting_algorithms.quick_sort(number_list, 0, len(number_list) - 1)),
+            ('intro_sort', searching_and_sorting_algorithms.intro_sort),
+            ('insertion_sort', searching_and_sorting_algorithms.insertion_sort),
+            ('shell_sort', searching_and_sorting_algorithms.shell_sort),
+            ('merge_sort', searching_and_sorting_algorithms.merge_sort),
+            ('bottom_up_merge_sort', searching_and_sorting_algorithms.bottom_up_merge_sort),
+            ('selection_sort', searching_and_sorting_algorithms.selection_sort),
+        ]
+
+        for algorithm_name, algorithm in algorithms_with_a_numpy_backend:
+            backend_test_list_copy = backend_test_list[:]
+            with timing_collector.timing(algorithm_name + " (list backend)"):
+                algorithm(backend_test_list_copy)
+
+            backend_test_array = np.array(backend_test_list)
+            with timing_collector.timing(algorithm_name + " (NumPy backend)"):
+                algorithm(backend_test_array)
+
+        backend_test_array = np.array(backend_test_list)
+        with timing_collector.timing("numpy.ndarray.sort"):
+            backend_test_array.sort()
+
+        print(timing_collector.report())
+        timing_collector.reset()
+
+        print("\n")
+
+
+    #//////////////////////////////////////////////////////////////////
+
+
+    #Testing the async sorting algorithms inside an asyncio event loop, next to another task that wants to run every millisecond. A
+    #normal Sorting Algorithm keeps the event loop for the whole sort, while the cooperative mode gives it back every few milliseconds
+    #and the offload mode sorts in a worker process (only copying the numbers in and out of shared memory on the event loop)
+    print("Testing the async sorting algorithms inside an asyncio event loop on a very large unsorted List:")
+
+    very_large_unsorted_list = [random_number_generator.randint(0, 10**9) for i in range(200000)]
+
+    async def blocking_shell_sort(number_list):
+        searching_and_sorting_algorithms.shell_sort(number_list)
+
+    async def blocking_intro_sort(number_list):
+        searching_and_sorting_algorithms.intro_sort(number_list)
+
+    sorting_coroutines = [
+        ('shell_sort (blocking)', blocking_shell_sort),
+        ('async_shell_sort (cooperative)', async_shell_sort),
+        ('async_shell_sort (offload)', lambda number_list: async_shell_sort(number_list, mode='offload')),
+        ('async_merge_sort (cooperative)', async_merge_sort),
+        ('async_merge_sort (offload)', lambda number_list: async_merge_sort(number_list, mode='offload')),
+        ('intro_sort (blocking)', blocking_intro_sort),
+        ('async_quick_sort (cooperative)', async_quick_sort),
+        ('async_quick_sort (offload)', lambda number_list: async_quick_sort(number_list, mode='offload')),
+    ]
+
+    for name, sorting_coroutine in sorting_coroutines:
+        very_large_unsorted_list_copy = very_large_unsorted_list[:]
+        with timing_collector.timing(name):
+            longest_delay = asyncio.run(sorting_next_to_another_task(sorting_coroutine(very_large_unsorted_list_copy)))
+        timing_collector.record(name + " (longest event loop delay)", longest_delay)
+
+    searching_and_sorting_algorithms.shutting_down_the_process_pool()
+
+    print(timing_collector.report())
+    timing_collector.reset()
+
+    #How long every async call kept the event loop to itself, as measured by the call
+    print(loop_blocking_collector.report())
+    loop_blocking_collector.reset()
@@ -0,0 +1,35 @@
+#This import_algorithm_file function is used by the Searching and Sorting Algorithm files that need to reuse functions from another
+#Searching or Sorting Algorithm file (e.g. Quick Sort reusing the Insertion Sort Algorithm). The file names start with digits and contain
+#spaces and brackets (e.g. '6. Insertion_Sort_(Sorting_Algorithm).py'), so they cannot be imported with a normal 'import' statement
+
+import importlib.util
+import os
+import re
+import sys
+
+algorithm_files_directory = os.path.dirname(os.path.abspath(__file__))
+
+
+def module_name_of_an_algorithm_file(file_name):
+    #E.g. '6. Insertion_Sort_(Sorting_Algorithm).py' -> 'insertion_sort_sorting_algorithm'
+    module_name = re.sub(r'[^0-9a-zA-Z]+', '_', os.path.splitext(file_name)[0]).strip('_').lower()
+    return re.sub(r'^[0-9]+_', '', module_name)
+
+
+def import_algorithm_file(file_name):
+    module_name = module_name_of_an_algorithm_file(file_name)
+
+    #Each file is only executed once, later imports of the same file share the same module
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(algorithm_files_directory, file_name))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+
+    return module
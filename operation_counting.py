@@ -0,0 +1,129 @@
+#This operation counting mode is used by the 'benchmark_suite.py' file (with the '--count-operations' option), to show why one algorithm
+#is faster than another (e.g. why the Shell Sort Algorithm beats the Insertion Sort Algorithm, or the Hoare Partition scheme beats the
+#Lomuto Partition scheme) instead of only how much faster it is
+
+#The algorithms are not changed at all. Instead, they are given a 'CountingList' of 'CountedElement's, which count every comparison
+#between elements, every element written into the list, every swap of 2 elements and every copy of the list (slice) the algorithm makes.
+#When an algorithm is given a plain list, none of this code runs, so counting costs nothing when it is not used
+
+#Only what goes through the list is seen: lists the algorithm makes from scratch (e.g. the scratch buffer of the Bottom-up Merge Sort
+#Algorithm) are not counted as allocations, and writes into them are not counted as writes. Algorithms that do arithmetic on the elements
+#(e.g. the Interpolation Search and Counting Sort Algorithms) can't be counted this way
+
+
+class OperationCounts:
+
+    def __init__(self):
+        self.comparisons = 0
+        self.swaps = 0
+        self.writes = 0
+        self.allocations = 0
+
+    def as_dict(self):
+        return {'comparisons': self.comparisons, 'swaps': self.swaps, 'writes': self.writes, 'allocations': self.allocations}
+
+
+class CountedElement:
+
+    #Wraps one element of the list, and counts every comparison it is part of. Comparing 2 elements (or an element and a number to find)
+    #counts as 1 comparison, whichever side of the comparison the element is on
+    __slots__ = ('value', 'operation_counts')
+
+    def __init__(self, value, operation_counts):
+        self.value = value
+        self.operation_counts = operation_counts
+
+    def __lt__(self, other):
+        self.operation_counts.comparisons += 1
+        return self.value < (other.value if isinstance(other, CountedElement) else other)
+
+    def __le__(self, other):
+        self.operation_counts.comparisons += 1
+        return self.value <= (other.value if isinstance(other, CountedElement) else other)
+
+    def __gt__(self, other):
+        self.operation_counts.comparisons += 1
+        return self.value > (other.value if isinstance(other, CountedElement) else other)
+
+    def __ge__(self, other):
+        self.operation_counts.comparisons += 1
+        return self.value >= (other.value if isinstance(other, CountedElement) else other)
+
+    def __eq__(self, other):
+        self.operation_counts.comparisons += 1
+        return self.value == (other.value if isinstance(other, CountedElement) else other)
+
+    def __ne__(self, other):
+        self.operation_counts.comparisons += 1
+        return self.value != (other.value if isinstance(other, CountedElement) else other)
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):
+        return repr(self.value)
+
+
+class CountingList(list):
+
+    #A list that counts the elements written into it and the copies made of it. A swap is 2 writes in a row that exchange 2 elements,
+    #e.g. 'number_list[i], number_list[j] = number_list[j], number_list[i]' or the 'swapping_two_elements_in_a_list' function: the first
+    #write puts the element from position j at position i, and the second puts the element that was at position i at position j
+    def __init__(self, elements, operation_counts):
+        super().__init__(elements)
+        self.operation_counts = operation_counts
+
+        #(index, element written there, element it replaced) of the last single element write, to spot the second half of a swap
+        self.last_write = None
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            self.operation_counts.allocations += 1
+            return CountingList(super().__getitem__(index), self.operation_counts)
+        return super().__getitem__(index)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self.operation_counts.writes += len(value)
+            self.last_write = None
+            super().__setitem__(index, value)
+            return
+
+        replaced_element = super().__getitem__(index)
+        self.operation_counts.writes += 1
+
+        if self.last_write is not None:
+            last_index, last_written_element, last_replaced_element = self.last_write
+            if last_index != index and last_written_element is replaced_element and value is last_replaced_element:
+                self.operation_counts.swaps += 1
+                self.last_write = None
+                super().__setitem__(index, value)
+                return
+
+        self.last_write = (index, value, replaced_element)
+        super().__setitem__(index, value)
+
+    def values(self):
+        #The plain elements, e.g. to check the list was sorted
+        return [element.value for element in self]
+
+
+def counting_operations(algorithm, number_list, *args, **kwargs):
+
+    #Runs 'algorithm' on a counting copy of number_list (plus any other arguments, e.g. the number to find), and gives back the
+    #OperationCounts. number_list itself is not changed
+    operation_counts = OperationCounts()
+    counting_list = CountingList([CountedElement(number, operation_counts) for number in number_list], operation_counts)
+    algorithm(counting_list, *args, **kwargs)
+    return operation_counts
+
+
+if __name__ == '__main__':
+    from import_algorithm_file import import_algorithm_file
+
+    quick_sort = import_algorithm_file('5. Quick_Sort_(Sorting_Algorithm).py').quick_sort
+    nums_list = [21, 38, 29, 17, 4, 25, 32, 9]
+    for partition_scheme in ['hoare', 'lomuto']:
+        operation_counts = counting_operations(quick_sort, nums_list, 0, len(nums_list) - 1, partition_scheme)
+        print(f"quick_sort ({partition_scheme} partition scheme): {operation_counts.as_dict()}")
@@ -0,0 +1,71 @@
+#These optional NumPy functions are used by the Searching and Sorting Algorithm files (and the 'sorting_with_a_key' file) to switch to
+#their vectorized NumPy backends when they are given a NumPy array, without importing NumPy when they are only ever given lists
+
+#Importing NumPy takes about 60 to 90 milliseconds, much longer than loading every algorithm file together, so none of the algorithm
+#files imports it when it is loaded. Only the 'numpy_...' backend functions get it (through 'getting_numpy'), and those only run once
+#they have been given a NumPy array, by which time NumPy has been imported already by whoever made the array
+
+import functools
+import sys
+
+
+def is_a_numpy_array(value):
+
+    #A value can only be a NumPy array if NumPy has been imported already, so NumPy is looked up among the imported modules instead of
+    #being imported here. A list is told apart from a NumPy array with one dictionary lookup, and NumPy is never imported for it
+    numpy = sys.modules.get('numpy')
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+
+@functools.lru_cache(maxsize=None)
+def getting_numpy():
+    import numpy
+    return numpy
+
+
+#The dtype kinds the vectorized backends sort: booleans, signed and unsigned integers, and floats. Any other array (e.g. of strings or
+#of Python objects) is sorted by the list code instead, through 'sorting_an_array_as_a_list'
+numeric_dtype_kinds = 'biuf'
+
+
+def is_a_numeric_numpy_array(value):
+    return is_a_numpy_array(value) and value.dtype.kind in numeric_dtype_kinds
+
+
+def moving_nans_to_the_end(number_array, start_index_of_list=0, end_index_of_list=None):
+
+    #NaN is neither smaller than, larger than nor equal to anything, so the vectorized backends would lose or scatter it. The NaNs of
+    #number_array[start_index_of_list:end_index_of_list + 1] are moved to its end (where 'np.sort' puts them too), keeping the order
+    #of the numbers before them, and the end index of those numbers is given back, so only they are sorted
+    if end_index_of_list is None:
+        end_index_of_list = len(number_array) - 1
+
+    if number_array.dtype.kind != 'f':
+        return end_index_of_list
+
+    np = getting_numpy()
+    sublist = number_array[start_index_of_list:end_index_of_list + 1]
+    nan_mask = np.isnan(sublist)
+    number_of_nans = int(np.count_nonzero(nan_mask))
+
+    if number_of_nans:
+        numbers = sublist[~nan_mask]
+        nans = sublist[nan_mask]
+        sublist[:len(numbers)] = numbers
+        sublist[len(numbers):] = nans
+
+    return end_index_of_list - number_of_nans
+
+
+def sorting_an_array_as_a_list(number_array, sorting_a_list, start_index_of_list=0, end_index_of_list=None):
+
+    #The elements are copied into a list, sorted by the list code of the Sorting Algorithm, and written back one at a time (a whole list
+    #written back at once could be turned into a 2-D array, e.g. for an array of tuples)
+    if end_index_of_list is None:
+        end_index_of_list = len(number_array) - 1
+
+    elements = number_array[start_index_of_list:end_index_of_list + 1].tolist()
+    sorting_a_list(elements)
+
+    for i, element in enumerate(elements):
+        number_array[start_index_of_list + i] = element
@@ -0,0 +1,87 @@
+#This package makes every Searching and Sorting Algorithm in this repository importable with a normal 'import' statement, e.g.
+#    from searching_and_sorting_algorithms import intro_sort, SortedList
+#The algorithm files themselves cannot be imported like that, since their names start with digits and contain spaces and brackets
+#(e.g. '5. Quick_Sort_(Sorting_Algorithm).py'), so they are loaded with the 'import_algorithm_file' function instead
+
+#Importing the package loads none of the algorithm files. Every algorithm file is only loaded the first time one of its names is used
+#(through the module '__getattr__' of PEP 562), and the name is then stored in the package, so every later use is a plain lookup. A
+#script that only sorts with the Tim Sort Algorithm only pays for loading the Tim Sort file (and the files it reuses)
+
+import importlib
+from import_algorithm_file import import_algorithm_file
+
+#Name -> algorithm file it is defined in
+algorithm_files = {
+    'linear_search': '1. Linear_Search_(Searching_Algorithm).py',
+    'SearchIndex': '1. Linear_Search_(Searching_Algorithm).py',
+    'iterative_binary_search': '2. Iterative_Binary_Search_(Searching_Algorithm).py',
+    'interpolation_search': '2. Iterative_Binary_Search_(Searching_Algorithm).py',
+    'exponential_search': '2. Iterative_Binary_Search_(Searching_Algorithm).py',
+    'search': '2. Iterative_Binary_Search_(Searching_Algorithm).py',
+    'batch_binary_search': '2. Iterative_Binary_Search_(Searching_Algorithm).py',
+    'recursive_binary_search': '3. Recursive_Binary_Search_(Searching_Algorithm).py',
+    'bubble_sort': '4. Bubble_Sort_(Sorting_Algorithm).py',
+    'quick_sort': '5. Quick_Sort_(Sorting_Algorithm).py',
+    'intro_sort': '5. Quick_Sort_(Sorting_Algorithm).py',
+    'heap_sort': '5. Quick_Sort_(Sorting_Algorithm).py',
+    'partition_schemes': '5. Quick_Sort_(Sorting_Algorithm).py',
+    'insertion_sort': '6. Insertion_Sort_(Sorting_Algorithm).py',
+    'binary_insertion_sort': '6. Insertion_Sort_(Sorting_Algorithm).py',
+    'galloping_insertion_sort': '6. Insertion_Sort_(Sorting_Algorithm).py',
+    'shell_sort': '7. Shell_Sort_(Sorting_Algorithm).py',
+    'gap_sequences': '7. Shell_Sort_(Sorting_Algorithm).py',
+    'merge_sort': '8. Merge_Sort_(Sorting_Algorithm).py',
+    'bottom_up_merge_sort': '8. Merge_Sort_(Sorting_Algorithm).py',
+    'selection_sort': '9. Selection_Sort_(Sorting_Algorithm).py',
+    'tim_sort': '10. Tim_Sort_(Sorting_Algorithm).py',
+    'parallel_merge_sort': '11. Parallel_Merge_Sort_(Sorting_Algorithm).py',
+    'SortedIndex': '12. Sorted_Index_(Searching_Algorithm).py',
+    'counting_sort': '13. Counting_Sort_And_Radix_Sort_(Sorting_Algorithm).py',
+    'lsd_radix_sort': '13. Counting_Sort_And_Radix_Sort_(Sorting_Algorithm).py',
+    'integer_sort': '13. Counting_Sort_And_Radix_Sort_(Sorting_Algorithm).py',
+    'external_merge_sort': '14. External_Merge_Sort_(Sorting_Algorithm).py',
+    'MemoryMappedSortedFile': '15. Memory_Mapped_Binary_Search_(Searching_Algorithm).py',
+    'nth_element': '16. Quick_Select_(Searching_Algorithm).py',
+    'select': '16. Quick_Select_(Searching_Algorithm).py',
+    'median': '16. Quick_Select_(Searching_Algorithm).py',
+    'quantiles': '16. Quick_Select_(Searching_Algorithm).py',
+    'partial_sort': '16. Quick_Select_(Searching_Algorithm).py',
+    'sorted_stream': '17. Incremental_Quick_Sort_(Sorting_Algorithm).py',
+    'top_k': '17. Incremental_Quick_Sort_(Sorting_Algorithm).py',
+    'bottom_k': '17. Incremental_Quick_Sort_(Sorting_Algorithm).py',
+    'SortedList': '18. Sorted_List_(Searching_Algorithm).py',
+}
+
+#Name -> module it is defined in, for the helpers that are not in an algorithm file (a leading '.' is a module of this package)
+helper_modules = {
+    'argsort': 'sorting_with_a_key',
+    'loading_a_fixture': '.benchmark_fixtures',
+    'writing_a_fixture': '.benchmark_fixtures',
+    'async_shell_sort': '.asynchronous_algorithms',
+    'async_merge_sort': '.asynchronous_algorithms',
+    'async_quick_sort': '.asynchronous_algorithms',
+    'async_linear_search': '.asynchronous_algorithms',
+    'async_batch_binary_search': '.asynchronous_algorithms',
+    'loop_blocking_collector': '.asynchronous_algorithms',
+    'shutting_down_the_process_pool': '.asynchronous_algorithms',
+}
+
+__all__ = [*algorithm_files, *helper_modules]
+
+
+def __getattr__(name):
+    if name in algorithm_files:
+        module = import_algorithm_file(algorithm_files[name])
+    elif name in helper_modules:
+        module = importlib.import_module(helper_modules[name], __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    #Stored in the package, so '__getattr__' (which Python only calls for names the package does not have yet) is not called again
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
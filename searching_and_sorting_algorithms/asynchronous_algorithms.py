@@ -0,0 +1,444 @@
+#These async Sorting and Searching Algorithms are for asyncio programs, where one long call of a normal Sorting Algorithm (e.g. the Shell
+#Sort Algorithm on a list of a million numbers) would stop every other task of the event loop until it is done. Every one of them can
+#run in 2 modes:
+#- 'cooperative': the algorithm is written as a generator that stops after every small step of work (e.g. 1024 elements of one gap
+#  pass of the Shell Sort Algorithm, or of one merge level of the Merge Sort Algorithm), and gives the event loop back once it has run
+#  for 'time_budget_ms' milliseconds without doing so. It runs in this process
+#- 'offload': the numbers are copied (a chunk at a time, giving the event loop back in between) into a shared memory block of 'typecode'
+#  elements, and the normal algorithm runs on them in a worker process of a process pool. Only the name of the shared memory block is
+#  sent to the worker, the numbers themselves never go through a pipe. Only for numbers that fit in 'typecode' (64-bit integers by
+#  default, 'd' for floats)
+
+#Every call records how long it kept the event loop to itself into 'loop_blocking_collector' (a 'TimingCollector' from the 'time_it'
+#file), as 3 timings under the name of the function and the mode: the longest time between 2 points where it gave the loop back
+#('longest block'), the sum of those times ('total blocking'), and the time from the start to the end of the call ('wall time')
+
+import asyncio
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from time_it import TimingCollector
+from import_algorithm_file import import_algorithm_file
+import searching_and_sorting_algorithms
+
+batch_binary_search = import_algorithm_file('2. Iterative_Binary_Search_(Searching_Algorithm).py').batch_binary_search
+quick_sort_module = import_algorithm_file('5. Quick_Sort_(Sorting_Algorithm).py')
+swapping_two_elements_in_a_list = quick_sort_module.swapping_two_elements_in_a_list
+choosing_a_pivot_index = quick_sort_module.choosing_a_pivot_index
+insertion_sort = import_algorithm_file('6. Insertion_Sort_(Sorting_Algorithm).py').insertion_sort
+gaps_of_a_gap_sequence = import_algorithm_file('7. Shell_Sort_(Sorting_Algorithm).py').gaps_of_a_gap_sequence
+insertion_sort_run_size = import_algorithm_file('8. Merge_Sort_(Sorting_Algorithm).py').insertion_sort_run_size
+
+#A cooperative algorithm gives the event loop back once it has kept it for this many milliseconds
+time_budget_ms = 5
+
+#A step of a cooperative algorithm handles about this many elements before it checks the time budget. A step costs well under a
+#millisecond, so the loop is never kept much longer than the time budget
+elements_per_step = 1024
+
+#A step of the cooperative Batched Binary Search Algorithm looks up this many keys. Every key is a galloping search of O(log n)
+#comparisons, so a key costs far more than one element of the other cooperative algorithms
+keys_per_step = 128
+
+#Segments of at most this many elements are sorted by the cooperative Quick Sort Algorithm in a single step, with the Intro Sort
+#Algorithm, instead of being partitioned a step at a time
+segment_size_for_one_step = 1024
+
+modes = ['cooperative', 'offload']
+
+loop_blocking_collector = TimingCollector()
+
+#Created on the first offloaded call, and shared by every offloaded call after it
+process_pool = None
+
+
+#~~~(Measuring how long a call keeps the event loop)~~~
+
+class LoopBlockingMeter:
+
+    #A 'slice' is the time between 2 points where a call gives the event loop back (or its start and its end), during which no other
+    #task of the loop can run
+    def __init__(self):
+        self.start_of_call = self.start_of_slice = time.perf_counter_ns()
+        self.longest_block = 0
+        self.total_blocking = 0
+
+    def ending_a_slice(self):
+        length_of_slice = time.perf_counter_ns() - self.start_of_slice
+        self.longest_block = max(self.longest_block, length_of_slice)
+        self.total_blocking += length_of_slice
+
+    def starting_a_slice(self):
+        self.start_of_slice = time.perf_counter_ns()
+
+    async def giving_the_loop_back(self):
+        self.ending_a_slice()
+        await asyncio.sleep(0)
+        self.starting_a_slice()
+
+    def recording(self, timing_collector, name):
+        timing_collector.record(f"{name} (longest block)", self.longest_block)
+        timing_collector.record(f"{name} (total blocking)", self.total_blocking)
+        timing_collector.record(f"{name} (wall time)", time.perf_counter_ns() - self.start_of_call)
+
+
+async def running_the_steps(steps, loop_blocking_meter, time_budget_ns):
+
+    #Runs a generator of steps to the end and gives back its return value, giving the event loop back whenever the current slice has
+    #used up the time budget
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+        if time.perf_counter_ns() - loop_blocking_meter.start_of_slice >= time_budget_ns:
+            await loop_blocking_meter.giving_the_loop_back()
+
+
+#~~~(Cooperative Sorting and Searching Algorithms, as generators of steps)~~~
+
+def shell_sort_steps(number_list, gap_sequence='shell'):
+
+    #The Shell Sort Algorithm of the '7. Shell_Sort_(Sorting_Algorithm).py' file, stopping after every 'elements_per_step' elements of
+    #every gap pass
+    size = len(number_list)
+
+    for gap in gaps_of_a_gap_sequence(gap_sequence, size):
+        for start_of_step in range(gap, size, elements_per_step):
+            for i in range(start_of_step, min(start_of_step + elements_per_step, size)):
+                anchor = number_list[i]
+                j = i - gap
+
+                while j >= 0 and anchor < number_list[j]:
+                    number_list[j + gap] = number_list[j]
+                    j -= gap
+
+                number_list[j + gap] = anchor
+
+            yield
+
+    return number_list
+
+
+def merging_two_adjacent_runs_steps(source_list, destination_list, start_index_of_run_a, start_index_of_run_b, end_index_of_run_b):
+
+    #'merging_two_adjacent_runs' of the '8. Merge_Sort_(Sorting_Algorithm).py' file, stopping after every 'elements_per_step' merged
+    #elements. Once one run is used up, the rest of the other run is copied over with one slice assignment
+    #The 2 runs are already in order (or there is no run b), so they only need to be copied over
+    if start_index_of_run_b == end_index_of_run_b or source_list[start_index_of_run_b - 1] <= source_list[start_index_of_run_b]:
+        destination_list[start_index_of_run_a:end_index_of_run_b] = source_list[start_index_of_run_a:end_index_of_run_b]
+        return
+
+    i = start_index_of_run_a
+    j = start_index_of_run_b
+    k = start_index_of_run_a
+
+    while i < start_index_of_run_b and j < end_index_of_run_b:
+        end_of_step = k + elements_per_step
+
+        while i < start_index_of_run_b and j < end_index_of_run_b and k < end_of_step:
+            if source_list[i] <= source_list[j]:
+                destination_list[k] = source_list[i]
+                i += 1
+            else:
+                destination_list[k] = source_list[j]
+                j += 1
+            k += 1
+
+        yield
+
+    if i < start_index_of_run_b:
+        destination_list[k:end_index_of_run_b] = source_list[i:start_index_of_run_b]
+    else:
+        destination_list[k:end_index_of_run_b] = source_list[j:end_index_of_run_b]
+
+
+def merge_sort_steps(number_list, start_index_of_list=0, end_index_of_list=None):
+
+    #The Bottom-up Merge Sort Algorithm of the '8. Merge_Sort_(Sorting_Algorithm).py' file on number_list[start_index_of_list:
+    #end_index_of_list + 1], stopping after every run sorted with the Insertion Sort Algorithm and every 'elements_per_step' elements
+    #of every merge level
+    if end_index_of_list is None:
+        end_index_of_list = len(number_list) - 1
+
+    size = end_index_of_list - start_index_of_list + 1
+    if size <= 1:
+        return number_list
+
+    for start_index_of_run in range(start_index_of_list, end_index_of_list + 1, insertion_sort_run_size):
+        insertion_sort(number_list, start_index_of_run, min(start_index_of_run + insertion_sort_run_size - 1, end_index_of_list))
+        yield
+
+    #The merge levels ping-pong between 2 scratch lists, which only hold the segment (so number_list[start_index_of_list + i] is at
+    #index i of them), and the sorted segment is only put back into the list in one slice assignment at the end. A merge level that is
+    #half way through is never in the list itself, so if the task is cancelled while it is suspended, the list still holds every one of
+    #its elements exactly once
+    source_list = number_list[start_index_of_list:end_index_of_list + 1]
+    destination_list = [None] * size
+    run_size = insertion_sort_run_size
+
+    while run_size < size:
+        for start_index_of_run_a in range(0, size, 2 * run_size):
+            start_index_of_run_b = min(start_index_of_run_a + run_size, size)
+            end_index_of_run_b = min(start_index_of_run_a + 2 * run_size, size)
+            yield from merging_two_adjacent_runs_steps(source_list, destination_list, start_index_of_run_a, start_index_of_run_b,
+                                                       end_index_of_run_b)
+
+        source_list, destination_list = destination_list, source_list
+        run_size *= 2
+
+    number_list[start_index_of_list:end_index_of_list + 1] = source_list
+    return number_list
+
+
+def partitioning_a_segment_steps(number_list, start_index_of_list, end_index_of_list):
+
+    #3-way partitioning (Dijkstra's) around a median-of-three or ninther pivot, stopping after every 'elements_per_step' elements. The
+    #segment ends up as [< pivot | == pivot | > pivot], and the (start index, end index) of the 2 sublists still to sort is given back
+    pivot = number_list[choosing_a_pivot_index(number_list, start_index_of_list, end_index_of_list)]
+
+    end_of_smaller_keys = start_index_of_list
+    i = start_index_of_list
+    start_of_larger_keys = end_index_of_list
+
+    while i <= start_of_larger_keys:
+        for step in range(elements_per_step):
+            if i > start_of_larger_keys:
+                break
+
+            if number_list[i] < pivot:
+                swapping_two_elements_in_a_list(end_of_smaller_keys, i, number_list)
+                end_of_smaller_keys += 1
+                i += 1
+            elif pivot < number_list[i]:
+                swapping_two_elements_in_a_list(i, start_of_larger_keys, number_list)
+                start_of_larger_keys -= 1
+            else:
+                i += 1
+
+        yield
+
+    return [(start_index_of_list, end_of_smaller_keys - 1), (start_of_larger_keys + 1, end_index_of_list)]
+
+
+def quick_sort_steps(number_list):
+
+    #Intro Sort as in the '5. Quick_Sort_(Sorting_Algorithm).py' file, with an explicit stack of segments. A large segment is partitioned
+    #a step at a time, a small one is sorted with the Intro Sort Algorithm in one step, and a segment that has been partitioned too many
+    #times without getting small is sorted with the cooperative Merge Sort Algorithm instead of the Heap Sort Algorithm (which can't
+    #stop half way through)
+    if len(number_list) <= 1:
+        return number_list
+
+    stack = [(0, len(number_list) - 1, 2 * (len(number_list).bit_length() - 1))]
+
+    while stack:
+        start_index, end_index, remaining_depth = stack.pop()
+
+        if end_index - start_index + 1 <= segment_size_for_one_step:
+            quick_sort_module.intro_sort(number_list, start_index, end_index)
+            yield
+        elif remaining_depth <= 0:
+            yield from merge_sort_steps(number_list, start_index, end_index)
+        else:
+            sublists = yield from partitioning_a_segment_steps(number_list, start_index, end_index)
+
+            #The larger sublist is pushed first, so the smaller one is sorted first and the stack stays O(log n) long
+            sublists.sort(key=lambda sublist: sublist[1] - sublist[0], reverse=True)
+            stack.extend((start_index_of_sublist, end_index_of_sublist, remaining_depth - 1)
+                         for start_index_of_sublist, end_index_of_sublist in sublists if start_index_of_sublist < end_index_of_sublist)
+
+    return number_list
+
+
+def linear_search_steps(numbers_list, number_to_find):
+
+    #The Linear Search Algorithm, stopping after every 'elements_per_step' elements
+    for start_of_step in range(0, len(numbers_list), elements_per_step):
+        for index in range(start_of_step, min(start_of_step + elements_per_step, len(numbers_list))):
+            if numbers_list[index] == number_to_find:
+                return index
+        yield
+
+    return -1
+
+
+def batch_binary_search_steps(sorted_list, keys, match_position='leftmost'):
+
+    #The Batched Binary Search Algorithm, on 'keys_per_step' keys per step
+    indices = []
+    for start_of_step in range(0, len(keys), keys_per_step):
+        indices.extend(batch_binary_search(sorted_list, keys[start_of_step:start_of_step + keys_per_step], match_position))
+        yield
+
+    return indices
+
+
+#~~~(Offloading to a process pool, through shared memory)~~~
+
+def getting_the_process_pool():
+    global process_pool
+    if process_pool is None:
+        process_pool = ProcessPoolExecutor()
+    return process_pool
+
+
+def shutting_down_the_process_pool():
+    global process_pool
+    if process_pool is not None:
+        process_pool.shutdown()
+        process_pool = None
+
+
+def sorting_in_shared_memory(shared_memory_name, typecode, size, algorithm_name, arguments):
+
+    #Runs in a worker process. The numbers are copied out of the shared memory block into a list (a list is much faster to sort than a
+    #memoryview), sorted, and written back in place
+    shared_memory_block = shared_memory.SharedMemory(name=shared_memory_name)
+    try:
+        with shared_memory_block.buf.cast(typecode) as shared_array:
+            number_list = shared_array[:size].tolist()
+            getattr(searching_and_sorting_algorithms, algorithm_name)(number_list, *arguments)
+            shared_array[:size] = array(typecode, number_list)
+    finally:
+        shared_memory_block.close()
+
+
+def searching_in_shared_memory(shared_memory_name, typecode, size, algorithm_name, arguments):
+
+    #Runs in a worker process, searching the shared memory block itself through a memoryview, without copying it
+    shared_memory_block = shared_memory.SharedMemory(name=shared_memory_name)
+    try:
+        with shared_memory_block.buf.cast(typecode) as shared_array, shared_array[:size] as numbers:
+            return getattr(searching_and_sorting_algorithms, algorithm_name)(numbers, *arguments)
+    finally:
+        shared_memory_block.close()
+
+
+def copying_into_shared_memory_steps(shared_array, number_list, typecode):
+    for start_of_step in range(0, len(number_list), elements_per_step):
+        shared_array[start_of_step:start_of_step + elements_per_step] = array(typecode, number_list[start_of_step:start_of_step + elements_per_step])
+        yield
+
+
+def copying_out_of_shared_memory_steps(shared_array, size):
+
+    #The sorted numbers are copied into a new list a step at a time, so the caller's list is left as it was if the task is cancelled
+    #while it is suspended, and is only replaced by the sorted numbers in one go once they have all been copied
+    sorted_numbers = []
+    for start_of_step in range(0, size, elements_per_step):
+        sorted_numbers.extend(shared_array[start_of_step:min(start_of_step + elements_per_step, size)].tolist())
+        yield
+
+    return sorted_numbers
+
+
+async def running_in_a_worker_process(worker_function, number_list, typecode, algorithm_name, arguments, copy_back, loop_blocking_meter,
+                                      time_budget_ns):
+
+    #The event loop is only kept while the numbers are copied in and out of the shared memory block (a step at a time), and is free
+    #the whole time the worker process runs
+    shared_memory_block = shared_memory.SharedMemory(create=True, size=len(number_list) * array(typecode).itemsize)
+    try:
+        with shared_memory_block.buf.cast(typecode) as shared_array:
+            await running_the_steps(copying_into_shared_memory_steps(shared_array, number_list, typecode), loop_blocking_meter, time_budget_ns)
+
+            #Submitting the call starts the worker processes the first time, which is still done on the event loop
+            result = asyncio.get_running_loop().run_in_executor(getting_the_process_pool(), worker_function, shared_memory_block.name,
+                                                                typecode, len(number_list), algorithm_name, arguments)
+            loop_blocking_meter.ending_a_slice()
+            result = await result
+            loop_blocking_meter.starting_a_slice()
+
+            if copy_back:
+                number_list[:] = await running_the_steps(copying_out_of_shared_memory_steps(shared_array, len(number_list)),
+                                                         loop_blocking_meter, time_budget_ns)
+    finally:
+        shared_memory_block.close()
+        shared_memory_block.unlink()
+
+    return result
+
+
+async def running_an_algorithm(function_name, mode, steps, offloaded_call, number_list, typecode, time_budget_ms, timing_collector):
+
+    #'steps' is the generator of the cooperative algorithm, and 'offloaded_call' is (worker function, name of the normal algorithm in
+    #the 'searching_and_sorting_algorithms' package, its arguments after the list, whether the list is sorted and has to be copied back)
+    if mode not in modes:
+        raise ValueError(f"Unknown mode {mode!r}, expected one of {modes}")
+
+    loop_blocking_meter = LoopBlockingMeter()
+    time_budget_ns = int(time_budget_ms * 1e6)
+
+    try:
+        #An empty list can't be put into a shared memory block, and has nothing to offload anyway
+        if mode == 'cooperative' or not number_list:
+            return await running_the_steps(steps, loop_blocking_meter, time_budget_ns)
+
+        worker_function, algorithm_name, arguments, copy_back = offloaded_call
+        result = await running_in_a_worker_process(worker_function, number_list, typecode, algorithm_name, arguments, copy_back,
+                                                   loop_blocking_meter, time_budget_ns)
+        return number_list if copy_back else result
+
+    finally:
+        loop_blocking_meter.ending_a_slice()
+        loop_blocking_meter.recording(timing_collector, f"{function_name} ({mode})")
+
+
+#~~~(The async Sorting and Searching Algorithms)~~~
+
+async def async_shell_sort(number_list, gap_sequence='shell', mode='cooperative', time_budget_ms=time_budget_ms, typecode='q',
+                           timing_collector=loop_blocking_collector):
+    return await running_an_algorithm('async_shell_sort', mode, shell_sort_steps(number_list, gap_sequence),
+                                      (sorting_in_shared_memory, 'shell_sort', (None, False, gap_sequence), True),
+                                      number_list, typecode, time_budget_ms, timing_collector)
+
+
+async def async_merge_sort(number_list, mode='cooperative', time_budget_ms=time_budget_ms, typecode='q',
+                           timing_collector=loop_blocking_collector):
+    return await running_an_algorithm('async_merge_sort', mode, merge_sort_steps(number_list),
+                                      (sorting_in_shared_memory, 'bottom_up_merge_sort', (), True),
+                                      number_list, typecode, time_budget_ms, timing_collector)
+
+
+async def async_quick_sort(number_list, mode='cooperative', time_budget_ms=time_budget_ms, typecode='q',
+                           timing_collector=loop_blocking_collector):
+
+    #Offloaded, the worker uses the Intro Sort Algorithm, which never recurses and so never hits the recursion limit of the worker
+    return await running_an_algorithm('async_quick_sort', mode, quick_sort_steps(number_list),
+                                      (sorting_in_shared_memory, 'intro_sort', (), True),
+                                      number_list, typecode, time_budget_ms, timing_collector)
+
+
+async def async_linear_search(numbers_list, number_to_find, mode='cooperative', time_budget_ms=time_budget_ms, typecode='q',
+                              timing_collector=loop_blocking_collector):
+    return await running_an_algorithm('async_linear_search', mode, linear_search_steps(numbers_list, number_to_find),
+                                      (searching_in_shared_memory, 'linear_search', (number_to_find,), False),
+                                      numbers_list, typecode, time_budget_ms, timing_collector)
+
+
+async def async_batch_binary_search(sorted_list, keys, match_position='leftmost', mode='cooperative', time_budget_ms=time_budget_ms,
+                                    typecode='q', timing_collector=loop_blocking_collector):
+    return await running_an_algorithm('async_batch_binary_search', mode, batch_binary_search_steps(sorted_list, keys, match_position),
+                                      (searching_in_shared_memory, 'batch_binary_search', (keys, match_position), False),
+                                      sorted_list, typecode, time_budget_ms, timing_collector)
+
+
+if __name__ == '__main__':
+    async def main():
+        nums_list = [21, 38, 29, 17, 4, 25, 32, 9]
+        await async_shell_sort(nums_list)
+        print(nums_list)
+
+        nums_list = [21, 38, 29, 17, 4, 25, 32, 9]
+        await async_quick_sort(nums_list, mode='offload')
+        print(nums_list)
+
+        index = await async_linear_search(nums_list, 32)
+        print(f"Number found at index {index} using the async Linear Search")
+        print(loop_blocking_collector.report())
+
+    asyncio.run(main())
+    shutting_down_the_process_pool()
@@ -0,0 +1,62 @@
+#These fixture functions are used by the 'comparing_the_time_complexity_of_the_searching_algorithms_and_searching_pythonically.py' and the
+#'comparing_the_time_complexity_of_the_sorting_algorithms_and_sorting_pythonically.py' files, to load the large unsorted Lists they test
+#the algorithms on instead of having them written out in the source code as list literals (which Python has to parse and compile on
+#every run)
+
+#Every fixture is a plain dump of an 'array' of numbers ('array.tofile'), little-endian, in the 'fixtures' folder next to this file. A
+#fixture is memory mapped and copied into an array in one go the first time it is loaded, and every later load of the same fixture only
+#makes a new list from that array
+
+import functools
+import mmap
+import os
+import sys
+from array import array
+
+fixtures_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def fixture_file_path(fixture_name):
+    return os.path.join(fixtures_directory, fixture_name + '.bin')
+
+
+@functools.lru_cache(maxsize=None)
+def mapping_a_fixture(fixture_name, typecode='q'):
+
+    #The numbers of a fixture as an array, shared by every load of the fixture, so it must never be changed
+    numbers = array(typecode)
+
+    with open(fixture_file_path(fixture_name), 'rb') as fixture_file:
+        if os.fstat(fixture_file.fileno()).st_size % numbers.itemsize:
+            raise ValueError(f"The fixture {fixture_name!r} is not a whole number of {numbers.itemsize} byte numbers")
+
+        with mmap.mmap(fixture_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            numbers.frombytes(mapped_file)
+
+    #The fixtures are stored little-endian, so they load the same on every machine
+    if sys.byteorder == 'big':
+        numbers.byteswap()
+
+    return numbers
+
+
+def loading_a_fixture(fixture_name, typecode='q'):
+
+    #A new list of the numbers of a fixture, that can be sorted in place without changing the fixture for the next load
+    return mapping_a_fixture(fixture_name, typecode).tolist()
+
+
+def writing_a_fixture(fixture_name, numbers, typecode='q'):
+    numbers = array(typecode, numbers)
+    if sys.byteorder == 'big':
+        numbers.byteswap()
+
+    with open(fixture_file_path(fixture_name), 'wb') as fixture_file:
+        numbers.tofile(fixture_file)
+
+    mapping_a_fixture.cache_clear()
+
+
+if __name__ == '__main__':
+    large_unsorted_list = loading_a_fixture('large_unsorted_list_for_sorting')
+    print(f"Loaded {len(large_unsorted_list)} numbers, starting with {large_unsorted_list[:8]}")
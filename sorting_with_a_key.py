@@ -0,0 +1,98 @@
+#This sorting_with_a_key function is used by the Sorting Algorithm files (Bubble, Quick, Insertion, Shell, Merge and Selection Sort) to
+#support the 'key' and 'reverse' arguments of Python's own 'sorted', without changing the Sorting Algorithms themselves
+
+#The key of every element is computed exactly once, into a list of (key, index) pairs (decorate), the Sorting Algorithm sorts those pairs,
+#and the sorted order of the indices (the permutation) is then applied to the list in place (undecorate). The pairs are compared as plain
+#tuples, so no comparison goes through a Python '__lt__' method, and the elements themselves are never compared at all
+
+#Every index is different, so 2 pairs are never equal and equal keys always stay in the order of their elements in the list. This means
+#that sorting with a 'key' or 'reverse' is stable with every Sorting Algorithm, even the ones that are not stable on their own (Quick,
+#Shell and Selection Sort)
+
+from optional_numpy import is_a_numpy_array
+
+
+def decorating_the_list(number_list, key, reverse, start_index_of_list, end_index_of_list):
+
+    #(key, index) pairs of number_list[start_index_of_list:end_index_of_list + 1], with indices counted from start_index_of_list. For
+    #'reverse', the indices are negated, so that once the sorted pairs are read backwards, equal keys are still in their original order
+    if key is None:
+        key = lambda element: element
+
+    if reverse:
+        return [(key(number_list[i]), start_index_of_list - i) for i in range(start_index_of_list, end_index_of_list + 1)]
+    return [(key(number_list[i]), i - start_index_of_list) for i in range(start_index_of_list, end_index_of_list + 1)]
+
+
+def undecorating_the_list(decorated_list, reverse):
+
+    #The permutation: the original index (from the start of the sorted part) of the element that goes at every position
+    if reverse:
+        return [-index for key, index in reversed(decorated_list)]
+    return [index for key, index in decorated_list]
+
+
+def applying_a_permutation(number_list, permutation, start_index_of_list=0):
+
+    #Moves the element at number_list[start_index_of_list + permutation[i]] to number_list[start_index_of_list + i] for every i, in place.
+    #A permutation is made of cycles (i -> permutation[i] -> permutation[permutation[i]] -> ... -> i), and every cycle is rotated by one
+    #with a single temporary element, so every element is written exactly once and only a list of booleans is needed on the side
+    if is_a_numpy_array(number_list):
+        end_index_of_list = start_index_of_list + len(permutation)
+        number_list[start_index_of_list:end_index_of_list] = number_list[start_index_of_list:end_index_of_list][permutation]
+        return
+
+    placed = [False] * len(permutation)
+
+    for start_of_cycle in range(len(permutation)):
+        if placed[start_of_cycle]:
+            continue
+
+        temp = number_list[start_index_of_list + start_of_cycle]
+        i = start_of_cycle
+
+        while permutation[i] != start_of_cycle:
+            number_list[start_index_of_list + i] = number_list[start_index_of_list + permutation[i]]
+            placed[i] = True
+            i = permutation[i]
+
+        number_list[start_index_of_list + i] = temp
+        placed[i] = True
+
+
+def sorting_with_a_key(number_list, key, reverse, sorting_a_list, start_index_of_list=0, end_index_of_list=None):
+
+    #Sorts number_list[start_index_of_list:end_index_of_list + 1] in place by key(element) (largest first for 'reverse'), where
+    #'sorting_a_list' is a function that sorts a whole list in place with one of the Sorting Algorithms
+    if end_index_of_list is None:
+        end_index_of_list = len(number_list) - 1
+
+    if start_index_of_list >= end_index_of_list:
+        return number_list
+
+    decorated_list = decorating_the_list(number_list, key, reverse, start_index_of_list, end_index_of_list)
+    sorting_a_list(decorated_list)
+    applying_a_permutation(number_list, undecorating_the_list(decorated_list, reverse), start_index_of_list)
+    return number_list
+
+
+def argsort(number_list, key=None, reverse=False, sorting_a_list=None):
+
+    #The indices of the elements of number_list in sorted order (e.g. [30, 10, 20] -> [1, 2, 0]), without moving the elements. Equal
+    #keys keep their order in the list. The (key, index) pairs are sorted with the Intro Sort Algorithm, unless another function that
+    #sorts a whole list in place is given as 'sorting_a_list'
+    if sorting_a_list is None:
+        from import_algorithm_file import import_algorithm_file
+        sorting_a_list = import_algorithm_file('5. Quick_Sort_(Sorting_Algorithm).py').intro_sort
+
+    decorated_list = decorating_the_list(number_list, key, reverse, 0, len(number_list) - 1)
+    sorting_a_list(decorated_list)
+    return undecorating_the_list(decorated_list, reverse)
+
+
+if __name__ == '__main__':
+    records = [('b', 21), ('a', 38), ('c', 21), ('d', 4)]
+    print(argsort(records, key=lambda record: record[1]))
+
+    sorting_with_a_key(records, lambda record: record[1], True, list.sort)
+    print(records)
@@ -0,0 +1,6 @@
+#Puts the repository folder on the import path, so the tests can import 'import_algorithm_file', 'sorting_with_a_key' and the
+#'searching_and_sorting_algorithms' package however pytest is started
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
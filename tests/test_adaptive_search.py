@@ -0,0 +1,102 @@
+#Checks the Interpolation Search, Exponential Search and adaptive 'search' functions against a plain scan of the list, on uniformly
+#distributed, skewed and duplicate-heavy lists, and with NumPy integers near the largest 64-bit integer
+
+import random
+import threading
+
+import pytest
+
+from import_algorithm_file import import_algorithm_file
+
+binary_search_module = import_algorithm_file('2. Iterative_Binary_Search_(Searching_Algorithm).py')
+
+searching_algorithms = {
+    'interpolation_search': binary_search_module.interpolation_search,
+    'exponential_search': binary_search_module.exponential_search,
+    'search': binary_search_module.search,
+}
+
+
+def making_sorted_lists(seed):
+    random_number_generator = random.Random(seed)
+    return {
+        'empty': [],
+        'one': [5],
+        'uniform': list(range(0, 3000, 3)),
+        'uniform_random': sorted(random_number_generator.randrange(10**6) for i in range(1000)),
+        'skewed': sorted(2 ** random_number_generator.randrange(60) for i in range(1000)),
+        'few_unique': sorted(random_number_generator.randrange(4) for i in range(500)),
+        'floats': sorted(random_number_generator.random() for i in range(500)),
+    }
+
+
+def checking_an_index(sorted_list, number_to_find, index):
+    if number_to_find in sorted_list:
+        assert sorted_list[index] == number_to_find
+    else:
+        assert index == -1
+
+
+@pytest.mark.parametrize('algorithm_name', list(searching_algorithms))
+def test_searching_finds_every_number(algorithm_name):
+    for name, sorted_list in making_sorted_lists(0).items():
+        numbers_to_find = set(sorted_list[::7]) | {-1, 10**20, 1, 2, 3, 0.5}
+        for number_to_find in numbers_to_find:
+            checking_an_index(sorted_list, number_to_find, searching_algorithms[algorithm_name](sorted_list, number_to_find))
+
+
+def test_search_takes_the_uniformity_verdict_from_the_caller():
+    for name, sorted_list in making_sorted_lists(1).items():
+        for uniformly_distributed in [None, True, False]:
+            for number_to_find in sorted_list[::11] + [-1]:
+                checking_an_index(sorted_list, number_to_find,
+                                  binary_search_module.search(sorted_list, number_to_find, uniformly_distributed))
+
+
+def test_search_remembers_nothing_between_lists():
+
+    #A uniform list and a skewed list searched one after the other (the second one reusing the memory, and often the id, of the first)
+    assert not hasattr(binary_search_module, 'last_uniformity_check')
+
+    for seed in range(20):
+        sorted_lists = making_sorted_lists(seed)
+        uniform_list = sorted_lists['uniform']
+        assert binary_search_module.search(uniform_list, uniform_list[700]) == 700
+        del uniform_list, sorted_lists
+
+        skewed_list = making_sorted_lists(seed)['skewed']
+        checking_an_index(skewed_list, skewed_list[900], binary_search_module.search(skewed_list, skewed_list[900]))
+
+
+def test_search_from_many_threads():
+    sorted_lists = list(making_sorted_lists(2).values())
+    failures = []
+
+    def searching_every_list():
+        for i in range(200):
+            for sorted_list in sorted_lists:
+                number_to_find = sorted_list[i % len(sorted_list)] if sorted_list else 0
+                index = binary_search_module.search(sorted_list, number_to_find)
+                if sorted_list and sorted_list[index] != number_to_find:
+                    failures.append((sorted_list[:3], number_to_find, index))
+
+    threads = [threading.Thread(target=searching_every_list) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert failures == []
+
+
+def test_interpolation_search_never_overflows_numpy_integers():
+    np = pytest.importorskip('numpy')
+
+    #(number_to_find - left_number) * (right_index - left_index) is far past the largest 64-bit integer here
+    sorted_array = np.array([0, 1, 2, 3, 2**62, 2**63 - 3, 2**63 - 2, 2**63 - 1], dtype=np.int64)
+    sorted_list_of_numpy_integers = list(sorted_array)
+
+    for index, number_to_find in enumerate(sorted_array):
+        assert binary_search_module.interpolation_search(sorted_array, number_to_find) == index
+        assert binary_search_module.interpolation_search(sorted_list_of_numpy_integers, number_to_find) == index
+        assert binary_search_module.search(sorted_list_of_numpy_integers, number_to_find) == index
@@ -0,0 +1,135 @@
+#Checks that the async Sorting Algorithms sort like 'sorted', and that cancelling one while it is suspended (e.g. by 'asyncio.wait_for'
+#running out of time) always leaves the list holding the same numbers it started with, in whatever order
+
+import asyncio
+import random
+
+import pytest
+
+import searching_and_sorting_algorithms
+from searching_and_sorting_algorithms import asynchronous_algorithms
+
+async_sorting_algorithms = {
+    'async_shell_sort': asynchronous_algorithms.async_shell_sort,
+    'async_merge_sort': asynchronous_algorithms.async_merge_sort,
+    'async_quick_sort': asynchronous_algorithms.async_quick_sort,
+}
+
+
+@pytest.fixture(scope='module', autouse=True)
+def shutting_down_the_process_pool_at_the_end():
+    yield
+    asynchronous_algorithms.shutting_down_the_process_pool()
+
+
+def making_a_list(size, seed):
+    random_number_generator = random.Random(seed)
+    return [random_number_generator.randrange(-10**6, 10**6) for i in range(size)]
+
+
+async def cancelling_after_some_turns(sorting_coroutine, number_of_turns):
+
+    #Lets the sort run for 'number_of_turns' turns of the event loop, then cancels it wherever it is suspended, and gives back how many
+    #turns the sort had taken if it finished first
+    task = asyncio.create_task(sorting_coroutine)
+    for turn in range(number_of_turns):
+        await asyncio.sleep(0)
+        if task.done():
+            return turn
+
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    return None
+
+
+def turns_to_cancel_at(sorting_a_list, original_list, number_of_cancels):
+
+    #Turns of the event loop spread evenly over a whole sort, found by letting one sort run to the end first
+    number_of_turns = asyncio.run(cancelling_after_some_turns(sorting_a_list(original_list[:]), 10**9))
+    return sorted({number_of_turns * i // number_of_cancels for i in range(number_of_cancels)})
+
+
+@pytest.mark.parametrize('mode', asynchronous_algorithms.modes)
+@pytest.mark.parametrize('algorithm_name', list(async_sorting_algorithms))
+def test_async_sorting_sorts(algorithm_name, mode):
+    for size in [0, 1, 2, 1000, 20000]:
+        number_list = making_a_list(size, size)
+        expected = sorted(number_list)
+
+        asyncio.run(async_sorting_algorithms[algorithm_name](number_list, mode=mode, time_budget_ms=0,
+                                                             timing_collector=searching_and_sorting_algorithms.loop_blocking_collector))
+        assert number_list == expected
+
+
+@pytest.mark.parametrize('algorithm_name', list(async_sorting_algorithms))
+def test_cancelling_a_cooperative_sort_keeps_every_number(algorithm_name):
+
+    #A time budget of 0 gives the event loop back after every step, so the sort is cancelled in every phase of the sort (the Insertion
+    #Sort runs, every merge level, every partition and the final copy back)
+    def sorting_a_list(number_list):
+        return async_sorting_algorithms[algorithm_name](number_list, time_budget_ms=0)
+
+    original_list = making_a_list(20000, 1)
+    for number_of_turns in turns_to_cancel_at(sorting_a_list, original_list, 60):
+        number_list = original_list[:]
+        asyncio.run(cancelling_after_some_turns(sorting_a_list(number_list), number_of_turns))
+        assert sorted(number_list) == sorted(original_list)
+
+
+@pytest.mark.parametrize('algorithm_name', list(async_sorting_algorithms))
+def test_cancelling_an_offloaded_sort_keeps_every_number(algorithm_name):
+
+    #The sort is cancelled while the numbers are copied in, or while the worker process sorts them
+    def sorting_a_list(number_list):
+        return async_sorting_algorithms[algorithm_name](number_list, mode='offload', time_budget_ms=0)
+
+    original_list = making_a_list(20000, 2)
+    for number_of_turns in [0, 1, 5, 10, 19, 21, 25, 30]:
+        number_list = original_list[:]
+        asyncio.run(cancelling_after_some_turns(sorting_a_list(number_list), number_of_turns))
+        assert sorted(number_list) == sorted(original_list)
+
+
+def test_cancelling_an_offloaded_sort_during_the_copy_back_keeps_every_number(monkeypatch):
+
+    #Waits until the worker process is done and the numbers are being copied back a step at a time, then cancels the sort
+    original_list = making_a_list(20000, 3)
+    number_list = original_list[:]
+    copying_out_of_shared_memory_steps = asynchronous_algorithms.copying_out_of_shared_memory_steps
+    copying_back = []
+
+    def copying_back_and_signalling(shared_array, size):
+        copying_back.append(True)
+        return (yield from copying_out_of_shared_memory_steps(shared_array, size))
+
+    monkeypatch.setattr(asynchronous_algorithms, 'copying_out_of_shared_memory_steps', copying_back_and_signalling)
+
+    async def cancelling_during_the_copy_back():
+        task = asyncio.create_task(asynchronous_algorithms.async_merge_sort(number_list, mode='offload', time_budget_ms=0))
+        while not copying_back:
+            await asyncio.sleep(0)
+
+        assert not task.done()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancelling_during_the_copy_back())
+    assert sorted(number_list) == sorted(original_list)
+
+
+@pytest.mark.parametrize('start_index_of_list, end_index_of_list', [(0, 999), (5000, 5999), (9000, 9999), (4321, 4321), (7000, 7001)])
+def test_merge_sort_steps_sorts_only_its_segment(start_index_of_list, end_index_of_list):
+    number_list = making_a_list(10000, 3)
+    original_list = number_list.copy()
+
+    steps = asynchronous_algorithms.merge_sort_steps(number_list, start_index_of_list, end_index_of_list)
+    for step in steps:
+        pass
+
+    assert number_list[start_index_of_list:end_index_of_list + 1] == sorted(original_list[start_index_of_list:end_index_of_list + 1])
+    assert number_list[:start_index_of_list] == original_list[:start_index_of_list]
+    assert number_list[end_index_of_list + 1:] == original_list[end_index_of_list + 1:]
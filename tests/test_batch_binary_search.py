@@ -0,0 +1,45 @@
+#Checks the batched Binary Search Algorithm against 'bisect', for the leftmost and the rightmost of every key's duplicates, with the
+#keys given in any order and with keys missing from the list
+
+import bisect
+import random
+
+import pytest
+
+from import_algorithm_file import import_algorithm_file
+
+binary_search_module = import_algorithm_file('2. Iterative_Binary_Search_(Searching_Algorithm).py')
+
+
+def finding_with_bisect(sorted_list, key, match_position):
+    if match_position == 'leftmost':
+        index = bisect.bisect_left(sorted_list, key)
+        return index if index < len(sorted_list) and sorted_list[index] == key else -1
+
+    index = bisect.bisect_right(sorted_list, key) - 1
+    return index if index >= 0 and sorted_list[index] == key else -1
+
+
+@pytest.mark.parametrize('match_position', ['leftmost', 'rightmost'])
+def test_batch_binary_search(match_position):
+    random_number_generator = random.Random(0)
+
+    for size_of_list, largest_number, number_of_keys in [(0, 5, 3), (1, 2, 4), (10, 3, 20), (100, 50, 100), (1000, 100, 30), (1000, 10**6, 500)]:
+        sorted_list = sorted(random_number_generator.randrange(largest_number) for i in range(size_of_list))
+        keys = [random_number_generator.randrange(-1, largest_number + 1) for i in range(number_of_keys)]
+
+        assert binary_search_module.batch_binary_search(sorted_list, keys, match_position) == \
+            [finding_with_bisect(sorted_list, key, match_position) for key in keys]
+
+
+def test_batch_binary_search_of_duplicates():
+    sorted_list = [1, 2, 2, 2, 5, 5, 9]
+    keys = [9, 5, 2, 1, 2, 0, 10, 3]
+
+    assert binary_search_module.batch_binary_search(sorted_list, keys) == [6, 4, 1, 0, 1, -1, -1, -1]
+    assert binary_search_module.batch_binary_search(sorted_list, keys, 'rightmost') == [6, 5, 3, 0, 3, -1, -1, -1]
+
+
+def test_batch_binary_search_with_an_unknown_match_position():
+    with pytest.raises(ValueError, match='Unknown match position'):
+        binary_search_module.batch_binary_search([1, 2, 3], [2], 'middle')
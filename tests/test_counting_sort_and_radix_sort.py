@@ -0,0 +1,96 @@
+#Checks the Counting Sort, LSD Radix Sort and integer sort functions against 'sorted', on lists and typed arrays, with negative
+#numbers, and that the integer sort picks the sorting algorithm that fits the range of the keys
+
+from array import array
+import random
+
+import pytest
+
+from import_algorithm_file import import_algorithm_file
+
+counting_sort_and_radix_sort_module = import_algorithm_file('13. Counting_Sort_And_Radix_Sort_(Sorting_Algorithm).py')
+
+
+def making_a_list(size, smallest_number, largest_number, seed):
+    random_number_generator = random.Random(seed)
+    return [random_number_generator.randint(smallest_number, largest_number) for i in range(size)]
+
+
+@pytest.mark.parametrize('smallest_number, largest_number', [(0, 10), (-10, 10), (-1000, -900), (-5, -5)])
+def test_counting_sort(smallest_number, largest_number):
+    for size in [0, 1, 2, 100, 1000]:
+        number_list = making_a_list(size, smallest_number, largest_number, size)
+        expected_list = sorted(number_list)
+
+        assert counting_sort_and_radix_sort_module.counting_sort(number_list) is number_list
+        assert number_list == expected_list
+
+
+@pytest.mark.parametrize('largest_number', [0, 255, 256, 2**16, 2**31 - 1, 2**64 - 1])
+@pytest.mark.parametrize('typecode', [None, 'I', 'Q'])
+def test_lsd_radix_sort(typecode, largest_number):
+    if typecode == 'I' and largest_number >= 2**32:
+        pytest.skip("The keys don't fit in an array('I')")
+
+    for size in [0, 1, 2, 100, 1000]:
+        number_list = making_a_list(size, 0, largest_number, size)
+        if typecode is not None:
+            number_list = array(typecode, number_list)
+        expected_list = sorted(number_list)
+
+        assert counting_sort_and_radix_sort_module.lsd_radix_sort(number_list) is number_list
+        assert list(number_list) == expected_list
+
+
+def test_lsd_radix_sort_with_an_output_buffer_from_the_caller():
+    output_buffer = [0] * 1000
+
+    for seed in range(5):
+        for size in [2, 10, 999, 1000]:
+            number_list = making_a_list(size, 0, 2**40, seed)
+            expected_list = sorted(number_list)
+            counting_sort_and_radix_sort_module.lsd_radix_sort(number_list, output_buffer)
+
+            assert number_list == expected_list
+
+    with pytest.raises(ValueError, match='it needs at least 1001'):
+        counting_sort_and_radix_sort_module.lsd_radix_sort(making_a_list(1001, 0, 100, 0), output_buffer)
+
+
+def test_lsd_radix_sort_with_negative_numbers():
+    number_list = [3, -1, 2]
+
+    with pytest.raises(ValueError, match='only sorts non-negative integers'):
+        counting_sort_and_radix_sort_module.lsd_radix_sort(number_list)
+    assert number_list == [3, -1, 2]
+
+
+@pytest.mark.parametrize('smallest_number, largest_number, sorting_algorithm_name', [
+    (-100, 100, 'counting_sort'),
+    (-10**6, -10**6 + 500, 'counting_sort'),
+    (0, 2**16, 'lsd_radix_sort'),
+    (-2**16, 2**16, 'tim_sort'),
+    (-2**70, 2**70, 'tim_sort'),
+    (0, 2**70, 'tim_sort'),
+])
+def test_integer_sort_picks_a_sorting_algorithm(monkeypatch, smallest_number, largest_number, sorting_algorithm_name):
+    sorting_algorithms_used = []
+
+    for name in ['counting_sort', 'lsd_radix_sort', 'tim_sort']:
+        sorting_algorithm = getattr(counting_sort_and_radix_sort_module, name)
+        monkeypatch.setattr(counting_sort_and_radix_sort_module, name,
+                            lambda *arguments, name=name, sorting_algorithm=sorting_algorithm:
+                            sorting_algorithms_used.append(name) or sorting_algorithm(*arguments))
+
+    number_list = making_a_list(1000, smallest_number, largest_number, 0)
+    expected_list = sorted(number_list)
+    counting_sort_and_radix_sort_module.integer_sort(number_list)
+
+    assert number_list == expected_list
+    assert sorting_algorithms_used == [sorting_algorithm_name]
+
+
+def test_integer_sort_of_numbers_that_are_not_all_integers():
+    for number_list, expected_list in [([3, -1.5, 2, True], [-1.5, True, 2, 3]), (array('d', [0.5, -2.0, 1.0]), [-2.0, 0.5, 1.0])]:
+        counting_sort_and_radix_sort_module.integer_sort(number_list)
+        assert list(number_list) == expected_list
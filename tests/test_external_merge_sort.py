@@ -0,0 +1,95 @@
+#Checks the External Merge Sort Algorithm against 'sorted', with memory budgets small enough to need several merge passes and with
+#every fan-in, for records of one number and of several fields, read with plain reads and through memory maps
+
+import random
+import struct
+
+import pytest
+
+from import_algorithm_file import import_algorithm_file
+
+external_merge_sort_module = import_algorithm_file('14. External_Merge_Sort_(Sorting_Algorithm).py')
+
+
+def making_records(record_format, size, seed):
+    random_number_generator = random.Random(seed)
+    if record_format == 'q':
+        return [(random_number_generator.randrange(-2**63, 2**63),) for i in range(size)]
+    if record_format == 'd':
+        return [(random_number_generator.uniform(-1e9, 1e9),) for i in range(size)]
+    return [(random_number_generator.randrange(-5, 5), random_number_generator.random()) for i in range(size)]
+
+
+def sorting_a_file(tmp_path, records, record_format, **options):
+    record_struct = struct.Struct(record_format)
+    input_file_path = tmp_path / 'records.bin'
+    input_file_path.write_bytes(b''.join(record_struct.pack(*record) for record in records))
+
+    output_file_path = external_merge_sort_module.external_merge_sort(str(input_file_path), str(tmp_path / 'sorted_records.bin'),
+                                                                      record_format, **options)
+    with open(output_file_path, 'rb') as output_file:
+        return list(record_struct.iter_unpack(output_file.read()))
+
+
+@pytest.fixture
+def merges(monkeypatch):
+
+    #Read buffers of at least 1 record (instead of 64 KB), so a memory budget of a few hundred bytes can merge several runs at once.
+    #Every merge is recorded as the number of runs it merged
+    monkeypatch.setattr(external_merge_sort_module, 'minimum_merge_buffer_size', 8)
+    merges = []
+    merging_runs = external_merge_sort_module.merging_runs
+
+    def recording_a_merge(run_file_paths, *args):
+        merges.append(len(run_file_paths))
+        return merging_runs(run_file_paths, *args)
+
+    monkeypatch.setattr(external_merge_sort_module, 'merging_runs', recording_a_merge)
+    return merges
+
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+@pytest.mark.parametrize('record_format', ['q', 'd', '<qd'])
+@pytest.mark.parametrize('maximum_fan_in', [2, 3, 7])
+def test_external_merge_sort_with_several_merge_passes(tmp_path, merges, maximum_fan_in, record_format, use_mmap):
+    records = making_records(record_format, 500, maximum_fan_in)
+
+    #memory budget // 8 - 1 runs are merged at a time
+    memory_budget = 8 * (maximum_fan_in + 1)
+    sorted_records = sorting_a_file(tmp_path, records, record_format, memory_budget=memory_budget, use_mmap=use_mmap)
+
+    assert sorted_records == sorted(records)
+
+    records_per_run = max(1, memory_budget // (external_merge_sort_module.in_memory_size_factor * struct.calcsize(record_format)))
+    number_of_runs = -(-len(records) // records_per_run)
+    number_of_merges_of_every_pass = []
+    while number_of_runs > 1:
+        number_of_runs = -(-number_of_runs // maximum_fan_in)
+        number_of_merges_of_every_pass.append(number_of_runs)
+
+    assert len(merges) == sum(number_of_merges_of_every_pass)
+    assert len(number_of_merges_of_every_pass) > 1
+    assert max(merges) == maximum_fan_in
+
+
+@pytest.mark.parametrize('size', [0, 1, 100])
+def test_external_merge_sort_of_a_file_that_fits_in_memory(tmp_path, merges, size):
+    records = making_records('q', size, size)
+
+    assert sorting_a_file(tmp_path, records, 'q') == sorted(records)
+    assert merges == []
+
+
+def test_external_merge_sort_with_a_sorting_algorithm_from_the_caller(tmp_path):
+    records = making_records('<qd', 300, 0)
+    sorted_records = sorting_a_file(tmp_path, records, '<qd', memory_budget=1024, sorting_algorithm=lambda records: records.sort())
+
+    assert sorted_records == sorted(records)
+
+
+def test_external_merge_sort_of_a_file_of_part_of_a_record(tmp_path):
+    input_file_path = tmp_path / 'records.bin'
+    input_file_path.write_bytes(bytes(12))
+
+    with pytest.raises(ValueError, match='not a whole number of 8 byte records'):
+        external_merge_sort_module.external_merge_sort(str(input_file_path), str(tmp_path / 'sorted_records.bin'))
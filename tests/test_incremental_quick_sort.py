@@ -0,0 +1,73 @@
+#Checks the sorted stream of the Incremental Quick Sort Algorithm against 'sorted' with every partition scheme, that taking only the
+#first few elements does only a fraction of the work of sorting everything, and the top k and bottom k elements against 'heapq'
+
+import heapq
+import itertools
+import random
+
+import pytest
+
+from import_algorithm_file import import_algorithm_file
+from operation_counting import CountedElement, OperationCounts
+
+incremental_quick_sort_module = import_algorithm_file('17. Incremental_Quick_Sort_(Sorting_Algorithm).py')
+partition_schemes = import_algorithm_file('5. Quick_Sort_(Sorting_Algorithm).py').partition_schemes
+
+
+def making_lists(size, seed):
+    random_number_generator = random.Random(seed)
+    return {
+        'random': [random_number_generator.randrange(-10**6, 10**6) for i in range(size)],
+        'sorted': list(range(size)),
+        'reverse_sorted': list(range(size, 0, -1)),
+        'few_unique': [random_number_generator.randrange(3) for i in range(size)],
+        'organ_pipe': list(range(size // 2)) + list(range(size - size // 2, 0, -1)),
+    }
+
+
+@pytest.mark.parametrize('partition_scheme', partition_schemes)
+def test_sorted_stream(partition_scheme):
+    for size in [0, 1, 2, 17, 1000]:
+        for name, number_list in making_lists(size, size).items():
+            original_list = number_list.copy()
+
+            assert list(incremental_quick_sort_module.sorted_stream(number_list, partition_scheme)) == sorted(original_list)
+            assert list(incremental_quick_sort_module.sorted_stream(iter(number_list), partition_scheme)) == sorted(original_list)
+            assert number_list == original_list
+
+
+def test_sorted_stream_with_no_depth_budget(monkeypatch):
+
+    #Every segment larger than the Insertion Sort cutoff is sorted with the Heap Sort Algorithm
+    monkeypatch.setattr(incremental_quick_sort_module.math, 'log2', lambda size: 0)
+
+    for name, number_list in making_lists(1000, 0).items():
+        assert list(incremental_quick_sort_module.sorted_stream(number_list)) == sorted(number_list)
+
+
+def test_sorted_stream_only_sorts_what_is_taken():
+
+    #The comparisons made to take the 10 smallest of 10000 elements are counted, and compared with those made to take all of them
+    def counting_the_comparisons(number_of_elements_taken):
+        operation_counts = OperationCounts()
+        number_list = [CountedElement(number, operation_counts) for number in making_lists(10000, 1)['random']]
+        stream = incremental_quick_sort_module.sorted_stream(number_list)
+        taken_elements = [element.value for element in itertools.islice(stream, number_of_elements_taken)]
+        return taken_elements, operation_counts.comparisons
+
+    first_elements, comparisons_for_the_first_elements = counting_the_comparisons(10)
+    every_element, comparisons_for_every_element = counting_the_comparisons(10000)
+
+    assert first_elements == every_element[:10] == sorted(making_lists(10000, 1)['random'])[:10]
+    assert comparisons_for_the_first_elements < comparisons_for_every_element / 4
+
+
+@pytest.mark.parametrize('k', [-1, 0, 1, 5, 999, 1000, 2000])
+def test_top_k_and_bottom_k(k):
+    for name, number_list in making_lists(1000, k).items():
+        assert incremental_quick_sort_module.top_k(number_list, k) == heapq.nlargest(k, number_list)
+        assert incremental_quick_sort_module.bottom_k(number_list, k) == heapq.nsmallest(k, number_list)
+
+        #Generators are only gone through once
+        assert incremental_quick_sort_module.top_k(iter(number_list), k) == heapq.nlargest(k, number_list)
+        assert incremental_quick_sort_module.bottom_k(iter(number_list), k) == heapq.nsmallest(k, number_list)
@@ -0,0 +1,110 @@
+#Checks the Insertion Sort, Binary Insertion Sort and Galloping Insertion Sort Algorithms against 'sorted' on lists and typed arrays,
+#on whole lists and parts of them, that they keep equal keys in their original order, and the galloping search they use
+
+from array import array
+import bisect
+import functools
+import random
+
+import pytest
+
+from import_algorithm_file import import_algorithm_file
+from operation_counting import CountedElement, OperationCounts
+
+insertion_sort_module = import_algorithm_file('6. Insertion_Sort_(Sorting_Algorithm).py')
+
+insertion_sorting_algorithms = {
+    'insertion_sort': insertion_sort_module.insertion_sort,
+    'binary_insertion_sort': insertion_sort_module.binary_insertion_sort,
+    'galloping_insertion_sort': insertion_sort_module.galloping_insertion_sort,
+}
+
+
+@functools.total_ordering
+class Record:
+
+    #Only 'key' is compared, so records with equal keys can only be told apart by 'position', their index in the unsorted list
+    def __init__(self, key, position):
+        self.key = key
+        self.position = position
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+
+def making_lists(size, seed):
+    random_number_generator = random.Random(seed)
+    return {
+        'random': [random_number_generator.randrange(-10**6, 10**6) for i in range(size)],
+        'sorted': list(range(size)),
+        'reverse_sorted': list(range(size, 0, -1)),
+        'few_unique': [random_number_generator.randrange(3) for i in range(size)],
+        'nearly_sorted': [i + random_number_generator.randrange(-3, 4) for i in range(size)],
+    }
+
+
+@pytest.mark.parametrize('algorithm_name', list(insertion_sorting_algorithms))
+@pytest.mark.parametrize('typecode', [None, 'q'])
+def test_insertion_sorting(algorithm_name, typecode):
+    for size in [0, 1, 2, 10, 300]:
+        for name, number_list in making_lists(size, size).items():
+            if typecode is not None:
+                number_list = array(typecode, number_list)
+            expected_list = sorted(number_list)
+
+            insertion_sorting_algorithms[algorithm_name](number_list)
+            assert list(number_list) == expected_list, name
+
+
+@pytest.mark.parametrize('algorithm_name', list(insertion_sorting_algorithms))
+def test_insertion_sorting_part_of_a_list(algorithm_name):
+    number_list = list(range(20, 0, -1))
+    insertion_sorting_algorithms[algorithm_name](number_list, 5, 14)
+
+    assert number_list == list(range(20, 15, -1)) + list(range(6, 16)) + list(range(5, 0, -1))
+
+
+@pytest.mark.parametrize('algorithm_name', ['binary_insertion_sort', 'galloping_insertion_sort'])
+def test_insertion_sorting_after_a_sorted_part(algorithm_name):
+    for length_of_sorted_part in [0, 1, 5, 20]:
+        number_list = list(range(0, 40, 2))[:length_of_sorted_part] + [7, 3, 100, -1, 15, 15, 2]
+        expected_list = sorted(number_list)
+
+        insertion_sorting_algorithms[algorithm_name](number_list, 0, len(number_list) - 1, length_of_sorted_part)
+        assert number_list == expected_list
+
+
+@pytest.mark.parametrize('algorithm_name', list(insertion_sorting_algorithms))
+def test_insertion_sorting_is_stable(algorithm_name):
+    for name, number_list in making_lists(300, 1).items():
+        records = [Record(number % 7, position) for position, number in enumerate(number_list)]
+        insertion_sorting_algorithms[algorithm_name](records)
+
+        assert [(record.key, record.position) for record in records] == \
+            sorted((record.key, record.position) for record in records), name
+
+
+def test_galloping_search_from_the_right_agrees_with_bisect():
+    random_number_generator = random.Random(0)
+
+    for i in range(2000):
+        number_list = sorted(random_number_generator.randrange(50) for j in range(random_number_generator.randrange(1, 100)))
+        start_index = random_number_generator.randrange(len(number_list))
+        end_index = random_number_generator.randrange(start_index, len(number_list) + 1)
+        key = random_number_generator.randrange(-1, 51)
+
+        assert insertion_sort_module.galloping_search_from_the_right(number_list, key, start_index, end_index) == \
+            bisect.bisect_right(number_list, key, start_index, end_index)
+
+
+def test_galloping_insertion_sort_makes_fewer_comparisons_on_nearly_sorted_lists():
+    def counting_the_comparisons(algorithm_name):
+        operation_counts = OperationCounts()
+        number_list = [CountedElement(number, operation_counts) for number in making_lists(2000, 2)['nearly_sorted']]
+        insertion_sorting_algorithms[algorithm_name](number_list)
+        return operation_counts.comparisons
+
+    assert counting_the_comparisons('galloping_insertion_sort') < counting_the_comparisons('binary_insertion_sort')
@@ -0,0 +1,73 @@
+#Checks the Memory Mapped Binary Search against 'bisect' over the same records in memory, for keys below, among and above the keys in
+#the file, for records of one number (searched through a memoryview) and of several fields (searched through 'RecordKeys')
+
+import bisect
+import random
+import struct
+
+import pytest
+
+from import_algorithm_file import import_algorithm_file
+
+memory_mapped_binary_search_module = import_algorithm_file('15. Memory_Mapped_Binary_Search_(Searching_Algorithm).py')
+MemoryMappedSortedFile = memory_mapped_binary_search_module.MemoryMappedSortedFile
+
+
+def writing_a_sorted_file(tmp_path, record_format, key_field, keys):
+    random_number_generator = random.Random(len(keys))
+    record_struct = struct.Struct(record_format)
+
+    records = []
+    for key in sorted(keys):
+        record = [random_number_generator.randrange(100) for field in range(len(record_struct.unpack(bytes(record_struct.size))))]
+        record[key_field] = key
+        records.append(tuple(record))
+
+    file_path = tmp_path / 'sorted_records.bin'
+    file_path.write_bytes(b''.join(record_struct.pack(*record) for record in records))
+    return str(file_path), records
+
+
+@pytest.mark.parametrize('record_format, key_field', [('q', 0), ('d', 0), ('<qd', 0), ('<dq', 1), ('<qq', 1)])
+@pytest.mark.parametrize('size', [0, 1, 2, 100])
+def test_searching_a_memory_mapped_file(tmp_path, record_format, key_field, size):
+    random_number_generator = random.Random(size)
+    file_path, records = writing_a_sorted_file(tmp_path, record_format, key_field,
+                                               [random_number_generator.randrange(-20, 20) for i in range(size)])
+    keys = [record[key_field] for record in records]
+    record_size = struct.calcsize(record_format)
+
+    with MemoryMappedSortedFile(file_path, record_format, key_field) as sorted_file:
+        assert len(sorted_file) == size
+
+        for key in range(-22, 23):
+            assert sorted_file.lower_bound(key) == bisect.bisect_left(keys, key) * record_size
+            assert sorted_file.upper_bound(key) == bisect.bisect_right(keys, key) * record_size
+            assert [sorted_file.record_at(offset) for offset in sorted_file.range(key, key + 2)] == \
+                [record for record in records if key <= record[key_field] <= key + 2]
+
+            offset = sorted_file.find(key)
+            if key in keys:
+                assert sorted_file.record_at(offset)[key_field] == key
+            else:
+                assert offset == -1
+
+
+def test_record_keys(tmp_path):
+    file_path, records = writing_a_sorted_file(tmp_path, '<qd', 0, [1, 5, 9])
+
+    with MemoryMappedSortedFile(file_path, '<qd') as sorted_file:
+        assert isinstance(sorted_file.keys, memory_mapped_binary_search_module.RecordKeys)
+        assert [sorted_file.keys[i] for i in range(-3, 3)] == [1, 5, 9, 1, 5, 9]
+
+        for index in [3, -4]:
+            with pytest.raises(IndexError):
+                sorted_file.keys[index]
+
+
+def test_a_file_of_part_of_a_record(tmp_path):
+    file_path = tmp_path / 'sorted_records.bin'
+    file_path.write_bytes(bytes(20))
+
+    with pytest.raises(ValueError, match='not a whole number of 16 byte records'):
+        MemoryMappedSortedFile(str(file_path), '<qd')
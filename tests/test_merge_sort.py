@@ -0,0 +1,50 @@
+#Checks the Bottom-up Merge Sort Algorithm against 'sorted', with its own scratch buffer and with one passed in by the caller (reused
+#over many sorts, longer than the list, or too short)
+
+import random
+
+import pytest
+
+from import_algorithm_file import import_algorithm_file
+
+merge_sort_module = import_algorithm_file('8. Merge_Sort_(Sorting_Algorithm).py')
+
+
+def making_a_list(size, seed):
+    random_number_generator = random.Random(seed)
+    return [random_number_generator.randrange(-1000, 1000) for i in range(size)]
+
+
+#Sizes around the insertion sort runs, and ones that take an odd and an even number of merge passes
+sizes = [0, 1, 2, 31, 32, 33, 64, 65, 100, 128, 1000, 1025]
+
+
+@pytest.mark.parametrize('size', sizes)
+def test_bottom_up_merge_sort(size):
+    number_list = making_a_list(size, size)
+    expected_list = sorted(number_list)
+
+    assert merge_sort_module.bottom_up_merge_sort(number_list) is number_list
+    assert number_list == expected_list
+
+
+def test_bottom_up_merge_sort_with_a_scratch_buffer_from_the_caller():
+    scratch_buffer = [None] * max(sizes)
+
+    for seed in range(5):
+        for size in sizes:
+            number_list = making_a_list(size, seed)
+            expected_list = sorted(number_list)
+            merge_sort_module.bottom_up_merge_sort(number_list, scratch_buffer)
+
+            assert number_list == expected_list
+            assert len(scratch_buffer) == max(sizes)
+
+
+def test_bottom_up_merge_sort_with_a_scratch_buffer_that_is_too_short():
+    number_list = making_a_list(100, 0)
+    original_list = number_list.copy()
+
+    with pytest.raises(ValueError, match='it needs at least 100'):
+        merge_sort_module.bottom_up_merge_sort(number_list, [None] * 99)
+    assert number_list == original_list
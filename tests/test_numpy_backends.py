@@ -0,0 +1,95 @@
+#Checks that every Sorting Algorithm sorts a NumPy array like 'np.sort' (NaNs at the end, and strings or Python objects through the list
+#code), and that the Searching Algorithms give the same answers for a NumPy array as for a list
+
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+import searching_and_sorting_algorithms
+
+gap_sequences = searching_and_sorting_algorithms.gap_sequences
+
+sorting_algorithms = {
+    'bubble_sort': searching_and_sorting_algorithms.bubble_sort,
+    'quick_sort': lambda number_array: searching_and_sorting_algorithms.quick_sort(number_array, 0, len(number_array) - 1),
+    'intro_sort': searching_and_sorting_algorithms.intro_sort,
+    'insertion_sort': searching_and_sorting_algorithms.insertion_sort,
+    'binary_insertion_sort': searching_and_sorting_algorithms.binary_insertion_sort,
+    'galloping_insertion_sort': searching_and_sorting_algorithms.galloping_insertion_sort,
+    'merge_sort': searching_and_sorting_algorithms.merge_sort,
+    'bottom_up_merge_sort': searching_and_sorting_algorithms.bottom_up_merge_sort,
+    'selection_sort': searching_and_sorting_algorithms.selection_sort,
+}
+
+for gap_sequence in gap_sequences:
+    sorting_algorithms[f'shell_sort ({gap_sequence})'] = (
+        lambda number_array, gap_sequence=gap_sequence: searching_and_sorting_algorithms.shell_sort(number_array, gap_sequence=gap_sequence))
+
+
+def making_arrays():
+    random_number_generator = random.Random(0)
+    arrays = [
+        np.array([3, np.nan, 1, 2, np.nan, 0.5, 7, 4, 6]),
+        np.array([np.nan] * 5),
+        np.array([], dtype=float),
+        np.array([0.0, -0.0, 1.0, -0.0, np.inf, -np.inf]),
+        np.array([5, -3, 2, 127, -128], dtype=np.int8),
+        np.array([7, 0, 3, 2**64 - 1], dtype=np.uint64),
+        np.array([True, False, True, False]),
+        np.array(['pear', 'apple', 'fig', 'apple']),
+        np.array([3, 1, 2, 10**30], dtype=object),
+    ]
+    for size in [1, 2, 17, 100, 300]:
+        arrays.append(np.array([random_number_generator.choice([np.nan, random_number_generator.random(), 1.0]) for i in range(size)]))
+        arrays.append(np.array([random_number_generator.randrange(-50, 50) for i in range(size)]))
+    return arrays
+
+
+@pytest.mark.parametrize('algorithm_name', list(sorting_algorithms))
+def test_sorting_an_array_matches_np_sort(algorithm_name):
+    for number_array in making_arrays():
+        expected = np.sort(number_array)
+
+        sorted_array = number_array.copy()
+        sorting_algorithms[algorithm_name](sorted_array)
+
+        assert sorted_array.dtype == number_array.dtype
+        assert np.array_equal(sorted_array, expected, equal_nan=number_array.dtype.kind == 'f'), number_array
+
+
+@pytest.mark.parametrize('algorithm_name', ['insertion_sort', 'binary_insertion_sort', 'galloping_insertion_sort'])
+def test_sorting_part_of_an_array_leaves_the_rest(algorithm_name):
+    number_array = np.array([9.0, 8.0, np.nan, 3.0, 1.0, np.nan, 2.0, 0.0, -1.0])
+    expected = number_array.copy()
+    expected[2:7] = np.sort(number_array[2:7])
+
+    sorting_algorithms[algorithm_name](number_array, 2, 6)
+    assert np.array_equal(number_array, expected, equal_nan=True)
+
+
+def test_searching_an_array_matches_searching_a_list():
+    sorted_list = sorted(random.Random(1).randrange(0, 200) for i in range(300))
+    sorted_array = np.array(sorted_list)
+    numbers_to_find = list(range(-5, 210))
+
+    for number_to_find in numbers_to_find:
+        assert (searching_and_sorting_algorithms.linear_search(sorted_array, number_to_find)
+                == searching_and_sorting_algorithms.linear_search(sorted_list, number_to_find))
+
+        expected = -1 if number_to_find not in sorted_list else sorted_list.index(number_to_find)
+        index = searching_and_sorting_algorithms.iterative_binary_search(sorted_array, number_to_find)
+        assert index == expected or (index >= 0 and sorted_list[index] == number_to_find)
+        index = searching_and_sorting_algorithms.recursive_binary_search(sorted_array, number_to_find, 0, len(sorted_array) - 1)
+        assert index == expected or (index >= 0 and sorted_list[index] == number_to_find)
+
+    for match_position in ['leftmost', 'rightmost']:
+        assert (list(searching_and_sorting_algorithms.batch_binary_search(sorted_array, numbers_to_find, match_position))
+                == searching_and_sorting_algorithms.batch_binary_search(sorted_list, numbers_to_find, match_position))
+
+
+def test_iterative_binary_search_of_an_array_takes_an_array_of_numbers():
+    sorted_array = np.array([1, 3, 5, 7, 9])
+    indices = searching_and_sorting_algorithms.iterative_binary_search(sorted_array, np.array([3, 4, 9]))
+    assert list(indices) == [1, -1, 4]
@@ -0,0 +1,77 @@
+#Checks the comparisons, swaps, writes and allocations that 'counting_operations' counts against the numbers worked out by hand for a
+#few algorithms, and that it never changes the list it is given
+
+import pytest
+
+from import_algorithm_file import import_algorithm_file
+from operation_counting import CountedElement, CountingList, OperationCounts, counting_operations
+
+linear_search = import_algorithm_file('1. Linear_Search_(Searching_Algorithm).py').linear_search
+bubble_sort = import_algorithm_file('4. Bubble_Sort_(Sorting_Algorithm).py').bubble_sort
+insertion_sort = import_algorithm_file('6. Insertion_Sort_(Sorting_Algorithm).py').insertion_sort
+merge_sort = import_algorithm_file('8. Merge_Sort_(Sorting_Algorithm).py').merge_sort
+
+
+@pytest.mark.parametrize('size', [1, 2, 10, 50])
+def test_counting_a_bubble_sort_of_a_reverse_sorted_list(size):
+
+    #Every pair of elements is out of order, so every one of the n(n - 1)/2 comparisons is followed by a swap of 2 writes
+    number_list = list(range(size, 0, -1))
+    operation_counts = counting_operations(bubble_sort, number_list)
+
+    assert operation_counts.as_dict() == {'comparisons': size * (size - 1) // 2, 'swaps': size * (size - 1) // 2,
+                                          'writes': size * (size - 1), 'allocations': 0}
+    assert number_list == list(range(size, 0, -1))
+
+
+@pytest.mark.parametrize('size', [1, 2, 10, 50])
+def test_counting_an_insertion_sort_of_a_sorted_list(size):
+
+    #Every element is compared once with the one before it and written back where it was, which is not a swap
+    operation_counts = counting_operations(insertion_sort, list(range(size)))
+
+    assert operation_counts.as_dict() == {'comparisons': size - 1, 'swaps': 0, 'writes': size - 1, 'allocations': 0}
+
+
+def test_counting_a_linear_search():
+    number_list = [5, 3, 8, 1]
+
+    assert counting_operations(linear_search, number_list, 8).comparisons == 3
+    assert counting_operations(linear_search, number_list, 7).comparisons == 4
+
+
+def test_counting_the_copies_of_the_list():
+
+    #The recursive Merge Sort Algorithm slices out 2 halves of every sublist longer than 1 element, so 2(n - 1) copies in all, and
+    #writes every element of every sublist back once per level
+    operation_counts = counting_operations(merge_sort, list(range(8, 0, -1)))
+
+    assert operation_counts.allocations == 2 * (8 - 1)
+    assert operation_counts.writes == 8 * 3
+
+
+def test_counting_a_list_by_hand():
+    operation_counts = OperationCounts()
+    counting_list = CountingList([CountedElement(number, operation_counts) for number in [3, 1, 2]], operation_counts)
+
+    counting_list[0], counting_list[1] = counting_list[1], counting_list[0]
+    assert counting_list.values() == [1, 3, 2]
+    assert (operation_counts.swaps, operation_counts.writes) == (1, 2)
+
+    #2 writes that don't exchange 2 elements are not a swap
+    counting_list[2] = counting_list[0]
+    counting_list[0] = counting_list[1]
+    assert counting_list.values() == [3, 3, 1]
+    assert (operation_counts.swaps, operation_counts.writes) == (1, 4)
+
+    sublist = counting_list[1:]
+    assert isinstance(sublist, CountingList) and sublist.values() == [3, 1]
+    counting_list[:2] = sublist
+    assert counting_list.values() == [3, 1, 1]
+    assert (operation_counts.allocations, operation_counts.writes) == (1, 6)
+
+    #An element compared with another element or with a plain number counts as 1 comparison, on either side of the comparison
+    assert counting_list[0] > counting_list[1]
+    assert 2 < counting_list[0]
+    assert counting_list[1] == 1
+    assert operation_counts.comparisons == 3
@@ -0,0 +1,89 @@
+#Checks that importing the 'searching_and_sorting_algorithms' package loads no algorithm file and never imports NumPy, that every name
+#loads only the algorithm files it needs, and the binary benchmark fixtures
+
+import json
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+import searching_and_sorting_algorithms
+from searching_and_sorting_algorithms import benchmark_fixtures
+
+repository_directory = pathlib.Path(__file__).resolve().parent.parent
+
+
+def test_importing_the_package_lazily():
+
+    #Checked in a fresh interpreter, since the other tests have already loaded the algorithm files and imported NumPy in this one
+    code = ('import json, sys\n'
+            'def loaded_algorithm_files():\n'
+            '    return sorted(name for name in sys.modules if name.endswith(("_sorting_algorithm", "_searching_algorithm")))\n'
+            'import searching_and_sorting_algorithms\n'
+            'loaded_after_the_import = loaded_algorithm_files()\n'
+            'searching_and_sorting_algorithms.tim_sort\n'
+            'loaded_after_tim_sort = loaded_algorithm_files()\n'
+            'for name in searching_and_sorting_algorithms.__all__:\n'
+            '    getattr(searching_and_sorting_algorithms, name)\n'
+            'print(json.dumps({"loaded_after_the_import": loaded_after_the_import, "loaded_after_tim_sort": loaded_after_tim_sort,\n'
+            '                  "loaded_after_every_name": loaded_algorithm_files(), "numpy_imported": "numpy" in sys.modules}))\n')
+    result = subprocess.run([sys.executable, '-c', code], cwd=repository_directory, capture_output=True, text=True, check=True)
+    loaded_modules = json.loads(result.stdout)
+
+    assert loaded_modules['loaded_after_the_import'] == []
+    assert loaded_modules['loaded_after_tim_sort'] == ['insertion_sort_sorting_algorithm', 'merge_sort_sorting_algorithm',
+                                                       'tim_sort_sorting_algorithm']
+    assert len(loaded_modules['loaded_after_every_name']) == len(set(searching_and_sorting_algorithms.algorithm_files.values()))
+    assert loaded_modules['numpy_imported'] is False
+
+
+def test_every_name_of_the_package():
+    for name in searching_and_sorting_algorithms.__all__:
+        value = getattr(searching_and_sorting_algorithms, name)
+
+        #Stored in the package the first time, so it is the same object every time
+        assert vars(searching_and_sorting_algorithms)[name] is value
+        assert getattr(searching_and_sorting_algorithms, name) is value
+
+    assert set(searching_and_sorting_algorithms.__all__) <= set(dir(searching_and_sorting_algorithms))
+
+
+def test_a_name_the_package_does_not_have():
+    with pytest.raises(AttributeError, match="has no attribute 'bogo_sort'"):
+        searching_and_sorting_algorithms.bogo_sort
+
+    with pytest.raises(ImportError):
+        from searching_and_sorting_algorithms import bogo_sort
+
+
+def test_writing_and_loading_a_fixture(tmp_path, monkeypatch):
+    monkeypatch.setattr(benchmark_fixtures, 'fixtures_directory', str(tmp_path))
+    numbers = [5, -2**63, 2**63 - 1, 0, -1]
+
+    benchmark_fixtures.writing_a_fixture('numbers', numbers)
+    assert (tmp_path / 'numbers.bin').read_bytes() == b''.join(number.to_bytes(8, 'little', signed=True) for number in numbers)
+
+    #Every load is a new list, so sorting one never changes the next one
+    loaded_numbers = benchmark_fixtures.loading_a_fixture('numbers')
+    assert loaded_numbers == numbers
+    loaded_numbers.sort()
+    assert benchmark_fixtures.loading_a_fixture('numbers') == numbers
+
+    #Writing a fixture again replaces what was loaded before
+    benchmark_fixtures.writing_a_fixture('numbers', [1, 2, 3])
+    assert benchmark_fixtures.loading_a_fixture('numbers') == [1, 2, 3]
+
+    (tmp_path / 'part_of_a_number.bin').write_bytes(bytes(12))
+    with pytest.raises(ValueError, match='not a whole number of 8 byte numbers'):
+        benchmark_fixtures.loading_a_fixture('part_of_a_number')
+
+    benchmark_fixtures.mapping_a_fixture.cache_clear()
+
+
+def test_the_fixtures_of_the_benchmarks():
+    for file_name in os.listdir(benchmark_fixtures.fixtures_directory):
+        fixture_name, extension = os.path.splitext(file_name)
+        assert extension == '.bin'
+        assert len(benchmark_fixtures.loading_a_fixture(fixture_name)) > 0
@@ -0,0 +1,53 @@
+#Checks the Parallel Merge Sort Algorithm against 'sorted', with the chunks pickled to the worker processes and back, and with the
+#chunks sorted in place in a shared memory block, and the k-way merge of the sorted chunks on its own
+
+import random
+
+import pytest
+
+from import_algorithm_file import import_algorithm_file
+
+parallel_merge_sort_module = import_algorithm_file('11. Parallel_Merge_Sort_(Sorting_Algorithm).py')
+
+size = parallel_merge_sort_module.minimum_size_for_parallel_sorting + 1234
+
+
+def making_a_list(typecode, seed):
+    random_number_generator = random.Random(seed)
+    if typecode == 'd':
+        return [random_number_generator.uniform(-1e9, 1e9) for i in range(size)]
+    return [random_number_generator.randrange(-2**62, 2**62) for i in range(size)]
+
+
+@pytest.mark.parametrize('typecode', ['q', 'd'])
+@pytest.mark.parametrize('use_shared_memory', [False, True])
+@pytest.mark.parametrize('chunk_size', [None, 3000])
+def test_parallel_merge_sort(use_shared_memory, typecode, chunk_size):
+    number_list = making_a_list(typecode, 0)
+    expected_list = sorted(number_list)
+
+    sorted_list = parallel_merge_sort_module.parallel_merge_sort(number_list, number_of_workers=2, chunk_size=chunk_size,
+                                                                 use_shared_memory=use_shared_memory, typecode=typecode)
+
+    assert sorted_list is number_list
+    assert number_list == expected_list
+
+
+@pytest.mark.parametrize('use_shared_memory', [False, True])
+def test_parallel_merge_sort_on_a_short_list(use_shared_memory):
+
+    #A list too short to be worth sending to worker processes is sorted in this process instead
+    number_list = making_a_list('q', 1)[:100]
+    expected_list = sorted(number_list)
+    parallel_merge_sort_module.parallel_merge_sort(number_list, number_of_workers=2, use_shared_memory=use_shared_memory)
+
+    assert number_list == expected_list
+
+
+@pytest.mark.parametrize('number_of_chunks', [1, 2, 3, 5, 8])
+def test_merging_sorted_chunks(number_of_chunks):
+    random_number_generator = random.Random(number_of_chunks)
+    sorted_chunks = [sorted(random_number_generator.randrange(100) for j in range(random_number_generator.randrange(0, 50)))
+                     for i in range(number_of_chunks)]
+
+    assert parallel_merge_sort_module.merging_sorted_chunks(sorted_chunks) == sorted(sum(sorted_chunks, []))
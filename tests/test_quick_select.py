@@ -0,0 +1,131 @@
+#Checks the Quick Select functions against 'sorted' with every partition scheme (and with the median-of-medians fallback), that the
+#selected ranks split the list into smaller or equal and larger or equal elements, and the median, quantiles and partial sort
+
+import math
+import random
+import statistics
+
+import pytest
+
+from import_algorithm_file import import_algorithm_file
+
+quick_select_module = import_algorithm_file('16. Quick_Select_(Searching_Algorithm).py')
+partition_schemes = import_algorithm_file('5. Quick_Sort_(Sorting_Algorithm).py').partition_schemes
+
+
+def making_lists(size, seed):
+    random_number_generator = random.Random(seed)
+    return {
+        'random': [random_number_generator.randrange(-10**6, 10**6) for i in range(size)],
+        'sorted': list(range(size)),
+        'reverse_sorted': list(range(size, 0, -1)),
+        'few_unique': [random_number_generator.randrange(3) for i in range(size)],
+        'organ_pipe': list(range(size // 2)) + list(range(size - size // 2, 0, -1)),
+    }
+
+
+def checking_the_ranks(number_list, original_list, ranks):
+    sorted_list = sorted(original_list)
+    assert sorted(number_list) == sorted_list
+
+    for rank in ranks:
+        assert number_list[rank] == sorted_list[rank]
+        assert max(number_list[:rank], default=number_list[rank]) <= number_list[rank] <= min(number_list[rank:], default=number_list[rank])
+
+
+@pytest.mark.parametrize('partition_scheme', partition_schemes)
+def test_selecting_ranks(partition_scheme):
+    for size in [1, 2, 17, 200, 2000]:
+        for name, original_list in making_lists(size, size).items():
+            random_number_generator = random.Random(size)
+            ranks = [random_number_generator.randrange(size) for i in range(5)]
+
+            number_list = original_list.copy()
+            quick_select_module.selecting_ranks(number_list, ranks, 0, size - 1, partition_scheme)
+            checking_the_ranks(number_list, original_list, ranks)
+
+
+def test_selecting_ranks_of_part_of_a_list():
+    number_list = list(range(100, 0, -1))
+    quick_select_module.selecting_ranks(number_list, [30, 60], 20, 79)
+
+    assert number_list[:20] == list(range(100, 80, -1)) and number_list[80:] == list(range(20, 0, -1))
+    checking_the_ranks(number_list[20:80], list(range(21, 81)), [10, 40])
+
+
+def test_selecting_ranks_with_median_of_medians_pivots(monkeypatch):
+
+    #With no depth budget at all, every partition is made around a median-of-medians pivot
+    pivot_indexes = []
+    median_of_medians_pivot_index = quick_select_module.median_of_medians_pivot_index
+
+    def recording_the_pivot(number_list, start_index_of_list, end_index_of_list):
+        pivot_indexes.append(median_of_medians_pivot_index(number_list, start_index_of_list, end_index_of_list))
+        return pivot_indexes[-1]
+
+    monkeypatch.setattr(quick_select_module, 'median_of_medians_pivot_index', recording_the_pivot)
+    monkeypatch.setattr(quick_select_module.math, 'log2', lambda size: 0)
+
+    for name, original_list in making_lists(3000, 1).items():
+        number_list = original_list.copy()
+        quick_select_module.selecting_ranks(number_list, [0, 1500, 2999], 0, 2999)
+        checking_the_ranks(number_list, original_list, [0, 1500, 2999])
+
+    assert pivot_indexes
+
+
+@pytest.mark.parametrize('partition_scheme', partition_schemes)
+def test_nth_element_and_select(partition_scheme):
+    original_list = making_lists(500, 3)['random']
+
+    for k in [0, 1, 250, 499, -1, -500]:
+        assert quick_select_module.select(original_list, k, partition_scheme) == sorted(original_list)[k]
+
+        number_list = original_list.copy()
+        assert quick_select_module.nth_element(number_list, k, partition_scheme) == sorted(original_list)[k]
+        checking_the_ranks(number_list, original_list, [k % 500])
+
+    for k in [500, -501]:
+        with pytest.raises(IndexError, match='out of range'):
+            quick_select_module.nth_element(original_list, k)
+
+
+def test_median():
+    for size in [1, 2, 3, 100, 101]:
+        for name, number_list in making_lists(size, size).items():
+            original_list = number_list.copy()
+            assert quick_select_module.median(number_list) == statistics.median(number_list)
+            assert number_list == original_list
+
+    with pytest.raises(ValueError, match='empty list'):
+        quick_select_module.median([])
+
+
+def test_quantiles():
+    fractions = [0, 0.01, 0.25, 0.5, 0.75, 0.99, 1, 0.5]
+
+    for size in [1, 2, 10, 1000]:
+        for name, number_list in making_lists(size, size).items():
+            original_list = number_list.copy()
+            sorted_list = sorted(number_list)
+
+            #The smallest element with at least that fraction of the list at or below it
+            expected_quantiles = [sorted_list[max(0, math.ceil(fraction * size) - 1)] for fraction in fractions]
+            assert quick_select_module.quantiles(number_list, fractions) == expected_quantiles
+            assert number_list == original_list
+
+    with pytest.raises(ValueError, match='empty list'):
+        quick_select_module.quantiles([], [0.5])
+    with pytest.raises(ValueError, match='from 0 to 1'):
+        quick_select_module.quantiles([1, 2], [1.5])
+
+
+@pytest.mark.parametrize('partition_scheme', partition_schemes)
+def test_partial_sort(partition_scheme):
+    for k in [-1, 0, 1, 10, 499, 500, 600]:
+        for name, original_list in making_lists(500, k).items():
+            number_list = original_list.copy()
+            quick_select_module.partial_sort(number_list, k, partition_scheme)
+
+            assert sorted(number_list) == sorted(original_list)
+            assert number_list[:max(k, 0)] == sorted(original_list)[:max(k, 0)]
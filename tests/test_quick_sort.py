@@ -0,0 +1,114 @@
+#Checks the Quick Sort and Intro Sort Algorithms with every partition scheme, on the inputs that make a plain recursive Quick Sort
+#Algorithm go O(n^2) (sorted, reverse-sorted and duplicate-heavy lists), and the Heap Sort Algorithm they fall back to
+
+import random
+import sys
+
+import pytest
+
+from import_algorithm_file import import_algorithm_file
+
+quick_sort_module = import_algorithm_file('5. Quick_Sort_(Sorting_Algorithm).py')
+
+
+def making_lists(size, seed):
+    random_number_generator = random.Random(seed)
+    return {
+        'random': [random_number_generator.randrange(-10**6, 10**6) for i in range(size)],
+        'sorted': list(range(size)),
+        'reverse_sorted': list(range(size, 0, -1)),
+        'few_unique': [random_number_generator.randrange(3) for i in range(size)],
+        'all_equal': [7] * size,
+        'organ_pipe': list(range(size // 2)) + list(range(size - size // 2, 0, -1)),
+    }
+
+
+@pytest.mark.parametrize('partition_scheme', quick_sort_module.partition_schemes)
+@pytest.mark.parametrize('algorithm_name', ['quick_sort', 'intro_sort'])
+def test_sorting_with_every_partition_scheme(algorithm_name, partition_scheme):
+    algorithm = getattr(quick_sort_module, algorithm_name)
+
+    for size in [0, 1, 2, 3, 16, 17, 100, 2000]:
+        for distribution, number_list in making_lists(size, size).items():
+            expected = sorted(number_list)
+            algorithm(number_list, 0, len(number_list) - 1, partition_scheme)
+            assert number_list == expected, (size, distribution)
+
+
+@pytest.mark.parametrize('partition_scheme', quick_sort_module.partition_schemes)
+def test_quick_sort_never_recurses(partition_scheme):
+
+    #A plain recursive Quick Sort Algorithm recurses once per element on a sorted list, so with a recursion limit this low it would
+    #raise RecursionError
+    recursion_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(200)
+    try:
+        for distribution, number_list in making_lists(50000, 1).items():
+            expected = sorted(number_list)
+            quick_sort_module.quick_sort(number_list, 0, len(number_list) - 1, partition_scheme)
+            assert number_list == expected, distribution
+    finally:
+        sys.setrecursionlimit(recursion_limit)
+
+
+def test_sorting_part_of_a_list():
+    number_list = [9, 8, 7, 6, 5, 4, 3, 2, 1, 0]
+    quick_sort_module.quick_sort(number_list, 2, 6)
+    assert number_list == [9, 8, 3, 4, 5, 6, 7, 2, 1, 0]
+
+
+def test_intro_sort_falls_back_to_heap_sort(monkeypatch):
+
+    #With no depth budget at all, every sublist larger than the Insertion Sort cutoff is sorted by the Heap Sort Algorithm
+    heap_sorted_sublists = []
+    heap_sort = quick_sort_module.heap_sort
+
+    def recording_the_heap_sort(number_list, start_index_of_list=0, end_index_of_list=None):
+        heap_sorted_sublists.append((start_index_of_list, end_index_of_list))
+        heap_sort(number_list, start_index_of_list, end_index_of_list)
+
+    monkeypatch.setattr(quick_sort_module, 'heap_sort', recording_the_heap_sort)
+    monkeypatch.setattr(quick_sort_module.math, 'log2', lambda size: 0)
+
+    number_list = making_lists(1000, 2)['random']
+    expected = sorted(number_list)
+    quick_sort_module.intro_sort(number_list)
+
+    assert number_list == expected
+    assert heap_sorted_sublists == [(0, 999)]
+
+
+@pytest.mark.parametrize('distribution', list(making_lists(0, 0)))
+def test_heap_sort(distribution):
+    for size in [0, 1, 2, 31, 500]:
+        number_list = making_lists(size, size)[distribution]
+        expected = sorted(number_list)
+        quick_sort_module.heap_sort(number_list)
+        assert number_list == expected
+
+
+@pytest.mark.parametrize('partition_scheme', quick_sort_module.partition_schemes)
+def test_partitioning_leaves_every_key_in_its_sublist(partition_scheme):
+
+    #After one partition, every key outside the sublists still to sort is already where it ends up, and every sublist holds exactly
+    #the keys that end up in it
+    for seed in range(20):
+        for name, number_list in making_lists(50, seed).items():
+            sorted_list = sorted(number_list)
+            quick_sort_module.placing_the_pivots(number_list, 0, len(number_list) - 1, partition_scheme)
+            sublists = quick_sort_module.partitioning_a_list(number_list, 0, len(number_list) - 1, partition_scheme)
+
+            indexes_in_a_sublist = set()
+            for start_index_of_sublist, end_index_of_sublist in sublists:
+                assert sorted(number_list[start_index_of_sublist:end_index_of_sublist + 1]) == \
+                    sorted_list[start_index_of_sublist:end_index_of_sublist + 1]
+                indexes_in_a_sublist.update(range(start_index_of_sublist, end_index_of_sublist + 1))
+
+            for i in set(range(len(number_list))) - indexes_in_a_sublist:
+                assert number_list[i] == sorted_list[i]
+
+
+def test_an_unknown_partition_scheme():
+    for algorithm in [quick_sort_module.quick_sort, quick_sort_module.intro_sort]:
+        with pytest.raises(ValueError, match='Unknown partition scheme'):
+            algorithm(list(range(100, 0, -1)), 0, 99, 'median')
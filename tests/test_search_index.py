@@ -0,0 +1,90 @@
+#Checks that a Search Index gives the same answers as the Linear Search Algorithm, builds its index after the set number of searches,
+#forgets the least recently used answers of its memo first, and throws away its index and memo when the list changes
+
+import random
+
+import pytest
+
+from import_algorithm_file import import_algorithm_file
+
+linear_search_module = import_algorithm_file('1. Linear_Search_(Searching_Algorithm).py')
+SearchIndex = linear_search_module.SearchIndex
+linear_search = linear_search_module.linear_search
+
+
+@pytest.mark.parametrize('build_after_queries', [None, 1, 5])
+def test_search_index_agrees_with_linear_search(build_after_queries):
+    random_number_generator = random.Random(0)
+    numbers_list = [random_number_generator.randrange(50) for i in range(200)]
+    search_index = SearchIndex(numbers_list, build_after_queries, memo_size=8)
+
+    for i in range(500):
+        number_to_find = random_number_generator.randrange(-5, 55)
+        assert search_index.find(number_to_find) == linear_search(numbers_list, number_to_find)
+
+
+def test_the_index_is_built_after_the_set_number_of_searches():
+    numbers_list = [4, 9, 11, 9, 4]
+    search_index = SearchIndex(numbers_list, build_after_queries=3)
+
+    assert [search_index.find(number_to_find) for number_to_find in [9, 11]] == [1, 2]
+    assert search_index.index is None
+
+    assert search_index.find(4) == 0
+    assert search_index.index == {4: 0, 9: 1, 11: 2}
+    assert search_index.find(7) == -1
+    assert search_index.statistics() == {'hits': 1, 'misses': 3, 'rebuilds': 1, 'invalidations': 0}
+
+
+def test_the_memo_forgets_the_least_recently_used_answer_first():
+    numbers_list = list(range(10))
+    search_index = SearchIndex(numbers_list, build_after_queries=None, memo_size=3)
+
+    for number_to_find in [1, 2, 3, 1, 4]:
+        search_index.find(number_to_find)
+
+    #2 was the least recently used answer when 4 was added, since 1 was searched for again after it
+    assert list(search_index.memo) == [3, 1, 4]
+    assert search_index.statistics() == {'hits': 1, 'misses': 4, 'rebuilds': 0, 'invalidations': 0}
+
+    assert search_index.find(2) == 2
+    assert list(search_index.memo) == [1, 4, 2]
+    assert search_index.misses == 5
+    assert search_index.index is None
+
+
+@pytest.mark.parametrize('build_after_queries', [None, 1])
+def test_changing_the_list_throws_away_the_index_and_the_memo(build_after_queries):
+    numbers_list = list(range(100))
+    search_index = SearchIndex(numbers_list, build_after_queries)
+    assert search_index.find(50) == 50
+
+    numbers_list.append(100)
+    assert search_index.find(100) == 100
+    assert search_index.invalidations == 1
+
+    del numbers_list[0]
+    assert search_index.find(50) == 49
+    assert search_index.invalidations == 2
+
+    #The first and last elements are always in the fingerprint
+    numbers_list[0] = 500
+    assert search_index.find(500) == 0
+    numbers_list[-1] = 600
+    assert search_index.find(600) == 99
+    assert search_index.invalidations == 4
+
+
+def test_invalidating_after_changing_an_element_that_is_not_sampled():
+    numbers_list = list(range(100))
+    search_index = SearchIndex(numbers_list)
+    assert search_index.find(3) == 3
+
+    #Element 3 is not one of the elements of the fingerprint, so the change is only seen once 'invalidate' is called
+    numbers_list[3] = -3
+    assert search_index.find(3) == 3
+    search_index.invalidate()
+
+    assert search_index.find(3) == -1
+    assert search_index.find(-3) == 3
+    assert search_index.statistics()['invalidations'] == 1
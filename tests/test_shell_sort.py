@@ -0,0 +1,73 @@
+#Checks the Shell Sort Algorithm against 'sorted' with every gap sequence, and the gaps of every gap sequence against the first terms of
+#the published sequences
+
+import random
+
+import pytest
+
+from import_algorithm_file import import_algorithm_file
+
+shell_sort_module = import_algorithm_file('7. Shell_Sort_(Sorting_Algorithm).py')
+
+#The smallest gaps of every gap sequence (for the 'shell' gap sequence, the gaps of a list of 1000 elements)
+first_gaps_of_every_gap_sequence = {
+    'shell': (1, 3, 7, 15, 31, 62, 125, 250, 500),
+    'knuth': (1, 4, 13, 40, 121),
+    'sedgewick': (1, 8, 23, 77, 281),
+    'tokuda': (1, 4, 9, 20, 46, 103, 233, 525),
+    'ciura': (1, 4, 10, 23, 57, 132, 301, 701),
+    'pratt': (1, 2, 3, 4, 6, 8, 9, 12, 16, 18, 24, 27, 32, 36),
+}
+
+
+def making_lists(size, seed):
+    random_number_generator = random.Random(seed)
+    return {
+        'random': [random_number_generator.randrange(-10**6, 10**6) for i in range(size)],
+        'sorted': list(range(size)),
+        'reverse_sorted': list(range(size, 0, -1)),
+        'few_unique': [random_number_generator.randrange(3) for i in range(size)],
+    }
+
+
+@pytest.mark.parametrize('gap_sequence', shell_sort_module.gap_sequences)
+def test_shell_sort_with_every_gap_sequence(gap_sequence):
+    for size in [0, 1, 2, 10, 100, 1000]:
+        for name, number_list in making_lists(size, size).items():
+            expected_list = sorted(number_list)
+            shell_sort_module.shell_sort(number_list, gap_sequence=gap_sequence)
+            assert number_list == expected_list, name
+
+
+@pytest.mark.parametrize('gap_sequence', shell_sort_module.gap_sequences)
+def test_shell_sort_with_a_key_and_every_gap_sequence(gap_sequence):
+    number_list = making_lists(300, 0)['random']
+    expected_list = sorted(number_list, key=abs, reverse=True)
+    shell_sort_module.shell_sort(number_list, key=abs, reverse=True, gap_sequence=gap_sequence)
+
+    assert number_list == expected_list
+
+
+@pytest.mark.parametrize('gap_sequence', shell_sort_module.gap_sequences)
+def test_gaps_of_every_gap_sequence(gap_sequence):
+    assert tuple(reversed(shell_sort_module.gaps_of_a_gap_sequence(gap_sequence, 1000)))[:len(first_gaps_of_every_gap_sequence[gap_sequence])] \
+        == first_gaps_of_every_gap_sequence[gap_sequence]
+
+    for size in range(0, 3000, 7):
+        gaps = shell_sort_module.gaps_of_a_gap_sequence(gap_sequence, size)
+
+        #Largest first, every gap smaller than the list, and always ending with a gap of 1 (a plain Insertion Sort)
+        if size < 2:
+            assert gaps == ()
+        else:
+            assert list(gaps) == sorted(set(gaps), reverse=True)
+            assert gaps[0] < size and gaps[-1] == 1
+
+
+def test_ciura_gaps_past_the_experimental_ones():
+    assert shell_sort_module.gaps_of_a_gap_sequence('ciura', 10000)[:3] == (8858, 3937, 1750)
+
+
+def test_an_unknown_gap_sequence():
+    with pytest.raises(ValueError, match='Unknown gap sequence'):
+        shell_sort_module.shell_sort([3, 1, 2], gap_sequence='hibbard')
@@ -0,0 +1,49 @@
+#Checks the Sorted Index against 'bisect' for every key in and around the list (including below its smallest and above its largest
+#key), on lists of every size up to a few complete levels of the Eytzinger tree, with and without duplicates
+
+import bisect
+import random
+
+import pytest
+
+from import_algorithm_file import import_algorithm_file
+
+SortedIndex = import_algorithm_file('12. Sorted_Index_(Searching_Algorithm).py').SortedIndex
+
+
+def making_sorted_lists():
+    random_number_generator = random.Random(0)
+    for size in range(0, 70):
+        yield list(range(0, 2 * size, 2))
+        yield sorted(random_number_generator.randrange(size // 3 + 1) for i in range(size))
+
+
+def test_lower_bound_and_upper_bound():
+    for sorted_list in making_sorted_lists():
+        sorted_index = SortedIndex(sorted_list)
+        assert len(sorted_index) == len(sorted_list)
+
+        for key in range(-2, 2 * len(sorted_list) + 2):
+            assert sorted_index.lower_bound(key) == bisect.bisect_left(sorted_list, key)
+            assert sorted_index.upper_bound(key) == bisect.bisect_right(sorted_list, key)
+
+
+def test_find_and_range():
+    for sorted_list in making_sorted_lists():
+        sorted_index = SortedIndex(sorted_list)
+
+        for key in range(-2, 2 * len(sorted_list) + 2):
+            assert sorted_index.find(key) == (sorted_list.index(key) if key in sorted_list else -1)
+            for highest_key in [key - 1, key, key + 3]:
+                assert list(sorted_index.range(key, highest_key)) == \
+                    [i for i, number in enumerate(sorted_list) if key <= number <= highest_key]
+
+
+@pytest.mark.parametrize('typecode, keys', [('q', [-2**63, -1, 0, 2**63 - 1]), ('d', [-1e300, -0.5, 0.0, 0.25, 1e300])])
+def test_the_most_extreme_keys(typecode, keys):
+    sorted_index = SortedIndex(keys, typecode)
+
+    for i, key in enumerate(keys):
+        assert sorted_index.find(key) == i
+        assert sorted_index.lower_bound(key) == i
+        assert sorted_index.upper_bound(key) == i + 1
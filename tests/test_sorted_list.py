@@ -0,0 +1,64 @@
+#Checks that adding values to a Sorted List one at a time ('add') and as a batch ('extend') puts them in the same places, including
+#values that compare equal to elements already in the list but are not the same
+
+import random
+
+import pytest
+
+from import_algorithm_file import import_algorithm_file
+
+sorted_list_module = import_algorithm_file('18. Sorted_List_(Searching_Algorithm).py')
+SortedList = sorted_list_module.SortedList
+
+
+class Record:
+
+    #Compares by its key only, so records with the same key are equal but can still be told apart by their label
+    def __init__(self, key, label):
+        self.key = key
+        self.label = label
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+    def __le__(self, other):
+        return self.key <= other.key
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+    def __repr__(self):
+        return f"Record({self.key!r}, {self.label!r})"
+
+
+def labels_of(sorted_list):
+    return [(record.key, record.label) for record in sorted_list]
+
+
+@pytest.mark.parametrize('sublist_load', [3, 5, 1000])
+def test_extend_places_equal_values_like_add(monkeypatch, sublist_load):
+    monkeypatch.setattr(sorted_list_module, 'sublist_load', sublist_load)
+    random_number_generator = random.Random(sublist_load)
+
+    for size_of_list, size_of_batch, number_of_keys in [(9, 2, 1), (9, 9, 1), (30, 4, 3), (100, 40, 5), (200, 7, 50)]:
+        records = [Record(random_number_generator.randrange(number_of_keys), f'list {i}') for i in range(size_of_list)]
+        batch = [Record(random_number_generator.randrange(number_of_keys), f'batch {i}') for i in range(size_of_batch)]
+
+        added_one_at_a_time = SortedList(records)
+        for record in batch:
+            added_one_at_a_time.add(record)
+
+        added_as_a_batch = SortedList(records)
+        added_as_a_batch.extend(batch)
+
+        assert labels_of(added_as_a_batch) == labels_of(added_one_at_a_time)
+
+
+def test_extend_puts_equal_values_at_the_end_of_their_run(monkeypatch):
+    monkeypatch.setattr(sorted_list_module, 'sublist_load', 3)
+
+    sorted_list = SortedList(Record(0, label) for label in '012345')
+    sorted_list.add(Record(0, 'a'))
+    sorted_list.extend([Record(0, 'b'), Record(0, 'c')])
+
+    assert [record.label for record in sorted_list] == list('012345abc')
@@ -0,0 +1,64 @@
+#Checks that every Sorting Algorithm that takes 'key' and 'reverse' sorts like Python's own 'sorted' with the same arguments, including
+#keeping records with equal keys in the order they were in (stability), with and without 'reverse'
+
+import random
+
+import pytest
+
+from import_algorithm_file import import_algorithm_file
+from sorting_with_a_key import argsort
+
+quick_sort_module = import_algorithm_file('5. Quick_Sort_(Sorting_Algorithm).py')
+
+sorting_algorithms = {
+    'bubble_sort': import_algorithm_file('4. Bubble_Sort_(Sorting_Algorithm).py').bubble_sort,
+    'quick_sort': lambda records, key, reverse: quick_sort_module.quick_sort(records, 0, len(records) - 1, key=key, reverse=reverse),
+    'insertion_sort': import_algorithm_file('6. Insertion_Sort_(Sorting_Algorithm).py').insertion_sort,
+    'shell_sort': import_algorithm_file('7. Shell_Sort_(Sorting_Algorithm).py').shell_sort,
+    'merge_sort': import_algorithm_file('8. Merge_Sort_(Sorting_Algorithm).py').merge_sort,
+    'selection_sort': import_algorithm_file('9. Selection_Sort_(Sorting_Algorithm).py').selection_sort,
+}
+
+#Every partition scheme of the Quick Sort Algorithm is checked too, since they move equal keys around differently
+for partition_scheme in quick_sort_module.partition_schemes:
+    sorting_algorithms[f'quick_sort ({partition_scheme})'] = (
+        lambda records, key, reverse, partition_scheme=partition_scheme:
+            quick_sort_module.quick_sort(records, 0, len(records) - 1, partition_scheme, key=key, reverse=reverse))
+
+
+def making_records(size, number_of_keys, seed):
+
+    #(key, position in the input) records with lots of equal keys, so the position shows whether equal keys kept their order
+    random_number_generator = random.Random(seed)
+    return [(random_number_generator.randrange(number_of_keys), position) for position in range(size)]
+
+
+@pytest.mark.parametrize('reverse', [False, True])
+@pytest.mark.parametrize('algorithm_name', list(sorting_algorithms))
+def test_sorting_with_a_key_is_stable(algorithm_name, reverse):
+    for size, number_of_keys, seed in [(0, 1, 0), (1, 1, 1), (50, 3, 2), (200, 10, 3), (300, 300, 4)]:
+        records = making_records(size, number_of_keys, seed)
+        expected = sorted(records, key=lambda record: record[0], reverse=reverse)
+
+        sorting_algorithms[algorithm_name](records, key=lambda record: record[0], reverse=reverse)
+        assert records == expected
+
+
+@pytest.mark.parametrize('algorithm_name', list(sorting_algorithms))
+def test_sorting_with_reverse_only_matches_sorted(algorithm_name):
+
+    #Without a key the elements themselves are the keys: equal elements are the same, so only the order of the values can be checked
+    random_number_generator = random.Random(5)
+    numbers = [random_number_generator.randrange(20) for i in range(100)]
+    expected = sorted(numbers, reverse=True)
+
+    sorting_algorithms[algorithm_name](numbers, key=None, reverse=True)
+    assert numbers == expected
+
+
+@pytest.mark.parametrize('reverse', [False, True])
+def test_argsort_is_stable(reverse):
+    records = making_records(200, 7, 6)
+    expected = sorted(range(len(records)), key=lambda i: records[i][0], reverse=reverse)
+
+    assert argsort(records, key=lambda record: record[0], reverse=reverse) == expected
@@ -0,0 +1,91 @@
+#Checks the Tim Sort Algorithm against 'sorted' on inputs with natural runs, that it keeps equal keys in their original order, and
+#that its galloping search and galloping merge agree with 'bisect' and a plain merge
+
+import bisect
+import functools
+import random
+
+import pytest
+
+from import_algorithm_file import import_algorithm_file
+
+tim_sort_module = import_algorithm_file('10. Tim_Sort_(Sorting_Algorithm).py')
+
+
+@functools.total_ordering
+class Record:
+
+    #Only 'key' is compared, so records with equal keys can only be told apart by 'position', their index in the unsorted list
+    def __init__(self, key, position):
+        self.key = key
+        self.position = position
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+
+def making_lists(size, seed):
+    random_number_generator = random.Random(seed)
+    return {
+        'random': [random_number_generator.randrange(-10**6, 10**6) for i in range(size)],
+        'sorted': list(range(size)),
+        'reverse_sorted': list(range(size, 0, -1)),
+        'few_unique': [random_number_generator.randrange(3) for i in range(size)],
+        'sorted_with_a_few_swaps': [i if random_number_generator.random() > 0.01 else -i for i in range(size)],
+        'ascending_and_descending_runs': [i if (i // 100) % 2 else -i for i in range(size)],
+        'two_interleaved_blocks': sorted(range(0, size, 2)) + list(range(1, size, 2)),
+    }
+
+
+@pytest.mark.parametrize('size', [0, 1, 2, 63, 64, 65, 1000, 5000])
+def test_tim_sort(size):
+    for name, number_list in making_lists(size, size).items():
+        expected_list = sorted(number_list)
+        assert tim_sort_module.tim_sort(number_list) is number_list
+        assert number_list == expected_list, name
+
+
+@pytest.mark.parametrize('size', [10, 100, 5000])
+def test_tim_sort_is_stable(size):
+    for name, number_list in making_lists(size, size).items():
+
+        #Few distinct keys, so there are many equal keys, including in the descending runs that are reversed in place
+        records = [Record(number % 5 if name != 'reverse_sorted' else number // 50, position) for position, number in enumerate(number_list)]
+        tim_sort_module.tim_sort(records)
+
+        assert [(record.key, record.position) for record in records] == \
+            sorted((record.key, record.position) for record in records), name
+
+
+@pytest.mark.parametrize('rightmost', [False, True])
+def test_galloping_search_agrees_with_bisect(rightmost):
+    random_number_generator = random.Random(0)
+    bisecting = bisect.bisect_right if rightmost else bisect.bisect_left
+
+    for i in range(2000):
+        number_list = sorted(random_number_generator.randrange(50) for j in range(random_number_generator.randrange(1, 100)))
+        start_index = random_number_generator.randrange(len(number_list))
+        end_index = random_number_generator.randrange(start_index, len(number_list) + 1)
+        key = random_number_generator.randrange(-1, 51)
+
+        assert tim_sort_module.galloping_search(number_list, key, start_index, end_index, rightmost) == \
+            bisecting(number_list, key, start_index, end_index)
+
+
+def test_merging_two_runs_with_galloping():
+
+    #Long blocks taken from one run at a time make galloping pay off, so it gets easier to enter (the minimum gallop goes down), and
+    #one element at a time from each run in turn never gets to gallop (the minimum gallop stays the same)
+    number_list = list(range(0, 100)) + list(range(1000, 2000)) + list(range(3000, 4000)) + \
+        list(range(100, 1000)) + list(range(2000, 3000))
+    current_minimum_gallop = tim_sort_module.merging_two_runs_with_galloping(number_list, 0, 2100, 4000, tim_sort_module.minimum_gallop)
+    assert current_minimum_gallop < tim_sort_module.minimum_gallop
+    assert number_list == list(range(4000))
+
+    number_list = list(range(0, 200, 2)) + list(range(1, 200, 2))
+    current_minimum_gallop = tim_sort_module.merging_two_runs_with_galloping(number_list, 0, 100, 200, tim_sort_module.minimum_gallop)
+    assert current_minimum_gallop == tim_sort_module.minimum_gallop
+    assert number_list == list(range(200))
@@ -0,0 +1,83 @@
+#Checks that the time_it decorator times only the outermost call of a recursive function (including after a call raises), that the
+#timing collector reports what it recorded, and that TIME_IT=0 gives back the decorated functions unchanged
+
+import json
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+import time_it
+
+repository_directory = pathlib.Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(autouse=True)
+def resetting_the_timing_collector():
+    time_it.timing_collector.reset()
+    yield
+    time_it.timing_collector.reset()
+
+
+@time_it.time_it
+def counting_down(number):
+    if number < 0:
+        raise ValueError("Counted down too far")
+    if number == 0:
+        return 0
+    return 1 + counting_down(number - 1)
+
+
+def test_only_the_outermost_call_is_timed():
+    for number in [0, 1, 50, 200]:
+        assert counting_down(number) == number
+
+    assert list(time_it.timing_collector.timings) == ['counting_down']
+    assert len(time_it.timing_collector.timings['counting_down']) == 4
+
+
+def test_a_call_that_raises_is_timed_and_the_next_call_is_timed_too():
+    with pytest.raises(ValueError):
+        counting_down(-1)
+    assert counting_down(10) == 10
+
+    assert len(time_it.timing_collector.timings['counting_down']) == 2
+
+
+def test_the_decorated_function_keeps_its_name():
+    assert counting_down.__name__ == 'counting_down'
+
+
+def test_the_timing_collector_report():
+    for elapsed_nanoseconds in [5_000_000, 1_000_000, 3_000_000, 2_000_000, 4_000_000]:
+        time_it.timing_collector.record('quick_sort', elapsed_nanoseconds)
+    with time_it.timing_collector.timing('a block'):
+        pass
+
+    assert time_it.timing_collector.statistics()['quick_sort'] == {
+        'count': 5, 'min_ms': 1.0, 'median_ms': 3.0, 'p95_ms': 5.0, 'total_ms': 15.0,
+    }
+    assert json.loads(time_it.timing_collector.report('json'))['a block']['count'] == 1
+    assert time_it.timing_collector.report('csv').splitlines()[:2] == ['function,count,min_ms,median_ms,p95_ms,total_ms',
+                                                                     'quick_sort,5,1.0,3.0,5.0,15.0']
+    assert time_it.timing_collector.report('table').splitlines()[2].split() == ['quick_sort', '5', '1.000', '3.000', '5.000', '15.000']
+
+    with pytest.raises(ValueError, match='Unknown output format'):
+        time_it.timing_collector.report('xml')
+
+
+@pytest.mark.parametrize('time_it_setting, expected_output', [('0', 'True {}'), ('1', "False {'function': 1}")])
+def test_turning_the_instrumentation_off(time_it_setting, expected_output):
+
+    #The TIME_IT environment variable is read once when the 'time_it' file is imported, so it is checked in a fresh interpreter
+    code = ('import time_it\n'
+            'def function(): pass\n'
+            'decorated_function = time_it.time_it(function)\n'
+            'decorated_function()\n'
+            'print(decorated_function is function, {name: len(timings) for name, timings in time_it.timing_collector.timings.items()})\n')
+    result = subprocess.run([sys.executable, '-c', code], cwd=repository_directory, env={**os.environ, 'TIME_IT': time_it_setting},
+                            capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == expected_output
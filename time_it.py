@@ -1,15 +1,118 @@
-#This time_it decorator is used in the 'comparing_the_time_complexity_of_the_searching_algorithms_and_searching_pythonically.py' and the
-#'comparing_the_time_complexity_of_the_sorting_algorithms_and_sorting_pythonically.py' files
-
-import time
-
-def time_it(function):
-
-    def wrapper(*args, **kwargs):
-        start_time = time.time()
-        result = function(*args, **kwargs)
-        end_time = time.time()
-        print(function.__name__ + " took " + str((end_time - start_time) * 1000) + " milliseconds")
-        return result
-    
-    return wrapper
+#This time_it decorator is used in the 'comparing_the_time_complexity_of_the_searching_algorithms_and_searching_pythonically.py' and the
+#'comparing_the_time_complexity_of_the_sorting_algorithms_and_sorting_pythonically.py' files
+
+#Every call of a decorated function is timed with 'time.perf_counter_ns' and recorded into the 'timing_collector', instead of being
+#printed. Only the outermost call of a recursive function is timed (e.g. one Quick Sort instead of one timing per recursive call), so
+#the recursive Searching and Sorting Algorithms can be decorated too. 'timing_collector.report()' gives back the count, min, median,
+#95th percentile and total time of every function as a table, as JSON or as CSV
+
+#Set the TIME_IT environment variable to 0 to turn this off: functions decorated while it is off are given back unchanged, so they run
+#with no overhead at all
+
+import contextlib
+import csv
+import functools
+import io
+import json
+import os
+import time
+
+instrumentation_enabled = os.environ.get('TIME_IT', '1') != '0'
+
+
+class TimingCollector:
+
+    def __init__(self):
+        #Function name -> list of the elapsed times of its calls, in nanoseconds
+        self.timings = {}
+
+    def record(self, function_name, elapsed_nanoseconds):
+        self.timings.setdefault(function_name, []).append(elapsed_nanoseconds)
+
+    def reset(self):
+        self.timings = {}
+
+    @contextlib.contextmanager
+    def timing(self, name):
+        #Times a block of code under the given name, e.g. 'with timing_collector.timing("quick_sort (lomuto)"):'
+        start_time = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter_ns() - start_time)
+
+    def statistics(self):
+
+        statistics_of_every_function = {}
+
+        for function_name, elapsed_nanoseconds in self.timings.items():
+            sorted_elapsed_nanoseconds = sorted(elapsed_nanoseconds)
+            count = len(sorted_elapsed_nanoseconds)
+
+            #The median and the 95th percentile are picked by nearest rank, so they are always times that were actually measured
+            statistics_of_every_function[function_name] = {
+                'count': count,
+                'min_ms': sorted_elapsed_nanoseconds[0] / 1e6,
+                'median_ms': sorted_elapsed_nanoseconds[(count - 1) // 2] / 1e6,
+                'p95_ms': sorted_elapsed_nanoseconds[-(-95 * count // 100) - 1] / 1e6,
+                'total_ms': sum(sorted_elapsed_nanoseconds) / 1e6,
+            }
+
+        return statistics_of_every_function
+
+    def report(self, output_format='table'):
+
+        statistics_of_every_function = self.statistics()
+        columns = ['count', 'min_ms', 'median_ms', 'p95_ms', 'total_ms']
+
+        if output_format == 'json':
+            return json.dumps(statistics_of_every_function, indent=4)
+
+        if output_format == 'csv':
+            output = io.StringIO()
+            writer = csv.writer(output, lineterminator='\n')
+            writer.writerow(['function'] + columns)
+            for function_name, statistics in statistics_of_every_function.items():
+                writer.writerow([function_name] + [statistics[column] for column in columns])
+            return output.getvalue()
+
+        if output_format == 'table':
+            rows = [['function'] + columns]
+            for function_name, statistics in statistics_of_every_function.items():
+                rows.append([function_name, str(statistics['count'])] + [f"{statistics[column]:.3f}" for column in columns[1:]])
+
+            column_widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+            lines = ['  '.join(cell.ljust(column_widths[0]) if i == 0 else cell.rjust(column_widths[i]) for i, cell in enumerate(row)) for row in rows]
+            lines.insert(1, '-' * len(lines[0]))
+            return '\n'.join(lines)
+
+        raise ValueError(f"Unknown output format {output_format!r}, expected 'table', 'json' or 'csv'")
+
+
+timing_collector = TimingCollector()
+
+
+def time_it(function):
+
+    if not instrumentation_enabled:
+        return function
+
+    #How many calls of this function are currently running, so the recursive calls inside the outermost call are not timed again
+    depth_of_calls = 0
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        nonlocal depth_of_calls
+
+        if depth_of_calls:
+            return function(*args, **kwargs)
+
+        depth_of_calls += 1
+        start_time = time.perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            timing_collector.record(function.__name__, time.perf_counter_ns() - start_time)
+            depth_of_calls -= 1
+
+    return wrapper